@@ -6,12 +6,15 @@ import numpy as np
 
 from manim import MovingCameraScene
 from manim import Create, Uncreate, Write
-from manim import Axes, VGroup, FadeIn, FadeOut, FunctionGraph, Line, Polygon
-from manim import Text, Tex, Transform
+from manim import Axes, VGroup, FadeIn, FadeOut, Line, Polygon
+from manim import Tex, Transform
 from manim import NumberPlane, always_redraw
 
-from manim import config
-from manim import LEFT, RIGHT, DOWN, LIGHT, UP, BLUE, GREEN
+from manim import LEFT, DOWN, UP, BLUE, GREEN
+
+from chillmaths.assets import demonstration, logo, watermark
+from chillmaths.formats import render_profile
+from chillmaths.sampling import AdaptiveGraph
 
 # COLORS
 # BLUE = "#B0E1FA"
@@ -24,26 +27,14 @@ BLACK = "#000000"
 GREY = "#D0D0D0"
 WHITE = "#F4EDDE"
 
-# Make it vertical
-SCALE_FACTOR = 1
-# Flip width => height, height => width
-tmp_pixel_height = config.pixel_height
-config.pixel_height = config.pixel_width
-config.pixel_width = tmp_pixel_height
-# Change coord system dimensions
-config.frame_height = config.frame_height / SCALE_FACTOR
-config.frame_width = config.frame_height * 9 / 16
-
 
+@render_profile("vertical")
 class Series(MovingCameraScene):
     def construct(self):
         self.camera.background_color = WHITE
         self.camera.frame.save_state()
 
-        txt_copy = Text(
-            r"@chill.maths", font_size=12,
-            font="CMU Typewriter Text", weight=LIGHT, color=BLACK
-        ).to_edge(RIGHT + DOWN, buff=0.1)
+        txt_copy = watermark()
         self.add(txt_copy)
 
         # Introduction text
@@ -53,11 +44,7 @@ class Series(MovingCameraScene):
         ]
         txt_title = VGroup(*txt_title).arrange(DOWN).move_to([0, 2, 0])
 
-        txt = [
-            Tex(r"Démonstration", font_size=36, color=BLACK),
-            Tex(r"Thomas P. Dence", font_size=28, color=BLACK)
-        ]
-        txt = VGroup(*txt).arrange(DOWN)
+        txt = demonstration(r"Thomas P. Dence")
 
 
         self.add(
@@ -85,9 +72,10 @@ class Series(MovingCameraScene):
             }
         ).scale(0.5).move_to([0, 0, 0])
 
-        graph = ax.plot(
+        graph = AdaptiveGraph(
             lambda x: x / np.log(x),
-            x_range=[1.5, 7],
+            (1.5, 7),
+            axes=ax,
             use_smoothing=False,
             color=BLACK
         )
@@ -101,9 +89,10 @@ class Series(MovingCameraScene):
             Create(graph)
         )
 
-        graph_xy = ax.plot(
+        graph_xy = AdaptiveGraph(
             lambda x: x,
-            x_range=[0, 7],
+            (0, 7),
+            axes=ax,
             use_smoothing=False,
             color=GREY
         )
@@ -225,16 +214,7 @@ class Series(MovingCameraScene):
 
         self.play(Write(ref))
 
-        text = Text(
-            "chill.maths", font="CMU Typewriter Text", weight=LIGHT, color=BLACK
-        )
-        # Ajouter un élément mathématique, par exemple une sinusoïde
-        sine_wave = FunctionGraph(
-            lambda x: 0.1 * np.sin(2 * np.pi * x),
-            x_range=[-3, 3],
-            color=BLACK
-        )
-        sine_wave.next_to(text, DOWN, buff=0.2)
+        text, sine_wave = logo()
         
         self.play(
             FadeIn(text, scale=0.5),
@@ -2,15 +2,15 @@
 Visual proof of 1 + 2r +3r^2 + ... = (1 / (1 - r))^2.
 Proofs without Words I. Roger B. Nelsen. p. 125.
 """
-import numpy as np
-
 from manim import MovingCameraScene
 from manim import Create, Uncreate, Write
-from manim import Brace, VGroup, FadeIn, FadeOut, FunctionGraph, Rotate
-from manim import Text, Tex, Rectangle, RoundedRectangle, Transform
+from manim import Brace, VGroup, FadeIn, FadeOut, Rotate
+from manim import Tex, Rectangle, RoundedRectangle, Transform
+
+from manim import LEFT, RIGHT, DOWN, UP, PI
 
-from manim import config
-from manim import LEFT, RIGHT, DOWN, LIGHT, UP, PI
+from chillmaths.assets import demonstration, logo, watermark
+from chillmaths.formats import render_profile
 
 # COLORS
 BLUE = "#B0E1FA"
@@ -22,26 +22,14 @@ ORANGE = "#F6CCB0"
 BLACK = "#000000"
 WHITE = "#F4EDDE"
 
-# Make it vertical
-SCALE_FACTOR = 1
-# Flip width => height, height => width
-tmp_pixel_height = config.pixel_height
-config.pixel_height = config.pixel_width
-config.pixel_width = tmp_pixel_height
-# Change coord system dimensions
-config.frame_height = config.frame_height / SCALE_FACTOR
-config.frame_width = config.frame_height * 9 / 16
-
 
+@render_profile("vertical")
 class Sums(MovingCameraScene):
     def construct(self):
         self.camera.background_color = WHITE
         self.camera.frame.save_state()
 
-        txt_copy = Text(
-            r"@chill.maths", font_size=12,
-            font="CMU Typewriter Text", weight=LIGHT, color=BLACK
-        ).to_edge(RIGHT + DOWN, buff=0.1)
+        txt_copy = watermark()
         self.add(txt_copy)
 
         # Introduction text
@@ -51,11 +39,7 @@ class Sums(MovingCameraScene):
         ]
         txt_title = VGroup(*txt_title).arrange(DOWN).move_to([0, 2, 0])
 
-        txt = [
-            Tex(r"Démonstration", font_size=36, color=BLACK),
-            Tex(r"Roger B. Nelsen", font_size=28, color=BLACK),
-        ]
-        txt = VGroup(*txt).arrange(DOWN)
+        txt = demonstration(r"Roger B. Nelsen")
 
         results = [
             Tex(r"$\sum_{k = 1}^\infty k \times r^{k - 1} = \frac{1}{(1 - r)^2}$",
@@ -334,16 +318,7 @@ class Sums(MovingCameraScene):
 
         self.play(Write(ref))
 
-        text = Text(
-            "chill.maths", font="CMU Typewriter Text", weight=LIGHT, color=BLACK
-        )
-        # Ajouter un élément mathématique, par exemple une sinusoïde
-        sine_wave = FunctionGraph(
-            lambda x: 0.1 * np.sin(2 * np.pi * x),
-            x_range=[-3, 3],
-            color=BLACK
-        )
-        sine_wave.next_to(text, DOWN, buff=0.2)
+        text, sine_wave = logo()
         
         self.play(
             FadeIn(text, scale=0.5),
@@ -2,17 +2,16 @@
 Visual proof of the characteristic polynomials of AB and BA are equal.
 Proofs without Words I. Roger B. Nelsen. p. 135.
 """
-import numpy as np
-
 from manim import MovingCameraScene
 from manim import Dot, RoundedRectangle, Polygon, RightAngle, Line, Arc
 from manim import Create, Uncreate, Write
-from manim import VGroup, Transform, FadeIn, FadeOut, FunctionGraph
-from manim import Text, Tex
+from manim import VGroup, Transform, FadeIn, FadeOut
+from manim import Tex
 
-from manim import config
+from manim import LEFT, DOWN, UP, PI
 
-from manim import LEFT, RIGHT, DOWN, LIGHT, UP, PI
+from chillmaths.assets import demonstration, logo, watermark
+from chillmaths.formats import render_profile
 
 # COLORS
 BLUE = "#B0E1FA"
@@ -24,25 +23,14 @@ ORANGE = "#F6CCB0"
 BLACK = "#000000"
 WHITE = "#F4EDDE"
 
-# Make it vertical
-SCALE_FACTOR = 1
-# Flip width => height, height => width
-tmp_pixel_height = config.pixel_height
-config.pixel_height = config.pixel_width
-config.pixel_width = tmp_pixel_height
-# Change coord system dimensions
-config.frame_height = config.frame_height / SCALE_FACTOR
-config.frame_width = config.frame_height * 9 / 16
 
+@render_profile("vertical")
 class Proof(MovingCameraScene):
     def construct(self):
         self.camera.background_color = WHITE
         self.camera.frame.save_state()
 
-        txt_copy = Text(
-            r"@chill.maths", font_size=12,
-            font="CMU Typewriter Text", weight=LIGHT, color=BLACK
-        ).to_edge(RIGHT + DOWN, buff=0.1)
+        txt_copy = watermark()
         self.add(txt_copy)
 
 
@@ -55,11 +43,7 @@ class Proof(MovingCameraScene):
         ]
         txt_title = VGroup(*txt_title).arrange(DOWN).move_to([0, 2, 0])
 
-        txt = [
-            Tex(r"Démonstration", font_size=36, color=BLACK),
-            Tex(r"Sidney H. Kung", font_size=28, color=BLACK)
-        ]
-        txt = VGroup(*txt).arrange(DOWN)
+        txt = demonstration(r"Sidney H. Kung")
 
         self.add(
             txt_title,
@@ -148,16 +132,7 @@ class Proof(MovingCameraScene):
 
         self.play(Write(ref))
 
-        text = Text(
-            "chill.maths", font="CMU Typewriter Text", weight=LIGHT, color=BLACK
-        )
-        # Ajouter un élément mathématique, par exemple une sinusoïde
-        sine_wave = FunctionGraph(
-            lambda x: 0.1 * np.sin(2 * np.pi * x),
-            x_range=[-3, 3],
-            color=BLACK
-        )
-        sine_wave.next_to(text, DOWN, buff=0.2)
+        text, sine_wave = logo()
         
         self.play(
             FadeIn(text, scale=0.5),
@@ -2,17 +2,17 @@
 Visual proof of the sine of the sum formula
 Proofs without Words I. Roger B. Nelsen. p. 29.
 """
-import numpy as np
-
 from manim import MovingCameraScene
 from manim import Create, Uncreate, Write, Transform, TransformFromCopy
-from manim import VGroup, FadeIn, FadeOut , FunctionGraph, Rotate
+from manim import VGroup, FadeIn, FadeOut, Rotate
 from manim import Line, Point, Polygon, RoundedRectangle, Circle, Angle
 from manim import line_intersection, DashedLine, RightAngle
-from manim import Text, Tex, Intersection
+from manim import Tex, Intersection
+
+from manim import ORIGIN, LEFT, DOWN, UP, PI, DEGREES
 
-from manim import config
-from manim import ORIGIN, LEFT, RIGHT, DOWN, LIGHT, UP, PI, DEGREES
+from chillmaths.assets import demonstration, logo, watermark
+from chillmaths.formats import render_profile
 
 # COLORS
 BLUE = "#B0E1FA"
@@ -24,16 +24,6 @@ ORANGE = "#F6CCB0"
 BLACK = "#000000"
 WHITE = "#F4EDDE"
 
-# Make it vertical
-SCALE_FACTOR = 1
-# Flip width => height, height => width
-tmp_pixel_height = config.pixel_height
-config.pixel_height = config.pixel_width
-config.pixel_width = tmp_pixel_height
-# Change coord system dimensions
-config.frame_height = config.frame_height / SCALE_FACTOR
-config.frame_width = config.frame_height * 9 / 16
-
 
 def get_vertices(obj: Polygon) -> list[Line]:
     vertices = obj.get_vertices()
@@ -48,15 +38,13 @@ def get_vertices(obj: Polygon) -> list[Line]:
     return coords_vertices
 
 
+@render_profile("vertical")
 class Sum(MovingCameraScene):
     def construct(self):
         self.camera.background_color = WHITE
         self.camera.frame.save_state()
 
-        txt_copy = Text(
-            r"@chill.maths", font_size=12,
-            font="CMU Typewriter Text", weight=LIGHT, color=BLACK
-        ).to_edge(RIGHT + DOWN, buff=0.1)
+        txt_copy = watermark()
         self.add(txt_copy)
 
         # Introduction text
@@ -67,11 +55,7 @@ class Sum(MovingCameraScene):
         ]
         txt_title = VGroup(*txt_title).arrange(DOWN).move_to([0, 2, 0])
 
-        txt = [
-            Tex(r"Démonstration", font_size=36, color=BLACK),
-            Tex(r"Sidney H. Kung", font_size=28, color=BLACK)
-        ]
-        txt = VGroup(*txt).arrange(DOWN)
+        txt = demonstration(r"Sidney H. Kung")
 
         self.add(
             txt_title,
@@ -377,16 +361,7 @@ class Sum(MovingCameraScene):
         
         self.play(Write(ref))
 
-        text = Text(
-            "chill.maths", font="CMU Typewriter Text", weight=LIGHT, color=BLACK
-        )
-        # Ajouter un élément mathématique, par exemple une sinusoïde
-        sine_wave = FunctionGraph(
-            lambda x: 0.1 * np.sin(2 * np.pi * x),
-            x_range=[-3, 3],
-            color=BLACK
-        )
-        sine_wave.next_to(text, DOWN, buff=0.2)
+        text, sine_wave = logo()
         
         self.play(
             FadeIn(text, scale=0.5),
@@ -6,12 +6,16 @@ import numpy as np
 
 from manim import MovingCameraScene
 from manim import Create, Uncreate, Write
-from manim import Axes, VGroup, FadeIn, FadeOut, FunctionGraph, Angle, Arc
-from manim import Text, Tex, Polygon, Rectangle, Line, RightAngle, Dot
+from manim import Axes, VGroup, FadeIn, FadeOut, Angle, Arc
+from manim import Tex, Polygon, Rectangle, Line, RightAngle
 from manim import TransformFromCopy, Transform
 
 from manim import config
-from manim import LEFT, RIGHT, DOWN, LIGHT, UP, PI
+from manim import LEFT, DOWN, UP, PI
+
+from chillmaths.assets import demonstration, logo, watermark
+from chillmaths.formats import render_profile
+from chillmaths.stipple import Stipple
 
 # COLORS
 BLUE = "#B0E1FA"
@@ -24,26 +28,14 @@ BLACK = "#000000"
 GREY = "#D3D3D3"
 WHITE = "#F4EDDE"
 
-# Make it vertical
-SCALE_FACTOR = 1
-# Flip width => height, height => width
-tmp_pixel_height = config.pixel_height
-config.pixel_height = config.pixel_width
-config.pixel_width = tmp_pixel_height
-# Change coord system dimensions
-config.frame_height = config.frame_height / SCALE_FACTOR
-config.frame_width = config.frame_height * 9 / 16
-
 
+@render_profile("vertical")
 class Arctangent(MovingCameraScene):
     def construct(self):
         self.camera.background_color = WHITE
         self.camera.frame.save_state()
 
-        txt_copy = Text(
-            r"@chill.maths", font_size=12,
-            font="CMU Typewriter Text", weight=LIGHT, color=BLACK
-        ).to_edge(RIGHT + DOWN, buff=0.1)
+        txt_copy = watermark()
         self.add(txt_copy)
 
         # Introduction text
@@ -54,11 +46,7 @@ class Arctangent(MovingCameraScene):
         ]
         txt_title = VGroup(*txt_title).arrange(DOWN).move_to([0, 2, 0])
 
-        txt = [
-            Tex(r"Démonstration", font_size=36, color=BLACK),
-            Tex(r"Edward M. Harris", font_size=28, color=BLACK)
-        ]
-        txt = VGroup(*txt).arrange(DOWN)
+        txt = demonstration(r"Edward M. Harris")
 
 
         self.add(
@@ -134,37 +122,15 @@ class Arctangent(MovingCameraScene):
             fill_opacity=0.5
         )
 
-        def is_inside_shaded(x, y):
-            inside = False
-            vertices = shaded_vertices
-            j = len(vertices) - 1
-            for i in range(len(vertices)):
-                xi, yi = vertices[i]
-                xj, yj = vertices[j]
-                crosses = (yi > y) != (yj > y)
-                if crosses:
-                    x_intersection = (xj - xi) * (y - yi) / (yj - yi) + xi
-                    if x < x_intersection:
-                        inside = not inside
-                j = i
-            return inside
-
-        stipple = VGroup()
-        row = 0
-        for y in np.arange(0.08, 6, 0.13):
-            x_start = 0.08 + 0.06 * (row % 2)
-            for x in np.arange(x_start, 6, 0.13):
-                if is_inside_shaded(x, y):
-                    stipple.add(
-                        Dot(
-                            p(x, y),
-                            radius=0.007,
-                            color=BLACK,
-                            fill_opacity=0.42,
-                            stroke_width=0
-                        )
-                    )
-            row += 1
+        stipple = Stipple(
+            shaded_region.get_vertices(),
+            spacing=0.13 * unit,
+            radius=0.007,
+            stagger=0.06 * unit,
+            anchor=p(0.08, 0.08),
+            color=BLACK,
+            fill_opacity=0.42
+        )
 
         main_diagonal = Line(
             p(0, 0), p(6, 6),
@@ -246,16 +212,7 @@ class Arctangent(MovingCameraScene):
 
         self.play(Write(ref))
 
-        text = Text(
-            "chill.maths", font="CMU Typewriter Text", weight=LIGHT, color=BLACK
-        )
-        # Ajouter un élément mathématique, par exemple une sinusoïde
-        sine_wave = FunctionGraph(
-            lambda x: 0.1 * np.sin(2 * np.pi * x),
-            x_range=[-3, 3],
-            color=BLACK
-        )
-        sine_wave.next_to(text, DOWN, buff=0.2)
+        text, sine_wave = logo()
         
         self.play(
             FadeIn(text, scale=0.5),
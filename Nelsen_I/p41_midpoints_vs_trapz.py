@@ -6,11 +6,14 @@ import numpy as np
 
 from manim import MovingCameraScene
 from manim import Create, Uncreate, Write, Transform, Group
-from manim import Axes, VGroup, FadeIn, FadeOut, FunctionGraph, Dot, Line, Polygon
-from manim import Text, Tex, DashedVMobject, DashedLine, RoundedRectangle
+from manim import Axes, VGroup, FadeIn, FadeOut, Dot, Line, Polygon
+from manim import Tex, DashedVMobject, DashedLine, RoundedRectangle
 
-from manim import config
-from manim import LEFT, RIGHT, DOWN, LIGHT, UP
+from manim import LEFT, DOWN, UP
+
+from chillmaths.assets import demonstration, logo, watermark
+from chillmaths.formats import render_profile
+from chillmaths.quadrature import RiemannSum
 
 # COLORS
 BLUE = "#B0E1FA"
@@ -22,26 +25,14 @@ ORANGE = "#F6CCB0"
 BLACK = "#000000"
 WHITE = "#F4EDDE"
 
-# Make it vertical
-SCALE_FACTOR = 1
-# Flip width => height, height => width
-tmp_pixel_height = config.pixel_height
-config.pixel_height = config.pixel_width
-config.pixel_width = tmp_pixel_height
-# Change coord system dimensions
-config.frame_height = config.frame_height / SCALE_FACTOR
-config.frame_width = config.frame_height * 9 / 16
-
 
+@render_profile("vertical")
 class Trapz(MovingCameraScene):
     def construct(self):
         self.camera.background_color = WHITE
         self.camera.frame.save_state()
 
-        txt_copy = Text(
-            r"@chill.maths", font_size=12,
-            font="CMU Typewriter Text", weight=LIGHT, color=BLACK
-        ).to_edge(RIGHT + DOWN, buff=0.1)
+        txt_copy = watermark()
         self.add(txt_copy)
 
         # Introduction text
@@ -51,11 +42,7 @@ class Trapz(MovingCameraScene):
         ]
         txt_title = VGroup(*txt_title).arrange(DOWN).move_to([0, 2, 0])
 
-        txt = [
-            Tex(r"Démonstration", font_size=36, color=BLACK),
-            Tex(r"Frank Burk", font_size=28, color=BLACK)
-        ]
-        txt = VGroup(*txt).arrange(DOWN)
+        txt = demonstration(r"Frank Burk")
 
         self.add(
             txt_title,
@@ -138,9 +125,9 @@ class Trapz(MovingCameraScene):
             stroke_width=2
         )
 
-        points = [ax.c2p(0.2, 0), point_a, point_b, ax.c2p(0.7, 0)]
-        region_midpoint = Polygon(
-            *points,
+        region_midpoint = RiemannSum(
+            ax, lambda x: - 9 * (x - 0.5)**2 + 1.5, (0.2, 0.7), 1,
+            rule="midpoint",
             stroke_width=0,
             fill_color=BLUE,
             fill_opacity=0.5
@@ -393,16 +380,7 @@ class Trapz(MovingCameraScene):
 
         self.play(Write(ref))
 
-        text = Text(
-            "chill.maths", font="CMU Typewriter Text", weight=LIGHT, color=BLACK
-        )
-        # Ajouter un élément mathématique, par exemple une sinusoïde
-        sine_wave = FunctionGraph(
-            lambda x: 0.1 * np.sin(2 * np.pi * x),
-            x_range=[-3, 3],
-            color=BLACK
-        )
-        sine_wave.next_to(text, DOWN, buff=0.2)
+        text, sine_wave = logo()
         
         self.play(
             FadeIn(text, scale=0.5),
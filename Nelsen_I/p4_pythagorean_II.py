@@ -2,16 +2,18 @@
 Visual proof of the Pythagorean theorem.
 Proofs without Words I. Roger B. Nelsen. p. 4.
 """
-from manim import MovingCameraScene, Mobject
+from manim import MovingCameraScene
 from manim import Square, Polygon, RoundedRectangle
-from manim import Create, Rotate, Transform, Uncreate, Write
+from manim import Create, Rotate, Uncreate, Write
 from manim import TransformFromCopy, FadeIn, FadeOut
-from manim import VGroup, FunctionGraph
-from manim import Text, Tex
+from manim import VGroup
+from manim import Tex
 
-from manim import config
+from manim import LEFT, RIGHT, UP, DOWN, PI, DEGREES
 
-from manim import LEFT, RIGHT, UP, DOWN, PI, DEGREES, LIGHT
+from chillmaths.assets import logo, watermark
+from chillmaths.formats import render_profile
+from chillmaths.recolor import RotateAndColor
 
 import numpy as np
 
@@ -25,49 +27,14 @@ ORANGE = "#F6CCB0"
 BLACK = "#000000"
 WHITE = "#F4EDDE"
 
-# Make it vertical
-SCALE_FACTOR = 1
-# Flip width => height, height => width
-tmp_pixel_height = config.pixel_height
-config.pixel_height = config.pixel_width
-config.pixel_width = tmp_pixel_height
-# Change coord system dimensions
-config.frame_height = config.frame_height / SCALE_FACTOR
-config.frame_width = config.frame_height * 9 / 16
-
-
-class RotateAndColor(Rotate, Transform):
-    def __init__(
-        self,
-        mobject: Mobject,            
-        angle: float,
-        new_color,
-        **kwargs,
-    ) -> None:
-        self.new_color = new_color
-        super().__init__(mobject, angle=angle, **kwargs)
-
-    def create_target(self) -> Mobject:
-        target = self.mobject.copy()
-        target.set_fill(self.new_color)
-        target.rotate(
-            self.angle,
-            axis=self.axis,
-            about_point=self.about_point,
-            about_edge=self.about_edge,
-        )
-        return target
-
 
+@render_profile("vertical")
 class Pythagorean(MovingCameraScene):
     def construct(self):
         self.camera.background_color = WHITE
         self.camera.frame.save_state()
 
-        txt_copy = Text(
-            r"@chill.maths", font_size=12,
-            font="CMU Typewriter Text", weight=LIGHT, color=BLACK
-        ).to_edge(RIGHT + DOWN, buff=0.1)
+        txt_copy = watermark()
         self.add(txt_copy)
 
         # Introduction text
@@ -322,16 +289,7 @@ class Pythagorean(MovingCameraScene):
 
         self.play(Write(ref))
 
-        text = Text(
-            "chill.maths", font="CMU Typewriter Text", weight=LIGHT, color=BLACK
-        )
-        # Ajouter un élément mathématique, par exemple une sinusoïde
-        sine_wave = FunctionGraph(
-            lambda x: 0.1 * np.sin(2 * np.pi * x),
-            x_range=[-3, 3],
-            color=BLACK
-        )
-        sine_wave.next_to(text, DOWN, buff=0.2)
+        text, sine_wave = logo()
         
         self.play(
             FadeIn(text, scale=0.5),
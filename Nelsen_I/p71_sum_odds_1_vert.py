@@ -7,12 +7,14 @@ import numpy as np
 from manim import MovingCameraScene
 from manim import Dot, BraceBetweenPoints, RoundedRectangle
 from manim import Create, Uncreate, Write
-from manim import VGroup, TransformFromCopy, FadeIn, FadeOut, FunctionGraph
-from manim import Text, Tex
+from manim import VGroup, TransformFromCopy, FadeIn, FadeOut
+from manim import Tex
 
-from manim import config
+from manim import LEFT, RIGHT, DOWN
 
-from manim import LEFT, RIGHT, DOWN, LIGHT
+from chillmaths.assets import demonstration, logo, watermark
+from chillmaths.formats import render_profile
+from chillmaths.glyphs import GlyphLabel
 
 # COLORS
 BLUE = "#B0E1FA"
@@ -24,25 +26,14 @@ ORANGE = "#F6CCB0"
 BLACK = "#000000"
 WHITE = "#F4EDDE"
 
-# Make it vertical
-SCALE_FACTOR = 1
-# Flip width => height, height => width
-tmp_pixel_height = config.pixel_height
-config.pixel_height = config.pixel_width
-config.pixel_width = tmp_pixel_height
-# Change coord system dimensions
-config.frame_height = config.frame_height / SCALE_FACTOR
-config.frame_width = config.frame_height * 9 / 16
 
+@render_profile("vertical")
 class Sums(MovingCameraScene):
     def construct(self):
         self.camera.background_color = WHITE
         self.camera.frame.save_state()
 
-        txt_copy = Text(
-            r"@chill.maths", font_size=12,
-            font="CMU Typewriter Text", weight=LIGHT, color=BLACK
-        ).to_edge(RIGHT + DOWN, buff=0.1)
+        txt_copy = watermark()
         self.add(txt_copy)
 
 
@@ -53,11 +44,9 @@ class Sums(MovingCameraScene):
         ]
         txt_title = VGroup(*txt_title).arrange(DOWN).move_to([0, 2, 0])
 
-        txt = [
-            Tex(r"Démonstration I", font_size=36, color=BLACK),
-            Tex(r"Nicomaque de Gérase (vers 100)", font_size=28, color=BLACK)
-        ]
-        txt = VGroup(*txt).arrange(DOWN)
+        txt = demonstration(
+            r"Nicomaque de Gérase (vers 100)", title=r"Démonstration I"
+        )
 
         txt_formula = Tex(r"$1 + 3 + \cdots + (2n - 1) = n^2$", font_size=28, color=BLACK)\
             .next_to(txt, 2 * DOWN)
@@ -80,7 +69,7 @@ class Sums(MovingCameraScene):
         # self.camera.frame.move_to(points[0]).set(width=20)
 
         dot_1 = Dot([-1, 2.5, 0], color=RED, radius=0.1)
-        txt_1 = Tex(r"$k = 1$", font_size=20, color=BLACK)\
+        txt_1 = GlyphLabel(r"k = 1", font_size=20, color=BLACK, tex=True)\
             .next_to(dot_1, 0.5 * LEFT)
         self.play(
             Create(dot_1),
@@ -91,7 +80,7 @@ class Sums(MovingCameraScene):
             Dot([-1 + 0.25 * i, 2.25, 0], color=BLUE, radius=0.1)
             for i in np.arange(3)
         ]
-        txt_3 = Tex(r"$k = 3$", font_size=20, color=BLACK)\
+        txt_3 = GlyphLabel(r"k = 3", font_size=20, color=BLACK, tex=True)\
             .next_to(dots_3[0], 0.5 * LEFT)
         self.play(
             [Create(dots_3[i]) for i in range(len(dots_3))],
@@ -102,7 +91,7 @@ class Sums(MovingCameraScene):
             Dot([-1 + 0.25 * i, 2, 0], color=RED, radius=0.1)
             for i in np.arange(5)
         ]
-        txt_5 = Tex(r"$k = 5$", font_size=20, color=BLACK)\
+        txt_5 = GlyphLabel(r"k = 5", font_size=20, color=BLACK, tex=True)\
             .next_to(dots_5[0], 0.5 * LEFT)
         self.play(
             [Create(dots_5[i]) for i in range(len(dots_5))],
@@ -113,7 +102,7 @@ class Sums(MovingCameraScene):
             Dot([-1 + 0.25 * i, 1.75, 0], color=BLUE, radius=0.1)
             for i in np.arange(7)
         ]
-        txt_7 = Tex(r"$k = 7$", font_size=20, color=BLACK)\
+        txt_7 = GlyphLabel(r"k = 7", font_size=20, color=BLACK, tex=True)\
             .next_to(dots_7[0], 0.5 * LEFT)
         self.play(
             [Create(dots_7[i]) for i in range(len(dots_7))],
@@ -135,7 +124,7 @@ class Sums(MovingCameraScene):
             Dot([-1 + 0.25 * i, 1.25, 0], color=BLUE, radius=0.1)
             for i in np.arange(11)
         ]
-        txt_11 = Tex(r"$k = 2n - 3$", font_size=20, color=BLACK)\
+        txt_11 = GlyphLabel(r"k = 2n - 3", font_size=20, color=BLACK, tex=True)\
             .next_to(dots_11[0], 0.5 * LEFT)
         self.play(
             [Create(dots_11[i]) for i in range(len(dots_11))],
@@ -146,7 +135,7 @@ class Sums(MovingCameraScene):
             Dot([-1 + 0.25 * i, 1, 0], color=RED, radius=0.1)
             for i in np.arange(13)
         ]
-        txt_13 = Tex(r"$k = 2n - 1$", font_size=20, color=BLACK)\
+        txt_13 = GlyphLabel(r"k = 2n - 1", font_size=20, color=BLACK, tex=True)\
             .next_to(dots_13[0], 0.5 * LEFT)
         self.play(
             [Create(dots_13[i]) for i in range(len(dots_13))],
@@ -306,16 +295,7 @@ class Sums(MovingCameraScene):
 
         self.play(Write(ref))
 
-        text = Text(
-            "chill.maths", font="CMU Typewriter Text", weight=LIGHT, color=BLACK
-        )
-        # Ajouter un élément mathématique, par exemple une sinusoïde
-        sine_wave = FunctionGraph(
-            lambda x: 0.1 * np.sin(2 * np.pi * x),
-            x_range=[-3, 3],
-            color=BLACK
-        )
-        sine_wave.next_to(text, DOWN, buff=0.2)
+        text, sine_wave = logo()
         
         self.play(
             FadeIn(text, scale=0.5),
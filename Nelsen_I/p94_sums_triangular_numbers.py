@@ -7,12 +7,14 @@ import numpy as np
 from manim import ThreeDScene
 from manim import Create, Uncreate, Write
 from manim import LaggedStart, Polygon, Rectangle, VGroup
-from manim import FadeIn, FadeOut, FunctionGraph, Transform
+from manim import FadeIn, FadeOut, Transform
 from manim import MathTable, Brace, RoundedRectangle
-from manim import Arrow, Cube, Line, Text, Tex
+from manim import Arrow, Cube, Line, Tex
 
-from manim import config
-from manim import DEGREES, LEFT, RIGHT, DOWN, LIGHT, UP, PI
+from manim import DEGREES, LEFT, RIGHT, DOWN, UP, PI
+
+from chillmaths.assets import demonstration, logo, watermark
+from chillmaths.formats import render_profile
 
 # COLORS
 BLUE = "#B0E1FA"
@@ -24,25 +26,13 @@ ORANGE = "#F6CCB0"
 BLACK = "#000000"
 WHITE = "#F4EDDE"
 
-# Make it vertical
-SCALE_FACTOR = 1
-# Flip width => height, height => width
-tmp_pixel_height = config.pixel_height
-config.pixel_height = config.pixel_width
-config.pixel_width = tmp_pixel_height
-# Change coord system dimensions
-config.frame_height = config.frame_height / SCALE_FACTOR
-config.frame_width = config.frame_height * 9 / 16
-
 
+@render_profile("vertical")
 class Sums(ThreeDScene):
     def construct(self):
         self.camera.background_color = WHITE
 
-        txt_copy = Text(
-            r"@chill.maths", font_size=12,
-            font="CMU Typewriter Text", weight=LIGHT, color=BLACK
-        ).to_edge(RIGHT + DOWN, buff=0.1)
+        txt_copy = watermark()
         self.add(txt_copy)
         self.add_fixed_in_frame_mobjects(txt_copy)
 
@@ -53,11 +43,7 @@ class Sums(ThreeDScene):
         ]
         txt_title = VGroup(*txt_title).arrange(DOWN).move_to([0, 2, 0])
 
-        txt = [
-            Tex(r"Démonstration", font_size=36, color=BLACK),
-            Tex(r"Monte J. Zerger", font_size=28, color=BLACK)
-        ]
-        txt = VGroup(*txt).arrange(DOWN)
+        txt = demonstration(r"Monte J. Zerger")
 
         results = [
             Tex(r"Si $T_k = 1 + 2 + \cdots + k$,", font_size=24, color=BLACK),
@@ -352,16 +338,7 @@ class Sums(ThreeDScene):
 
         self.play(Write(ref))
 
-        text = Text(
-            "chill.maths", font="CMU Typewriter Text", weight=LIGHT, color=BLACK
-        )
-        # Ajouter un élément mathématique, par exemple une sinusoïde
-        sine_wave = FunctionGraph(
-            lambda x: 0.1 * np.sin(2 * np.pi * x),
-            x_range=[-3, 3],
-            color=BLACK
-        )
-        sine_wave.next_to(text, DOWN, buff=0.2)
+        text, sine_wave = logo()
         
         self.play(
             FadeIn(text, scale=0.5),
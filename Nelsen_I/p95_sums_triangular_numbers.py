@@ -6,12 +6,15 @@ import numpy as np
 
 from manim import ThreeDScene
 from manim import Create, Uncreate, Write
-from manim import VGroup, FadeIn, FadeOut, FunctionGraph, Transform
+from manim import VGroup, FadeIn, FadeOut, FadeTransform, Transform
 from manim import MathTable, Brace, RoundedRectangle
-from manim import Arrow, Cube, Line, Text, Tex
+from manim import Arrow, Line, Tex
 
-from manim import config
-from manim import DEGREES, LEFT, RIGHT, DOWN, LIGHT, UP, PI
+from manim import DEGREES, LEFT, RIGHT, DOWN, UP, PI
+
+from chillmaths.assets import demonstration, logo, watermark
+from chillmaths.formats import render_profile
+from chillmaths.voxels import VoxelSolid
 
 # COLORS
 BLUE = "#B0E1FA"
@@ -23,25 +26,13 @@ ORANGE = "#F6CCB0"
 BLACK = "#000000"
 WHITE = "#F4EDDE"
 
-# Make it vertical
-SCALE_FACTOR = 1
-# Flip width => height, height => width
-tmp_pixel_height = config.pixel_height
-config.pixel_height = config.pixel_width
-config.pixel_width = tmp_pixel_height
-# Change coord system dimensions
-config.frame_height = config.frame_height / SCALE_FACTOR
-config.frame_width = config.frame_height * 9 / 16
-
 
+@render_profile("vertical")
 class Sums(ThreeDScene):
     def construct(self):
         self.camera.background_color = WHITE
 
-        txt_copy = Text(
-            r"@chill.maths", font_size=12,
-            font="CMU Typewriter Text", weight=LIGHT, color=BLACK
-        ).to_edge(RIGHT + DOWN, buff=0.1)
+        txt_copy = watermark()
         self.add(txt_copy)
         self.add_fixed_in_frame_mobjects(txt_copy)
 
@@ -52,11 +43,7 @@ class Sums(ThreeDScene):
         ]
         txt_title = VGroup(*txt_title).arrange(DOWN).move_to([0, 2, 0])
 
-        txt = [
-            Tex(r"Démonstration", font_size=36, color=BLACK),
-            Tex(r"Roger B. Nelsen", font_size=28, color=BLACK)
-        ]
-        txt = VGroup(*txt).arrange(DOWN)
+        txt = demonstration(r"Roger B. Nelsen")
 
         results = [
             Tex(r"Si $T_k = 1 + 2 + \cdots + k$,", font_size=24, color=BLACK),
@@ -85,58 +72,56 @@ class Sums(ThreeDScene):
         )
 
 
-        def cube_at(x, y, z, side):
-            cube = Cube(
-                side_length=side,
-                fill_color="#FFFFFF",
-                fill_opacity=1,
+        face_colors = [
+            "#BEBEBE", "#FFFFFF", "#FFFFFF",
+            "#BEBEBE", "#D8D8D8", "#FFFFFF"
+        ]
+        # The faces of the arrays, built a quarter turn about OUT.
+        rotated_face_colors = [
+            "#BEBEBE", "#FFFFFF", "#D8D8D8",
+            "#FFFFFF", "#BEBEBE", "#FFFFFF"
+        ]
+
+        def triangular_array(n, side):
+            # Columns along y, the cube 1 centred at the origin.
+            return VoxelSolid(
+                [
+                    (0, column, height)
+                    for column in range(n)
+                    for height in range(column + 1)
+                ],
+                side=side,
+                face_colors=rotated_face_colors,
                 stroke_color=BLACK,
                 stroke_width=0.55
             )
-            cube.move_to(np.array([x, y, z]))
-            face_colors = [
-                "#BEBEBE", "#FFFFFF", "#FFFFFF",
-                "#BEBEBE", "#D8D8D8", "#FFFFFF"
-            ]
-            for face, color in zip(cube, face_colors):
-                face.set_fill(color, opacity=1)
-                face.set_stroke(BLACK, width=0.55)
-            return cube
-
-        def triangular_array(n, side):
-            cubes = VGroup()
-            number = 1
-            for column in range(n):
-                for height in range(column + 1):
-                    center = np.array(
-                        [column * side, 0, height * side]
-                    )
-                    cube = cube_at(*center, side)
-                    cubes.add(cube)
-                    number += 1
-            cubes.\
-                move_to(np.array([0, 0, 0])).\
-                rotate(PI / 2, axis=[0, 0, 1])
-            return cubes
 
         def triangular_array_sequence(n, side, spacing):
             arrays = VGroup()
             x_step = side + spacing
             for index, size in enumerate(range(1, n + 1)):
                 array = triangular_array(size, side)
-                cube_one_center = array[0][0].get_center()
+                # Center of the IN face of the cube 1
+                cube_one_center = side * np.array([0, 0, -0.5])
                 target = np.array([index * x_step, 0, 0])
                 array.shift(target - cube_one_center)
                 arrays.add(array)
             arrays.move_to(np.array([0, 0, 0]))
             return arrays
 
-        def cuboid_slab(nx, y_index, nz, side):
-            slab = VGroup()
-            for x in range(nx):
-                for z in range(nz):
-                    slab.add(cube_at(x * side, y_index * side, z * side, side))
-            return slab
+        def cuboid(nx, ny, nz, side):
+            return VoxelSolid(
+                [
+                    (x, y, z)
+                    for x in range(nx)
+                    for y in range(ny)
+                    for z in range(nz)
+                ],
+                side=side,
+                face_colors=face_colors,
+                stroke_color=BLACK,
+                stroke_width=0.55
+            )
 
 
         split = triangular_array_sequence(5, 0.18, 0.2).\
@@ -253,10 +238,7 @@ class Sums(ThreeDScene):
             ),
         )
 
-        combined_no_split = VGroup(*[
-            cuboid_slab(7, y_index, 5, 0.135)
-            for y_index in range(6)
-        ])
+        combined_no_split = cuboid(7, 6, 5, 0.135)
         combined_no_split.move_to(np.array([0, 0, -1.15])).\
             scale(1.5, about_point=combined_no_split.get_center())
 
@@ -367,7 +349,7 @@ class Sums(ThreeDScene):
             FadeOut(no_split_copy_3),
             FadeOut(no_split_copy_4),
             FadeOut(no_split_copy_5),
-            Transform(
+            FadeTransform(
                 no_split_rotations_copy, combined_no_split
             ),
             run_time=1
@@ -425,16 +407,7 @@ class Sums(ThreeDScene):
 
         self.play(Write(ref))
 
-        text = Text(
-            "chill.maths", font="CMU Typewriter Text", weight=LIGHT, color=BLACK
-        )
-        # Ajouter un élément mathématique, par exemple une sinusoïde
-        sine_wave = FunctionGraph(
-            lambda x: 0.1 * np.sin(2 * np.pi * x),
-            x_range=[-3, 3],
-            color=BLACK
-        )
-        sine_wave.next_to(text, DOWN, buff=0.2)
+        text, sine_wave = logo()
         
         self.play(
             FadeIn(text, scale=0.5),
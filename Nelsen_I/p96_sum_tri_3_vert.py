@@ -2,16 +2,17 @@
 Visual proof of the sums of triangular numbers.
 Proofs without Words. Roger B. Nelsen. p. 96.
 """
-import numpy as np
-
 from manim import MovingCameraScene
 from manim import Create, Uncreate, Write
-from manim import VGroup, FadeIn, FadeOut, FunctionGraph, Transform
+from manim import VGroup, FadeIn, FadeOut, Transform
 from manim import MathTable, Brace, RoundedRectangle
-from manim import Text, Tex
+from manim import Tex
+
+from manim import LEFT, DOWN, UP
 
-from manim import config
-from manim import LEFT, RIGHT, DOWN, LIGHT, UP
+from chillmaths.assets import logo, watermark
+from chillmaths.formats import render_profile
+from chillmaths.glyphs import math_entry
 
 # COLORS
 BLUE = "#B0E1FA"
@@ -23,26 +24,14 @@ ORANGE = "#F6CCB0"
 BLACK = "#000000"
 WHITE = "#F4EDDE"
 
-# Make it vertical
-SCALE_FACTOR = 1
-# Flip width => height, height => width
-tmp_pixel_height = config.pixel_height
-config.pixel_height = config.pixel_width
-config.pixel_width = tmp_pixel_height
-# Change coord system dimensions
-config.frame_height = config.frame_height / SCALE_FACTOR
-config.frame_width = config.frame_height * 9 / 16
-
 
+@render_profile("vertical")
 class Sums(MovingCameraScene):
     def construct(self):
         self.camera.background_color = WHITE
         self.camera.frame.save_state()
 
-        txt_copy = Text(
-            r"@chill.maths", font_size=12,
-            font="CMU Typewriter Text", weight=LIGHT, color=BLACK
-        ).to_edge(RIGHT + DOWN, buff=0.1)
+        txt_copy = watermark()
         self.add(txt_copy)
 
         # Introduction text
@@ -88,7 +77,8 @@ class Sums(MovingCameraScene):
                 ["1", "2", "\cdot", "\cdot", "\cdot", "n - 1", ""],
                 ["1", "2", "\cdot", "\cdot", "\cdot", "n - 1", "n"],
             ],
-            h_buff=0.5, v_buff=0.4
+            h_buff=0.5, v_buff=0.4,
+            element_to_mobject=math_entry
         ).scale(0.4)
         table.get_horizontal_lines().set_color(WHITE)
         table.get_vertical_lines().set_color(WHITE)
@@ -135,7 +125,8 @@ class Sums(MovingCameraScene):
                 ["n - 1", "n - 2", "\cdot", "\cdot", "\cdot", "1", ""],
                 ["n", "n - 1", "\cdot", "\cdot", "\cdot", "2", "1"],
             ],
-            h_buff=0.5, v_buff=0.4
+            h_buff=0.5, v_buff=0.4,
+            element_to_mobject=math_entry
         ).scale(0.4)
         table2.get_horizontal_lines().set_color(WHITE)
         table2.get_vertical_lines().set_color(WHITE)
@@ -184,7 +175,8 @@ class Sums(MovingCameraScene):
                 ["2", "2", "\cdot", "\cdot", "\cdot", "2", ""],
                 ["1", "1", "\cdot", "\cdot", "\cdot", "1", "1"],
             ],
-            h_buff=0.5, v_buff=0.4
+            h_buff=0.5, v_buff=0.4,
+            element_to_mobject=math_entry
         ).scale(0.4)
         table3.get_horizontal_lines().set_color(WHITE)
         table3.get_vertical_lines().set_color(WHITE)
@@ -245,7 +237,8 @@ class Sums(MovingCameraScene):
                 ["n + 2", "n + 2", "\cdot", "\cdot", "\cdot", "n + 2", ""],
                 ["n + 2", "n + 2", "\cdot", "\cdot", "\cdot", "n + 2", "n + 2"],
             ],
-            h_buff=0.5, v_buff=0.4
+            h_buff=0.5, v_buff=0.4,
+            element_to_mobject=math_entry
         ).scale(0.4)
         table4.get_horizontal_lines().set_color(WHITE)
         table4.get_vertical_lines().set_color(WHITE)
@@ -296,16 +289,7 @@ class Sums(MovingCameraScene):
 
         self.play(Write(ref))
 
-        text = Text(
-            "chill.maths", font="CMU Typewriter Text", weight=LIGHT, color=BLACK
-        )
-        # Ajouter un élément mathématique, par exemple une sinusoïde
-        sine_wave = FunctionGraph(
-            lambda x: 0.1 * np.sin(2 * np.pi * x),
-            x_range=[-3, 3],
-            color=BLACK
-        )
-        sine_wave.next_to(text, DOWN, buff=0.2)
+        text, sine_wave = logo()
         
         self.play(
             FadeIn(text, scale=0.5),
@@ -6,13 +6,15 @@ import numpy as np
 
 from manim import MovingCameraScene
 from manim import Create, Uncreate, Write, Transform, Group, ValueTracker
-from manim import Polygon, VGroup, FadeIn, FadeOut, FunctionGraph
-from manim import Text, Tex, RoundedRectangle, Circle, Line, Dot, TangentLine
+from manim import Polygon, VGroup, FadeIn, FadeOut
+from manim import Tex, RoundedRectangle, Circle, Line, Dot, TangentLine
 
 from manim import line_intersection
 
-from manim import config
-from manim import LEFT, RIGHT, DOWN, LIGHT, UP, SMALL_BUFF, PI
+from manim import LEFT, DOWN, UP, SMALL_BUFF, PI
+
+from chillmaths.assets import demonstration, logo, watermark
+from chillmaths.formats import render_profile
 
 # COLORS
 BLUE = "#B0E1FA"
@@ -24,16 +26,6 @@ ORANGE = "#F6CCB0"
 BLACK = "#000000"
 WHITE = "#F4EDDE"
 
-# Make it vertical
-SCALE_FACTOR = 1
-# Flip width => height, height => width
-tmp_pixel_height = config.pixel_height
-config.pixel_height = config.pixel_width
-config.pixel_width = tmp_pixel_height
-# Change coord system dimensions
-config.frame_height = config.frame_height / SCALE_FACTOR
-config.frame_width = config.frame_height * 9 / 16
-
 
 def get_line(p1, p2):
     """
@@ -103,15 +95,13 @@ def get_intersection(line, circle):
     #     return Dot([x1, y1, 0], color=BLACK, radius=0.05)
 
 
+@render_profile("vertical")
 class Circles(MovingCameraScene):
     def construct(self):
         self.camera.background_color = WHITE
         self.camera.frame.save_state()
 
-        txt_copy = Text(
-            r"@chill.maths", font_size=12,
-            font="CMU Typewriter Text", weight=LIGHT, color=BLACK
-        ).to_edge(RIGHT + DOWN, buff=0.1)
+        txt_copy = watermark()
         self.add(txt_copy)
 
         # Introduction text
@@ -121,11 +111,7 @@ class Circles(MovingCameraScene):
         ]
         txt_title = VGroup(*txt_title).arrange(DOWN).move_to([0, 2, 0])
 
-        txt = [
-            Tex(r"Démonstration", font_size=36, color=BLACK),
-            Tex(r"R. S. Hu", font_size=28, color=BLACK)
-        ]
-        txt = VGroup(*txt).arrange(DOWN)
+        txt = demonstration(r"R. S. Hu")
 
         self.add(
             txt_title,
@@ -281,16 +267,7 @@ class Circles(MovingCameraScene):
 
         self.play(Write(ref))
 
-        text = Text(
-            "chill.maths", font="CMU Typewriter Text", weight=LIGHT, color=BLACK
-        )
-        # Ajouter un élément mathématique, par exemple une sinusoïde
-        sine_wave = FunctionGraph(
-            lambda x: 0.1 * np.sin(2 * np.pi * x),
-            x_range=[-3, 3],
-            color=BLACK
-        )
-        sine_wave.next_to(text, DOWN, buff=0.2)
+        text, sine_wave = logo()
         
         self.play(
             FadeIn(text, scale=0.5),
@@ -2,15 +2,16 @@
 Visual proof of A Constant Chord
 Proofs without Words II. Roger B. Nelsen. p. 29.
 """
-import numpy as np
-
 from manim import MovingCameraScene
 from manim import Create, Uncreate, Write, Transform, Group, ValueTracker
-from manim import Polygon, VGroup, FadeIn, FadeOut, FunctionGraph
-from manim import Text, Tex, RoundedRectangle, Circle, Line, Dot, Angle
+from manim import Polygon, VGroup, FadeIn, FadeOut
+from manim import Tex, RoundedRectangle, Circle, Line, Dot, Angle
+
+from manim import LEFT, RIGHT, DOWN, UP, SMALL_BUFF, PI
 
-from manim import config
-from manim import LEFT, RIGHT, DOWN, LIGHT, UP, SMALL_BUFF, PI
+from chillmaths.assets import demonstration, logo, watermark
+from chillmaths.construction import Construction
+from chillmaths.formats import render_profile
 
 # COLORS
 BLUE = "#B0E1FA"
@@ -22,94 +23,14 @@ ORANGE = "#F6CCB0"
 BLACK = "#000000"
 WHITE = "#F4EDDE"
 
-# Make it vertical
-SCALE_FACTOR = 1
-# Flip width => height, height => width
-tmp_pixel_height = config.pixel_height
-config.pixel_height = config.pixel_width
-config.pixel_width = tmp_pixel_height
-# Change coord system dimensions
-config.frame_height = config.frame_height / SCALE_FACTOR
-config.frame_width = config.frame_height * 9 / 16
-
-
-def get_line(p1, p2):
-    """
-    Returns a line between two points.
-
-    Args:
-        p1: The first point as a Dot.
-        p2: The second point as a Dot.
-    """
-    if not isinstance(p1, Dot) or not isinstance(p2, Dot):
-        raise TypeError("Both p1 and p2 must be instances of Dot.")
-    coords_p1 = p1.get_center()
-    coords_p2 = p2.get_center()
-
-    m = (coords_p2[1] - coords_p1[1]) / (coords_p2[0] - coords_p1[0])
-    p = coords_p1[1] - m * coords_p1[0]
-
-    new_p1 = np.array([-5, -5 * m + p, 0])
-    new_p2 = np.array([5, 5 * m + p, 0])
-    return Line(new_p1, new_p2, color=BLUE, stroke_width=2)
-
-def get_intersection(line, circle, point):
-    """
-    Returns the intersection point of a line and a circle.
-
-    Args:
-        line: The line as a Line object.
-        circle: The circle as a Circle object.
-        point: On of the point where the line intersects the circle.
-
-    """
-    if not isinstance(line, Line) or not isinstance(circle, Circle):
-        raise TypeError(
-            "line must be an instance of Line and circle must be an",
-            "instance of Circle."
-        )
-    
-    # Get the equation of the line
-    m = (line.get_end()[1] - line.get_start()[1]) / (line.get_end()[0] - line.get_start()[0])
-    b = line.get_start()[1] - m * line.get_start()[0]
-
-    # Get the equation of the circle
-    r = circle.radius
-    center = circle.get_center()
-    h = center[0]
-    k = center[1]
-
-    # Solve for intersection points
-    A = 1 + m**2
-    B = 2 * (m * b - m * k - h)
-    C = h**2 + (b - k)**2 - r**2
-
-    discriminant = B**2 - 4 * A * C
-    if discriminant < 0:
-        return point
-
-    x1 = (-B + np.sqrt(discriminant)) / (2 * A)
-    y1 = m * x1 + b
-    x2 = (-B - np.sqrt(discriminant)) / (2 * A)
-    y2 = m * x2 + b
-    if (
-        np.abs(point.get_center()[0] - x1) < 0.1 and 
-        np.abs(point.get_center()[1] - y1) < 0.1
-    ):
-        return Dot([x2, y2, 0], color=BLACK, radius=0.05)
-    else:
-        return Dot([x1, y1, 0], color=BLACK, radius=0.05)
-
 
+@render_profile("vertical")
 class Chords(MovingCameraScene):
     def construct(self):
         self.camera.background_color = WHITE
         self.camera.frame.save_state()
 
-        txt_copy = Text(
-            r"@chill.maths", font_size=12,
-            font="CMU Typewriter Text", weight=LIGHT, color=BLACK
-        ).to_edge(RIGHT + DOWN, buff=0.1)
+        txt_copy = watermark()
         self.add(txt_copy)
 
         # Introduction text
@@ -119,11 +40,7 @@ class Chords(MovingCameraScene):
         ]
         txt_title = VGroup(*txt_title).arrange(DOWN).move_to([0, 2, 0])
 
-        txt = [
-            Tex(r"Démonstration", font_size=36, color=BLACK),
-            Tex(r"Ross Honsberger", font_size=28, color=BLACK)
-        ]
-        txt = VGroup(*txt).arrange(DOWN)
+        txt = demonstration(r"Ross Honsberger")
 
         self.add(
             txt_title,
@@ -170,12 +87,29 @@ class Chords(MovingCameraScene):
             Write(txt_2)
         )
 
-        # Points
+        # Points, lines and chord, placed by the construction
         point_tracker = ValueTracker(0.1)
-        P = Dot(
-            small_circle.point_from_proportion(point_tracker.get_value()), color=BLACK,
-            radius=0.05, stroke_width=2
-        )
+        P = Dot(color=BLACK, radius=0.05, stroke_width=2)
+        line_AP = Line(color=BLUE, stroke_width=2)
+        line_BP = Line(color=BLUE, stroke_width=2)
+        C = Dot(color=BLACK, radius=0.05)
+        D = Dot(color=BLACK, radius=0.05)
+        chord_CD = Line(color=RED, stroke_width=2)
+
+        geometry = Construction()
+        a = geometry.point(A)
+        b = geometry.point(B)
+        big = geometry.circle(big_circle)
+        p = geometry.point_on_circle(
+            geometry.circle(small_circle), geometry.tracker(point_tracker), P
+        )
+        ap = geometry.line_through(a, p, line_AP)
+        bp = geometry.line_through(b, p, line_BP)
+        c = geometry.second_intersection(ap, big, a, C)
+        d = geometry.second_intersection(bp, big, b, D)
+        geometry.segment(c, d, chord_CD)
+        geometry.update()
+
         txt_P = Tex(r"$P$", font_size=28, color=BLACK).next_to(P, UP + RIGHT, buff=0.1)
         txt_3 = Tex(r"et un point $P$ sur un cercle.", font_size=25, color=BLACK).\
             next_to(txt_2, DOWN, buff=0.1)
@@ -186,16 +120,12 @@ class Chords(MovingCameraScene):
         )
  
         # Lines
-        line_AP = get_line(A, P)
-        line_BP = get_line(B, P)
         self.play(
             Create(line_AP),
             Create(line_BP)
         )
 
         # Points that intersect lines and circles
-        C = get_intersection(line_AP, big_circle, A)
-        D = get_intersection(line_BP, big_circle, B)
         txt_C = Tex(r"$C$", font_size=20, color=BLACK).next_to(C, UP + LEFT, buff=0.1)
         txt_D = Tex(r"$D$", font_size=20, color=BLACK).next_to(D, UP + RIGHT, buff=0.1)
         txt_4 = Tex(r"Les points $C$ et $D$ sont les", font_size=25, color=BLACK).\
@@ -216,7 +146,6 @@ class Chords(MovingCameraScene):
         )
 
         # Chord
-        chord_CD = Line(C.get_center(), D.get_center(), color=RED, stroke_width=2)
         self.play(
             Create(chord_CD)
         )
@@ -232,44 +161,10 @@ class Chords(MovingCameraScene):
         )
 
         # Update
-        P.add_updater(
-            lambda x: x.become(P.copy().move_to(
-                small_circle.point_from_proportion(point_tracker.get_value())
-            ))
-        )
-        txt_P.add_updater(
-            lambda x: x.become(txt_P.copy().next_to(
-                P, UP + LEFT, buff=0.1
-            ))
-        )
-
-        line_AP.add_updater(
-            lambda x: x.become(get_line(A, P))
-        )
-        line_BP.add_updater(
-            lambda x: x.become(get_line(B, P))
-        )
-        C.add_updater(
-            lambda x: x.become(get_intersection(line_AP, big_circle, A))
-        )
-        txt_C.add_updater(
-            lambda x: x.become(txt_C.copy().next_to(
-                C, UP + LEFT, buff=0.1
-            ))
-        )
-        D.add_updater(
-            lambda x: x.become(get_intersection(line_BP, big_circle, B))
-        )
-        txt_D.add_updater(
-            lambda x: x.become(txt_D.copy().next_to(
-                D, UP + RIGHT, buff=0.1
-            ))
-        )
-        chord_CD.add_updater(
-            lambda x: x.become(
-                Line(C.get_center(), D.get_center(), color=RED, stroke_width=2)
-            )
-        )
+        geometry.label(p, txt_P, UP + LEFT, buff=0.1)
+        geometry.label(c, txt_C, UP + LEFT, buff=0.1)
+        geometry.label(d, txt_D, UP + RIGHT, buff=0.1)
+        geometry.add_updaters()
 
         self.play(
             point_tracker.animate.set_value(0.4),
@@ -299,16 +194,7 @@ class Chords(MovingCameraScene):
 
         self.play(Write(ref))
 
-        text = Text(
-            "chill.maths", font="CMU Typewriter Text", weight=LIGHT, color=BLACK
-        )
-        # Ajouter un élément mathématique, par exemple une sinusoïde
-        sine_wave = FunctionGraph(
-            lambda x: 0.1 * np.sin(2 * np.pi * x),
-            x_range=[-3, 3],
-            color=BLACK
-        )
-        sine_wave.next_to(text, DOWN, buff=0.2)
+        text, sine_wave = logo()
         
         self.play(
             FadeIn(text, scale=0.5),
@@ -3,15 +3,15 @@ Visual proof of the arithmetic mean - geometric mean inequality for three positi
 numbers.
 Proofs without Words II. Roger B. Nelsen. p. 74.
 """
-import numpy as np
-
 from manim import MovingCameraScene
 from manim import Create, Uncreate, Write, Transform, TransformFromCopy
-from manim import VGroup, FadeIn, FadeOut, FunctionGraph, Rectangle, RoundedRectangle
-from manim import Text, Tex
+from manim import VGroup, FadeIn, FadeOut, Rectangle, RoundedRectangle
+
+from manim import LEFT, RIGHT, DOWN, UP
 
-from manim import config
-from manim import LEFT, RIGHT, DOWN, LIGHT, UP
+from chillmaths.assets import demonstration, logo, watermark
+from chillmaths.formats import render_profile
+from chillmaths.lazytex import LazyTex
 
 # COLORS
 BLUE = "#B0E1FA"
@@ -23,42 +23,26 @@ ORANGE = "#F6CCB0"
 BLACK = "#000000"
 WHITE = "#F4EDDE"
 
-# Make it vertical
-SCALE_FACTOR = 1
-# Flip width => height, height => width
-tmp_pixel_height = config.pixel_height
-config.pixel_height = config.pixel_width
-config.pixel_width = tmp_pixel_height
-# Change coord system dimensions
-config.frame_height = config.frame_height / SCALE_FACTOR
-config.frame_width = config.frame_height * 9 / 16
-
 
+@render_profile("vertical")
 class Mean(MovingCameraScene):
     def construct(self):
         self.camera.background_color = WHITE
         self.camera.frame.save_state()
 
-        txt_copy = Text(
-            r"@chill.maths", font_size=12,
-            font="CMU Typewriter Text", weight=LIGHT, color=BLACK
-        ).to_edge(RIGHT + DOWN, buff=0.1)
+        txt_copy = watermark()
         self.add(txt_copy)
 
         # Introduction text
         txt_title = [
-            Tex(r"Une inégalité", font_size=48, color=BLACK),
-            Tex(r"de moyennes", font_size=48, color=BLACK),
-            Tex(r"pour 3 nombres", font_size=48, color=BLACK),
-            Tex(r"Partie I", font_size=24, color=BLACK),
+            LazyTex(r"Une inégalité", font_size=48, color=BLACK),
+            LazyTex(r"de moyennes", font_size=48, color=BLACK),
+            LazyTex(r"pour 3 nombres", font_size=48, color=BLACK),
+            LazyTex(r"Partie I", font_size=24, color=BLACK),
         ]
         txt_title = VGroup(*txt_title).arrange(DOWN).move_to([0, 2, 0])
 
-        txt = [
-            Tex(r"Démonstration", font_size=36, color=BLACK),
-            Tex(r"Claudi Alsina", font_size=28, color=BLACK)
-        ]
-        txt = VGroup(*txt).arrange(DOWN)
+        txt = demonstration(r"Claudi Alsina")
 
         self.add(
             txt_title,
@@ -79,17 +63,17 @@ class Mean(MovingCameraScene):
             next_to(rect_b, DOWN, buff=0).\
             align_to(rect_a, LEFT)
 
-        txt_a = Tex(r"$a$", font_size=36, color=BLACK).\
+        txt_a = LazyTex(r"$a$", font_size=36, color=BLACK).\
             next_to(rect_a, UP, buff=0.1)
-        txt_aa = Tex(r"$a$", font_size=36, color=BLACK).\
+        txt_aa = LazyTex(r"$a$", font_size=36, color=BLACK).\
             next_to(rect_a, LEFT, buff=0.1)
-        txt_b = Tex(r"$b$", font_size=36, color=BLACK).\
+        txt_b = LazyTex(r"$b$", font_size=36, color=BLACK).\
             next_to(rect_b, UP, buff=0.1)
-        txt_bb = Tex(r"$b$", font_size=36, color=BLACK).\
+        txt_bb = LazyTex(r"$b$", font_size=36, color=BLACK).\
             next_to(rect_b, LEFT, buff=0.1)
-        txt_c = Tex(r"$c$", font_size=36, color=BLACK).\
+        txt_c = LazyTex(r"$c$", font_size=36, color=BLACK).\
             next_to(rect_c, UP, buff=0.1)
-        txt_cc = Tex(r"$c$", font_size=36, color=BLACK).\
+        txt_cc = LazyTex(r"$c$", font_size=36, color=BLACK).\
             next_to(rect_c, LEFT, buff=0.1)
 
         self.play(
@@ -98,7 +82,7 @@ class Mean(MovingCameraScene):
             Write(txt_aa)
         )
 
-        txt_a2 = Tex(r"$a^2$", font_size=36, color=BLACK).\
+        txt_a2 = LazyTex(r"$a^2$", font_size=36, color=BLACK).\
             move_to(rect_a.get_center_of_mass())
         self.play(
             Transform(txt_a, txt_a2),
@@ -111,7 +95,7 @@ class Mean(MovingCameraScene):
             Write(txt_bb)
         )
 
-        txt_b2 = Tex(r"$b^2$", font_size=36, color=BLACK).\
+        txt_b2 = LazyTex(r"$b^2$", font_size=36, color=BLACK).\
             move_to(rect_b.get_center_of_mass())
         self.play(
             Transform(txt_b, txt_b2),
@@ -124,7 +108,7 @@ class Mean(MovingCameraScene):
             Write(txt_cc)
         )
 
-        txt_c2 = Tex(r"$c^2$", font_size=36, color=BLACK).\
+        txt_c2 = LazyTex(r"$c^2$", font_size=36, color=BLACK).\
             move_to(rect_c.get_center_of_mass())
         self.play(
             Transform(txt_c, txt_c2),
@@ -141,17 +125,17 @@ class Mean(MovingCameraScene):
             next_to(rect_bc, DOWN, buff=0).\
             align_to(rect_a, LEFT)
         
-        txt_a = Tex(r"$a$", font_size=36, color=BLACK).\
+        txt_a = LazyTex(r"$a$", font_size=36, color=BLACK).\
             next_to(rect_ab, UP, buff=0.1)
-        txt_b = Tex(r"$b$", font_size=36, color=BLACK).\
+        txt_b = LazyTex(r"$b$", font_size=36, color=BLACK).\
             next_to(rect_ab, LEFT, buff=0.1)
-        txt_bb = Tex(r"$b$", font_size=36, color=BLACK).\
+        txt_bb = LazyTex(r"$b$", font_size=36, color=BLACK).\
             next_to(rect_bc, UP, buff=0.1)
-        txt_c = Tex(r"$c$", font_size=36, color=BLACK).\
+        txt_c = LazyTex(r"$c$", font_size=36, color=BLACK).\
             next_to(rect_bc, LEFT, buff=0.1)
-        txt_cc = Tex(r"$c$", font_size=36, color=BLACK).\
+        txt_cc = LazyTex(r"$c$", font_size=36, color=BLACK).\
             next_to(rect_ac, UP, buff=0.1)
-        txt_aa = Tex(r"$a$", font_size=36, color=BLACK).\
+        txt_aa = LazyTex(r"$a$", font_size=36, color=BLACK).\
             next_to(rect_ac, LEFT, buff=0.1)
 
         self.play(
@@ -160,7 +144,7 @@ class Mean(MovingCameraScene):
             Write(txt_b)
         )
 
-        txt_ab = Tex(r"$ab$", font_size=36, color=BLACK).\
+        txt_ab = LazyTex(r"$ab$", font_size=36, color=BLACK).\
             move_to(rect_ab.get_center_of_mass())
         self.play(
             Transform(txt_a, txt_ab),
@@ -173,7 +157,7 @@ class Mean(MovingCameraScene):
             Write(txt_c)
         )
 
-        txt_bc = Tex(r"$bc$", font_size=36, color=BLACK).\
+        txt_bc = LazyTex(r"$bc$", font_size=36, color=BLACK).\
             move_to(rect_bc.get_center_of_mass())
         self.play(
             Transform(txt_bb, txt_bc),
@@ -186,7 +170,7 @@ class Mean(MovingCameraScene):
             Write(txt_aa)
         )
 
-        txt_ac = Tex(r"$ac$", font_size=36, color=BLACK).\
+        txt_ac = LazyTex(r"$ac$", font_size=36, color=BLACK).\
             move_to(rect_ac.get_center_of_mass())
         self.play(
             Transform(txt_cc, txt_ac),
@@ -195,9 +179,9 @@ class Mean(MovingCameraScene):
 
         # Write the inequalities
         inequalities = [
-            Tex(r"$ab + bc + ac$", font_size=30, color=BLACK),
-            Tex(r"$ \leq $", font_size=30, color=BLACK),
-            Tex(r"$a^2 + b^2 + c^2$", font_size=30, color=BLACK)
+            LazyTex(r"$ab + bc + ac$", font_size=30, color=BLACK),
+            LazyTex(r"$ \leq $", font_size=30, color=BLACK),
+            LazyTex(r"$a^2 + b^2 + c^2$", font_size=30, color=BLACK)
         ]
         inequalities = VGroup(*inequalities).arrange(RIGHT).move_to([0, 2, 0])
 
@@ -207,7 +191,7 @@ class Mean(MovingCameraScene):
             color=BLACK,
             fill_color=WHITE, fill_opacity=1
         ).move_to([0, 2, 0])
-        txt = txt = Tex(
+        txt = txt = LazyTex(
             r"$ab$", r"$~+~$", r"$bc$", r"$~+~$", r"$ac$",
             r" $ \leq $ ",
             r"$a^2$", r"$~+~$", r"$b^2$", r"$~+~$", r"$c^2$",
@@ -240,8 +224,8 @@ class Mean(MovingCameraScene):
 
         # Logo
         ref = [
-            Tex(r"Mathematics Magazine, vol. 73,", font_size=26, color=BLACK),
-            Tex(r"no. 2 (April 2000), p.97", font_size=26, color=BLACK)
+            LazyTex(r"Mathematics Magazine, vol. 73,", font_size=26, color=BLACK),
+            LazyTex(r"no. 2 (April 2000), p.97", font_size=26, color=BLACK)
         ]
         ref = VGroup(*ref)\
             .arrange(DOWN, aligned_edge=LEFT, center=False, buff=0.1)\
@@ -249,16 +233,7 @@ class Mean(MovingCameraScene):
 
         self.play(Write(ref))
 
-        text = Text(
-            "chill.maths", font="CMU Typewriter Text", weight=LIGHT, color=BLACK
-        )
-        # Ajouter un élément mathématique, par exemple une sinusoïde
-        sine_wave = FunctionGraph(
-            lambda x: 0.1 * np.sin(2 * np.pi * x),
-            x_range=[-3, 3],
-            color=BLACK
-        )
-        sine_wave.next_to(text, DOWN, buff=0.2)
+        text, sine_wave = logo()
         
         self.play(
             FadeIn(text, scale=0.5),
@@ -6,11 +6,15 @@ import numpy as np
 
 from manim import MovingCameraScene
 from manim import Create, Uncreate, Write
-from manim import Axes, VGroup, FadeIn, FadeOut, FunctionGraph, Line, Polygon
-from manim import Arrow, DashedLine, Rectangle, Text, Tex
+from manim import Axes, VGroup, FadeIn, FadeOut, Polygon
+from manim import Arrow, DashedLine, Rectangle, Tex
 
 from manim import config
-from manim import LEFT, RIGHT, DOWN, LIGHT, UP
+from manim import LEFT, DOWN, UP
+
+from chillmaths.assets import demonstration, logo, watermark
+from chillmaths.formats import render_profile
+from chillmaths.hatch import Hatch
 
 # COLORS
 BLUE = "#B0E1FA"
@@ -23,26 +27,14 @@ BLACK = "#000000"
 GREY = "#D3D3D3"
 WHITE = "#F4EDDE"
 
-# Make it vertical
-SCALE_FACTOR = 1
-# Flip width => height, height => width
-tmp_pixel_height = config.pixel_height
-config.pixel_height = config.pixel_width
-config.pixel_width = tmp_pixel_height
-# Change coord system dimensions
-config.frame_height = config.frame_height / SCALE_FACTOR
-config.frame_width = config.frame_height * 9 / 16
-
 
+@render_profile("vertical")
 class Chebyshev(MovingCameraScene):
     def construct(self):
         self.camera.background_color = WHITE
         self.camera.frame.save_state()
 
-        txt_copy = Text(
-            r"@chill.maths", font_size=12,
-            font="CMU Typewriter Text", weight=LIGHT, color=BLACK
-        ).to_edge(RIGHT + DOWN, buff=0.1)
+        txt_copy = watermark()
         self.add(txt_copy)
 
         # Introduction text
@@ -52,11 +44,7 @@ class Chebyshev(MovingCameraScene):
         ]
         txt_title = VGroup(*txt_title).arrange(DOWN).move_to([0, 2, 0])
 
-        txt = [
-            Tex(r"Démonstration", font_size=36, color=BLACK),
-            Tex(r"Roger B. Nelsen", font_size=28, color=BLACK)
-        ]
-        txt = VGroup(*txt).arrange(DOWN)
+        txt = demonstration(r"Roger B. Nelsen")
 
         self.add(
             txt_title,
@@ -99,20 +87,16 @@ class Chebyshev(MovingCameraScene):
                 fill_opacity=0.75,
                 stroke_width=1.5
             )
-            hatches = VGroup()
-            spacing = 0.23
-            for x_start in np.arange(x0 - (y1 - y0), x1, spacing):
-                start_x = max(x0, x_start)
-                end_x = min(x1, x_start + (y1 - y0))
-                if start_x < end_x:
-                    hatches.add(
-                        Line(
-                            p(start_x, y0 + start_x - x_start),
-                            p(end_x, y0 + end_x - x_start),
-                            color=BLACK,
-                            stroke_width=1.15
-                        )
-                    )
+            # 45 degrees in the units of the figure.
+            angle = np.arctan2(sy, sx)
+            hatches = Hatch(
+                rect.get_vertices(),
+                angle=angle,
+                spacing=0.23 * sx * np.sin(angle),
+                anchor=p(x0, y1),
+                color=BLACK,
+                stroke_width=1.15
+            )
             return VGroup(rect, hatches)
 
         top_formula = Tex(
@@ -269,16 +253,7 @@ class Chebyshev(MovingCameraScene):
 
         self.play(Write(ref))
 
-        text = Text(
-            "chill.maths", font="CMU Typewriter Text", weight=LIGHT, color=BLACK
-        )
-        # Ajouter un élément mathématique, par exemple une sinusoïde
-        sine_wave = FunctionGraph(
-            lambda x: 0.1 * np.sin(2 * np.pi * x),
-            x_range=[-3, 3],
-            color=BLACK
-        )
-        sine_wave.next_to(text, DOWN, buff=0.2)
+        text, sine_wave = logo()
         
         self.play(
             FadeIn(text, scale=0.5),
@@ -6,12 +6,16 @@ import numpy as np
 
 from manim import MovingCameraScene, Scene, ManimColor
 from manim import Create, Uncreate, Write
-from manim import Brace, VGroup, FadeIn, FadeOut, FunctionGraph, Rotate
+from manim import Brace, VGroup, FadeIn, FadeOut, Rotate
 from manim import Text, Tex, Rectangle, RoundedRectangle, Transform
 from manim import Circle, Polygon, LaggedStart, DoubleArrow
 
-from manim import config
-from manim import LEFT, RIGHT, DOWN, LIGHT, UP, PI
+from manim import LEFT, DOWN, UP, PI
+
+from chillmaths.assets import demonstration, logo, watermark
+from chillmaths.formats import render_profile
+from chillmaths.glyphs import GlyphLabel
+from chillmaths.recolor import Recolor
 
 # COLORS
 BLUE = "#B0E1FA"
@@ -23,16 +27,8 @@ ORANGE = "#F6CCB0"
 BLACK = "#000000"
 WHITE = "#F4EDDE"
 
-# Make it vertical
-SCALE_FACTOR = 1
-# Flip width => height, height => width
-tmp_pixel_height = config.pixel_height
-config.pixel_height = config.pixel_width
-config.pixel_width = tmp_pixel_height
-# Change coord system dimensions
-config.frame_height = config.frame_height / SCALE_FACTOR
-config.frame_width = config.frame_height * 9 / 16
 
+@render_profile("vertical")
 class DynamicTriangleCircles(Scene):
     def __init__(self, num_circles=10, **kwargs):
         self.num_circles = num_circles
@@ -100,7 +96,7 @@ class DynamicTriangleCircles(Scene):
             circle.move_to(pos)
             
             # Add number label
-            label = Text(str(i+1), font_size=16, color=WHITE)
+            label = GlyphLabel(str(i+1), font_size=16, color=WHITE)
             label.move_to(circle.get_center())
             
             circle_with_label = VGroup(circle, label)
@@ -151,15 +147,14 @@ class DynamicTriangleCircles(Scene):
         )
         return triangle
 
+
+@render_profile("vertical")
 class Tri(MovingCameraScene):
     def construct(self):
         self.camera.background_color = WHITE
         self.camera.frame.save_state()
 
-        txt_copy = Text(
-            r"@chill.maths", font_size=12,
-            font="CMU Typewriter Text", weight=LIGHT, color=BLACK
-        ).to_edge(RIGHT + DOWN, buff=0.1)
+        txt_copy = watermark()
         self.add(txt_copy)
 
         # Introduction text
@@ -171,11 +166,7 @@ class Tri(MovingCameraScene):
         txt_title = VGroup(*txt_title).arrange(DOWN).move_to([0, 2, 0])
 
 
-        txt = [
-            Tex(r"Démonstration", font_size=36, color=BLACK),
-            Tex(r"Roger B. Nelsen", font_size=28, color=BLACK),
-        ]
-        txt = VGroup(*txt).arrange(DOWN)
+        txt = demonstration(r"Roger B. Nelsen")
 
         self.add(
             txt_title,
@@ -417,7 +408,7 @@ class Tri(MovingCameraScene):
         )
 
         self.play(
-            circles[24].animate.set_fill(RED, opacity=0.9),
+            Recolor(circles[24], circles[24].copy().set_fill(RED, opacity=0.9)),
         )
 
         txt_2 = Tex(r"$T_{3k + 1} = 1 + 3 (T_{2k + 1} - T_{k + 1})$", font_size=28, color=BLACK).\
@@ -538,16 +529,7 @@ class Tri(MovingCameraScene):
 
         self.play(Write(ref))
 
-        text = Text(
-            "chill.maths", font="CMU Typewriter Text", weight=LIGHT, color=BLACK
-        )
-        # Ajouter un élément mathématique, par exemple une sinusoïde
-        sine_wave = FunctionGraph(
-            lambda x: 0.1 * np.sin(2 * np.pi * x),
-            x_range=[-3, 3],
-            color=BLACK
-        )
-        sine_wave.next_to(text, DOWN, buff=0.2)
+        text, sine_wave = logo()
         
         self.play(
             FadeIn(text, scale=0.5),
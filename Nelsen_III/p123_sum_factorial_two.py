@@ -6,12 +6,15 @@ import numpy as np
 
 from manim import ThreeDScene
 from manim import Create, Uncreate, Write
-from manim import Brace, VGroup, FadeIn, FadeOut, FunctionGraph
+from manim import Brace, VGroup, FadeIn, FadeOut
 from manim import LaggedStart, ReplacementTransform
-from manim import Cube, MathTex, Text, Tex
+from manim import MathTex, Tex
 
-from manim import config
-from manim import DEGREES, LEFT, RIGHT, DOWN, LIGHT, ORIGIN, OUT, PI, UP
+from manim import DEGREES, LEFT, DOWN, ORIGIN, OUT, PI, UP
+
+from chillmaths.assets import demonstration, logo, watermark
+from chillmaths.formats import render_profile
+from chillmaths.voxels import VoxelSolid
 
 # COLORS
 BLUE = "#B0E1FA"
@@ -23,25 +26,13 @@ ORANGE = "#F6CCB0"
 BLACK = "#000000"
 WHITE = "#F4EDDE"
 
-# Make it vertical
-SCALE_FACTOR = 1
-# Flip width => height, height => width
-tmp_pixel_height = config.pixel_height
-config.pixel_height = config.pixel_width
-config.pixel_width = tmp_pixel_height
-# Change coord system dimensions
-config.frame_height = config.frame_height / SCALE_FACTOR
-config.frame_width = config.frame_height * 9 / 16
-
 
+@render_profile("vertical")
 class SumFactorialTwo(ThreeDScene):
     def construct(self):
         self.camera.background_color = WHITE
 
-        txt_copy = Text(
-            r"@chill.maths", font_size=12,
-            font="CMU Typewriter Text", weight=LIGHT, color=BLACK
-        ).to_edge(RIGHT + DOWN, buff=0.1)
+        txt_copy = watermark()
         self.add(txt_copy)
         self.add_fixed_in_frame_mobjects(txt_copy)
 
@@ -53,11 +44,7 @@ class SumFactorialTwo(ThreeDScene):
         ]
         txt_title = VGroup(*txt_title).arrange(DOWN).move_to([0, 2, 0])
 
-        txt = [
-            Tex(r"Démonstration", font_size=36, color=BLACK),
-            Tex(r"Giorgio Goldoni", font_size=28, color=BLACK)
-        ]
-        txt = VGroup(*txt).arrange(DOWN)
+        txt = demonstration(r"Giorgio Goldoni")
 
         results = [
             Tex(r"$\displaystyle\sum_{k=1}^n k(k +1) = \dfrac{n(n+1)(n+2)}{3}$", font_size=24, color=BLACK),
@@ -93,28 +80,17 @@ class SumFactorialTwo(ThreeDScene):
         def screen_point(x, y):
             return x * view_right + y * view_up
 
-        def cube_at(x, y, z, side, color=None):
-            cube = Cube(
-                side_length=side,
-                fill_color=color or "#F4F4F4",
-                fill_opacity=1,
+        def voxel_solid(coords, side, color=None, center=True):
+            solid = VoxelSolid(
+                coords,
+                side=side,
+                face_colors=color or [
+                    "#D0D0D0", "#FAFAFA", "#F5F5F5",
+                    "#D8D8D8", "#E6E6E6", "#FFFFFF",
+                ],
                 stroke_color=BLACK,
                 stroke_width=0.55,
             )
-            cube.move_to(side * np.array([x, y, z]))
-            face_colors = [color] * 6 if color else [
-                "#D0D0D0", "#FAFAFA", "#F5F5F5",
-                "#D8D8D8", "#E6E6E6", "#FFFFFF",
-            ]
-            for face, face_color in zip(cube, face_colors):
-                face.set_fill(face_color, opacity=1)
-                face.set_stroke(BLACK, width=0.55)
-            return cube
-
-        def voxel_solid(coords, side, color=None, center=True):
-            solid = VGroup(*[
-                cube_at(x, y, z, side, color) for x, y, z in coords
-            ])
             if center:
                 solid.move_to(ORIGIN)
             return solid
@@ -323,16 +299,7 @@ class SumFactorialTwo(ThreeDScene):
 
         self.play(Write(ref))
 
-        text = Text(
-            "chill.maths", font="CMU Typewriter Text", weight=LIGHT, color=BLACK
-        )
-        # Ajouter un élément mathématique, par exemple une sinusoïde
-        sine_wave = FunctionGraph(
-            lambda x: 0.1 * np.sin(2 * np.pi * x),
-            x_range=[-3, 3],
-            color=BLACK
-        )
-        sine_wave.next_to(text, DOWN, buff=0.2)
+        text, sine_wave = logo()
         
         self.play(
             FadeIn(text, scale=0.5),
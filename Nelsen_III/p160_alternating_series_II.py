@@ -2,17 +2,18 @@
 Visual proof of an alternating series II.
 Proofs without Words III. Roger B. Nelsen. p. 160.
 """
-import numpy as np
-
 from manim import MovingCameraScene
-from manim import Dot, RoundedRectangle, Polygon, Square
+from manim import Dot, RoundedRectangle, Polygon
 from manim import Create, Uncreate, Write
-from manim import VGroup, Transform, FadeIn, FadeOut, FunctionGraph, BraceBetweenPoints
-from manim import Text, Tex
+from manim import VGroup, Transform, FadeIn, FadeOut, BraceBetweenPoints
+from manim import Tex
 
-from manim import config
+from manim import LEFT, RIGHT, DOWN, UP, PI
 
-from manim import LEFT, RIGHT, DOWN, LIGHT, UP, PI
+from chillmaths.assets import demonstration, logo, watermark
+from chillmaths.formats import render_profile
+from chillmaths.grid import SquareGrid
+from chillmaths.recolor import Recolor
 
 # COLORS
 BLUE = "#B0E1FA"
@@ -24,25 +25,14 @@ ORANGE = "#F6CCB0"
 BLACK = "#000000"
 WHITE = "#F4EDDE"
 
-# Make it vertical
-SCALE_FACTOR = 1
-# Flip width => height, height => width
-tmp_pixel_height = config.pixel_height
-config.pixel_height = config.pixel_width
-config.pixel_width = tmp_pixel_height
-# Change coord system dimensions
-config.frame_height = config.frame_height / SCALE_FACTOR
-config.frame_width = config.frame_height * 9 / 16
 
+@render_profile("vertical")
 class Proof(MovingCameraScene):
     def construct(self):
         self.camera.background_color = WHITE
         self.camera.frame.save_state()
 
-        txt_copy = Text(
-            r"@chill.maths", font_size=12,
-            font="CMU Typewriter Text", weight=LIGHT, color=BLACK
-        ).to_edge(RIGHT + DOWN, buff=0.1)
+        txt_copy = watermark()
         self.add(txt_copy)
 
 
@@ -53,11 +43,7 @@ class Proof(MovingCameraScene):
         ]
         txt_title = VGroup(*txt_title).arrange(DOWN).move_to([0, 2, 0])
 
-        txt = [
-            Tex(r"Démonstration", font_size=36, color=BLACK),
-            Tex(r"Roger B. Nelsen", font_size=28, color=BLACK)
-        ]
-        txt = VGroup(*txt).arrange(DOWN)
+        txt = demonstration(r"Roger B. Nelsen")
 
         txt_formula = Tex(
             r"$1 - \frac{1}{2} + \frac{1}{4} - \frac{1}{8} + \cdots = \frac{2}{3}$",
@@ -79,19 +65,13 @@ class Proof(MovingCameraScene):
 
         # Create L shaped figure with 3 big squares of 8x8 small squares
         square_size = 0.2
-        big_squares = []
-        for big in range(3):
-            small_squares = []
-            for i in range(8):
-                for j in range(8):
-                    sq = Square(
-                        side_length=square_size, stroke_width=1,
-                        color=RED, stroke_color=BLACK, fill_opacity=1
-                    )
-                    sq.move_to([j * square_size, i * square_size, 0])
-                    small_squares.append(sq)
-            big_sq = VGroup(*small_squares)
-            big_squares.append(big_sq)
+        big_squares = [
+            SquareGrid(
+                8, 8, side_length=square_size, stroke_width=1,
+                fill_color=RED, stroke_color=BLACK, fill_opacity=1
+            )
+            for _ in range(3)
+        ]
 
         # Position them in L shape
         big_squares[0]  # Bottom left
@@ -107,76 +87,53 @@ class Proof(MovingCameraScene):
         )
 
         # Color some parts of the figure to show the series terms 1/2
+        # (rows of the grids are counted from the top)
         l_figure_2 = l_figure.copy()
-        l_figure_2[0][0:64].set_fill(GREEN, opacity=1)
-        for i in range(4):
-            for j in range(4, 8):
-                l_figure_2[1][i * 8 + j].set_fill(GREEN, opacity=1)
-        for i in range(4, 8):
-            for j in range(4):
-                l_figure_2[2][i * 8 + j].set_fill(GREEN, opacity=1)
-            
+        l_figure_2[0].set_cell_fill(GREEN)
+        l_figure_2[1].set_cell_fill(GREEN, rows=slice(4, 8), columns=slice(4, 8))
+        l_figure_2[2].set_cell_fill(GREEN, rows=slice(0, 4), columns=slice(0, 4))
 
         txt_12 = Tex(
             r"$1 - \frac{1}{2}$", font_size=24, color=BLACK
         ).move_to([0, 2.5, 0])
         self.play(
             Transform(txt_1, txt_12),
-            Transform(l_figure, l_figure_2)
+            Recolor(l_figure, l_figure_2)
         )
 
         # Color some parts of the figure to show the series terms 1/4
         l_figure_3 = l_figure_2.copy()
-        for i in range(4, 8):
-            for j in range(4):
-                l_figure_3[2][i * 8 + j].set_fill(RED, opacity=1)
-        for i in range(4):
-            for j in range(4, 8):
-                l_figure_3[1][i * 8 + j].set_fill(RED, opacity=1)
-        for i in range(4, 8):
-            for j in range(4, 8):
-                l_figure_3[0][i * 8 + j].set_fill(RED, opacity=1)
-        
+        l_figure_3[2].set_cell_fill(RED, rows=slice(0, 4), columns=slice(0, 4))
+        l_figure_3[1].set_cell_fill(RED, rows=slice(4, 8), columns=slice(4, 8))
+        l_figure_3[0].set_cell_fill(RED, rows=slice(0, 4), columns=slice(4, 8))
 
         txt_124 = Tex(
             r"$1 - \frac{1}{2} + \frac{1}{4}$", font_size=24, color=BLACK
         ).move_to([0, 2.5, 0])
         self.play(
             Transform(txt_1, txt_124),
-            Transform(l_figure, l_figure_3)
+            Recolor(l_figure, l_figure_3)
         )
-        
+
         # Color some parts of the figure to show the series terms 1/8
         l_figure_4 = l_figure_3.copy()
-        for i in range(4, 8):
-            for j in range(4, 8):
-                l_figure_4[0][i * 8 + j].set_fill(GREEN, opacity=1)
-        for i in range(2):
-            for j in range(6, 8):
-                l_figure_4[1][i * 8 + j].set_fill(GREEN, opacity=1)
-        for i in range(6, 8):
-            for j in range(2):
-                l_figure_4[2][i * 8 + j].set_fill(GREEN, opacity=1)
+        l_figure_4[0].set_cell_fill(GREEN, rows=slice(0, 4), columns=slice(4, 8))
+        l_figure_4[1].set_cell_fill(GREEN, rows=slice(6, 8), columns=slice(6, 8))
+        l_figure_4[2].set_cell_fill(GREEN, rows=slice(0, 2), columns=slice(0, 2))
 
         txt_1248 = Tex(
             r"$1 - \frac{1}{2} + \frac{1}{4} - \frac{1}{8}$", font_size=24, color=BLACK
         ).move_to([0, 2.5, 0])
         self.play(
             Transform(txt_1, txt_1248),
-            Transform(l_figure, l_figure_4)
+            Recolor(l_figure, l_figure_4)
         )
 
         # Color some parts of the figure to show the series terms 1/16
         l_figure_5 = l_figure_4.copy()
-        for i in range(6, 8):
-            for j in range(2):
-                l_figure_5[2][i * 8 + j].set_fill(RED, opacity=1)
-        for i in range(2):
-            for j in range(6, 8):
-                l_figure_5[1][i * 8 + j].set_fill(RED, opacity=1)
-        for i in range(6, 8):
-            for j in range(6, 8):
-                l_figure_5[0][i * 8 + j].set_fill(RED, opacity=1)
+        l_figure_5[2].set_cell_fill(RED, rows=slice(0, 2), columns=slice(0, 2))
+        l_figure_5[1].set_cell_fill(RED, rows=slice(6, 8), columns=slice(6, 8))
+        l_figure_5[0].set_cell_fill(RED, rows=slice(0, 2), columns=slice(6, 8))
 
         txt_124816 = Tex(
             r"$1 - \frac{1}{2} + \frac{1}{4} - \frac{1}{8} + \frac{1}{16}$",
@@ -184,14 +141,12 @@ class Proof(MovingCameraScene):
         ).move_to([0, 2.5, 0])
         self.play(
             Transform(txt_1, txt_124816),
-            Transform(l_figure, l_figure_5)
+            Recolor(l_figure, l_figure_5)
         )
 
         # Finish the figure and write the limit
         l_figure_6 = l_figure_5.copy()
-        for i in range(6, 8):
-            for j in range(6, 8):
-                l_figure_6[0][i * 8 + j].set_fill(GREEN, opacity=1)
+        l_figure_6[0].set_cell_fill(GREEN, rows=slice(0, 2), columns=slice(6, 8))
 
         txt_end = Tex(
             r"$1 - \frac{1}{2} + \frac{1}{4} - \frac{1}{8} + \cdots = \frac{2}{3}$",
@@ -199,7 +154,7 @@ class Proof(MovingCameraScene):
         ).move_to([0, 2.5, 0])
         self.play(
             Transform(txt_1, txt_end),
-            Transform(l_figure, l_figure_6)
+            Recolor(l_figure, l_figure_6)
         )
 
 
@@ -219,16 +174,7 @@ class Proof(MovingCameraScene):
 
         self.play(Write(ref))
 
-        text = Text(
-            "chill.maths", font="CMU Typewriter Text", weight=LIGHT, color=BLACK
-        )
-        # Ajouter un élément mathématique, par exemple une sinusoïde
-        sine_wave = FunctionGraph(
-            lambda x: 0.1 * np.sin(2 * np.pi * x),
-            x_range=[-3, 3],
-            color=BLACK
-        )
-        sine_wave.next_to(text, DOWN, buff=0.2)
+        text, sine_wave = logo()
         
         self.play(
             FadeIn(text, scale=0.5),
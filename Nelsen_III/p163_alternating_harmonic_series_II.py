@@ -2,16 +2,18 @@
 Visual proof of the alternating harmonic series.
 Proofs without Words III. Roger B. Nelsen. p. 163.
 """
-import numpy as np
-
 from manim import MovingCameraScene
 from manim import Create, Uncreate, Write
-from manim import Axes, VGroup, FadeIn, FadeOut, FunctionGraph, Line, Polygon
-from manim import Text, Tex, Transform
-from manim import NumberPlane, always_redraw
+from manim import Axes, VGroup, FadeIn, FadeOut, Line, Polygon
+from manim import Tex, Transform
+from manim import always_redraw
+
+from manim import LEFT, RIGHT, DOWN, UP, BLUE, GREEN
 
-from manim import config
-from manim import LEFT, RIGHT, DOWN, LIGHT, UP, BLUE, GREEN
+from chillmaths.assets import demonstration, logo, watermark
+from chillmaths.coords import CoordinateMap
+from chillmaths.formats import render_profile
+from chillmaths.quadrature import ChangePanels, RiemannSum
 
 # COLORS
 # BLUE = "#B0E1FA"
@@ -24,26 +26,14 @@ BLACK = "#000000"
 GREY = "#D0D0D0"
 WHITE = "#F4EDDE"
 
-# Make it vertical
-SCALE_FACTOR = 1
-# Flip width => height, height => width
-tmp_pixel_height = config.pixel_height
-config.pixel_height = config.pixel_width
-config.pixel_width = tmp_pixel_height
-# Change coord system dimensions
-config.frame_height = config.frame_height / SCALE_FACTOR
-config.frame_width = config.frame_height * 9 / 16
-
 
+@render_profile("vertical")
 class Series(MovingCameraScene):
     def construct(self):
         self.camera.background_color = WHITE
         self.camera.frame.save_state()
 
-        txt_copy = Text(
-            r"@chill.maths", font_size=12,
-            font="CMU Typewriter Text", weight=LIGHT, color=BLACK
-        ).to_edge(RIGHT + DOWN, buff=0.1)
+        txt_copy = watermark()
         self.add(txt_copy)
 
         # Introduction text
@@ -53,11 +43,7 @@ class Series(MovingCameraScene):
         ]
         txt_title = VGroup(*txt_title).arrange(DOWN).move_to([0, 2, 0])
 
-        txt = [
-            Tex(r"Démonstration", font_size=36, color=BLACK),
-            Tex(r"Matt Hudelson", font_size=28, color=BLACK)
-        ]
-        txt = VGroup(*txt).arrange(DOWN)
+        txt = demonstration(r"Matt Hudelson")
 
         self.add(
             txt_title,
@@ -70,21 +56,11 @@ class Series(MovingCameraScene):
         )
 
         # Create the graph
-        ax = NumberPlane(
+        ax = CoordinateMap(
             x_range = (1, 2, 0.1),
             y_range = (0, 1, 0.1),
             x_length = 5,
             y_length = 5,
-            axis_config={
-                "include_numbers": False,
-                "color": WHITE,
-                "stroke_width": 0,
-            },
-            background_line_style={
-                "stroke_color": WHITE,
-                "stroke_width": 0,
-                "stroke_opacity": 0
-            }
         ).scale(0.5).move_to([0, 1, 0])
 
         # Create the square
@@ -255,17 +231,16 @@ class Series(MovingCameraScene):
             .next_to(txt_17, RIGHT, buff=0.1)
         self.play(Write(txt_points))
 
-        rectangles = VGroup(square_1, square_13, square_15, square_17)
-        x_vals = np.arange(1, 2.01, 0.01)
-        points = [
-            graph.get_point_from_function(x) for x in x_vals
-        ]
-        region_under = Polygon(
-            *[ax.c2p(1, 0), *points, ax.c2p(2, 0)],
+        # The squares are the left sum of 1/x with 4 panels, refined to the
+        # area under the curve
+        rectangles = RiemannSum(
+            ax, lambda x: 1 / x, (1, 2), 4, rule="left",
             stroke_width=0,
             fill_color=RED,
             fill_opacity=0.8
         )
+        self.remove(square_1, square_13, square_15, square_17)
+        self.add(rectangles)
         txt_group = VGroup(
             txt_1, txt_12, txt_13, txt_14, txt_15, txt_16, txt_17
         )
@@ -273,7 +248,7 @@ class Series(MovingCameraScene):
             r"$= \int_1^2 \frac{1}{x} dx = \ln(2)$", font_size=28, color=BLACK)\
             .next_to(txt_group.get_center(), DOWN, buff=0.5)
         self.play(
-            Transform(rectangles, region_under),
+            ChangePanels(rectangles, 2000),
             Write(txt_area)
         )
 
@@ -292,16 +267,7 @@ class Series(MovingCameraScene):
 
         self.play(Write(ref))
 
-        text = Text(
-            "chill.maths", font="CMU Typewriter Text", weight=LIGHT, color=BLACK
-        )
-        # Ajouter un élément mathématique, par exemple une sinusoïde
-        sine_wave = FunctionGraph(
-            lambda x: 0.1 * np.sin(2 * np.pi * x),
-            x_range=[-3, 3],
-            color=BLACK
-        )
-        sine_wave.next_to(text, DOWN, buff=0.2)
+        text, sine_wave = logo()
         
         self.play(
             FadeIn(text, scale=0.5),
@@ -6,13 +6,16 @@ import numpy as np
 
 from manim import MovingCameraScene, Scene, ManimColor
 from manim import Create, Uncreate, Write, Transform, TransformFromCopy
-from manim import VGroup, FadeIn, FadeOut , FunctionGraph, Rotate
+from manim import VGroup, FadeIn, FadeOut, Rotate
 from manim import Line, Point, Polygon, RoundedRectangle, Circle, Angle
 from manim import line_intersection, DashedLine, RightAngle
 from manim import Text, Tex, Intersection, LaggedStart
 
-from manim import config
-from manim import ORIGIN, LEFT, RIGHT, DOWN, LIGHT, UP, PI, DEGREES
+from manim import ORIGIN, LEFT, RIGHT, DOWN, UP, PI, DEGREES
+
+from chillmaths.assets import demonstration, logo, watermark
+from chillmaths.formats import render_profile
+from chillmaths.glyphs import GlyphLabel
 
 # COLORS
 BLUE = "#B0E1FA"
@@ -24,16 +27,8 @@ ORANGE = "#F6CCB0"
 BLACK = "#000000"
 WHITE = "#F4EDDE"
 
-# Make it vertical
-SCALE_FACTOR = 1
-# Flip width => height, height => width
-tmp_pixel_height = config.pixel_height
-config.pixel_height = config.pixel_width
-config.pixel_width = tmp_pixel_height
-# Change coord system dimensions
-config.frame_height = config.frame_height / SCALE_FACTOR
-config.frame_width = config.frame_height * 9 / 16
 
+@render_profile("vertical")
 class DynamicTriangleCircles(Scene):
     def __init__(self, num_circles=10, **kwargs):
         self.num_circles = num_circles
@@ -101,7 +96,7 @@ class DynamicTriangleCircles(Scene):
             circle.move_to(pos)
             
             # Add number label
-            label = Text(str(i+1), font_size=16, color=WHITE)
+            label = GlyphLabel(str(i+1), font_size=16, color=WHITE)
             label.move_to(circle.get_center())
             
             circle_with_label = VGroup(circle, label)
@@ -153,15 +148,13 @@ class DynamicTriangleCircles(Scene):
         return triangle
 
 
+@render_profile("vertical")
 class Proof(MovingCameraScene):
     def construct(self):
         self.camera.background_color = WHITE
         self.camera.frame.save_state()
 
-        txt_copy = Text(
-            r"@chill.maths", font_size=12,
-            font="CMU Typewriter Text", weight=LIGHT, color=BLACK
-        ).to_edge(RIGHT + DOWN, buff=0.1)
+        txt_copy = watermark()
         self.add(txt_copy)
 
         # Introduction text
@@ -171,11 +164,7 @@ class Proof(MovingCameraScene):
         ]
         txt_title = VGroup(*txt_title).arrange(DOWN).move_to([0, 2, 0])
 
-        txt = [
-            Tex(r"Démonstration", font_size=36, color=BLACK),
-            Tex(r"M. Haines \& M. Jones", font_size=28, color=BLACK)
-        ]
-        txt = VGroup(*txt).arrange(DOWN)
+        txt = demonstration(r"M. Haines \& M. Jones")
 
         self.add(
             txt_title,
@@ -424,16 +413,7 @@ class Proof(MovingCameraScene):
         
         self.play(Write(ref))
 
-        text = Text(
-            "chill.maths", font="CMU Typewriter Text", weight=LIGHT, color=BLACK
-        )
-        # Ajouter un élément mathématique, par exemple une sinusoïde
-        sine_wave = FunctionGraph(
-            lambda x: 0.1 * np.sin(2 * np.pi * x),
-            x_range=[-3, 3],
-            color=BLACK
-        )
-        sine_wave.next_to(text, DOWN, buff=0.2)
+        text, sine_wave = logo()
         
         self.play(
             FadeIn(text, scale=0.5),
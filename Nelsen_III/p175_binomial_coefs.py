@@ -2,15 +2,17 @@
 Visual proof of a Graph theoric decomposition of binomial coefficients.
 Proofs without Words III. Roger B. Nelsen. p. 175.
 """
-import numpy as np
-
 from manim import MovingCameraScene
 from manim import Create, Uncreate, Write
-from manim import VGroup, FadeIn, FadeOut, FunctionGraph, Graph
-from manim import Text, Tex, MathTex, Transform, RoundedRectangle
+from manim import VGroup, FadeIn, FadeOut
+from manim import Tex, RoundedRectangle
+
+from manim import LEFT, DOWN, UP
 
-from manim import config
-from manim import LEFT, RIGHT, DOWN, LIGHT, UP, PI
+from chillmaths import graphs
+from chillmaths.assets import demonstration, logo, watermark
+from chillmaths.formats import render_profile
+from chillmaths.graphs import CompactGraph, RecolorEdges
 
 # COLORS
 BLUE = "#B0E1FA"
@@ -23,26 +25,14 @@ BLACK = "#000000"
 GREY = "#D3D3D3"
 WHITE = "#F4EDDE"
 
-# Make it vertical
-SCALE_FACTOR = 1
-# Flip width => height, height => width
-tmp_pixel_height = config.pixel_height
-config.pixel_height = config.pixel_width
-config.pixel_width = tmp_pixel_height
-# Change coord system dimensions
-config.frame_height = config.frame_height / SCALE_FACTOR
-config.frame_width = config.frame_height * 9 / 16
-
 
+@render_profile("vertical")
 class Graphe(MovingCameraScene):
     def construct(self):
         self.camera.background_color = WHITE
         self.camera.frame.save_state()
 
-        txt_copy = Text(
-            r"@chill.maths", font_size=12,
-            font="CMU Typewriter Text", weight=LIGHT, color=BLACK
-        ).to_edge(RIGHT + DOWN, buff=0.1)
+        txt_copy = watermark()
         self.add(txt_copy)
 
         # Introduction text
@@ -52,11 +42,7 @@ class Graphe(MovingCameraScene):
         ]
         txt_title = VGroup(*txt_title).arrange(DOWN).move_to([0, 2, 0])
 
-        txt = [
-            Tex(r"Démonstration", font_size=36, color=BLACK),
-            Tex(r"Joe DeMaio", font_size=28, color=BLACK)
-        ]
-        txt = VGroup(*txt).arrange(DOWN)
+        txt = demonstration(r"Joe DeMaio")
 
         formula = Tex(
             r"$\binom{n + m}{2} = \binom{n}{2} + \binom{m}{2} + nm$",
@@ -82,22 +68,8 @@ class Graphe(MovingCameraScene):
 
         # k = 8
         vertices = ["1", "2", "3", "4", "5", "A", "B", "C"]
-        edges = [(i, j) for i in vertices for j in vertices]
-        g = Graph(
-            vertices,
-            edges,
-            layout='circular',
-            labels={
-                    v: MathTex(v, color=BLACK, font_size=14) for v in vertices
-                },
-            vertex_config={
-                idx: {"fill_color": GREY} for idx in vertices
-            },
-            edge_config={
-                (i, j): {"color": BLACK, "stroke_width": 1}
-                for i in vertices for j in vertices
-            }
-        )
+        numbers, letters = vertices[:5], vertices[5:]
+        g = CompactGraph(*graphs.complete(8), vertices, vertex_color=GREY)
         txt_g = Tex(
             r"$\binom{n + m}{2}$", font_size=36, color=BLACK
         ).move_to(g.get_center_of_mass())
@@ -121,22 +93,8 @@ class Graphe(MovingCameraScene):
         )
 
         # k = 5
-        vertices_5 = ["1", "2", "3", "4", "5"]
-        edges_5 = [(i, j) for i in vertices_5 for j in vertices_5]
-        g_5 = Graph(
-            vertices_5,
-            edges_5,
-            layout='circular',
-            labels={
-                    v: MathTex(v, color=BLACK, font_size=14) for v in vertices_5
-                },
-            vertex_config={
-                idx: {"fill_color": GREY} for idx in vertices_5
-            },
-            edge_config={
-                (i, j): {"color": BLACK, "stroke_width": 1}
-                for i in vertices_5 for j in vertices_5
-            }
+        g_5 = CompactGraph(
+            *graphs.complete(5), numbers, vertex_color=GREY
         ).move_to([0, -1.5, 0])
         txt_g5 = Tex(
             r"$\binom{n}{2}$", font_size=36, color=BLACK
@@ -160,22 +118,8 @@ class Graphe(MovingCameraScene):
         )
 
         # k = 3
-        vertices_3 = ["A", "B", "C"]
-        edges_3 = [(i, j) for i in vertices_3 for j in vertices_3]
-        g_3 = Graph(
-            vertices_3,
-            edges_3,
-            layout='circular',
-            labels={
-                    v: MathTex(v, color=BLACK, font_size=14) for v in vertices_3
-                },
-            vertex_config={
-                idx: {"fill_color": GREY} for idx in vertices_3
-            },
-            edge_config={
-                (i, j): {"color": BLACK, "stroke_width": 1}
-                for i in vertices_3 for j in vertices_3
-            }
+        g_3 = CompactGraph(
+            *graphs.complete(3), letters, vertex_color=GREY
         ).move_to([0, -1.5, 0])
         txt_g3 = Tex(
             r"$\binom{m}{2}$", font_size=36, color=BLACK
@@ -200,24 +144,14 @@ class Graphe(MovingCameraScene):
 
 
         # k = 3*5
-        vertices_35 = ["1", "2", "3", "4", "5", "A", "B", "C"]
-        edges_35 = [(i, j) for i in vertices_35[:5] for j in vertices_35[5:]]
-        label_35 = {
-            v: MathTex(v, color=BLACK, font_size=14).rotate(-PI/2) for v in vertices_35
-        }
-        g_35 = Graph(
-            vertices_35,
-            edges_35,
-            layout="partite",
-            partitions=[["1", "2", "4", "3", "5"], ["C", "A", "B"]],
-            labels=label_35,
-            vertex_config={
-                idx: {"fill_color": GREY} for idx in vertices_35
-            },
-            edge_config={
-                (i, j): {"color": BLACK, "stroke_width": 1}
-                for i in vertices_35[:5] for j in vertices_35[5:]
-            }
+        # The partitions of the former partite layout, which was turned a
+        # quarter turn: each row is laid out from right to left.
+        partitions = [["1", "2", "4", "3", "5"], ["C", "A", "B"]]
+        slots = [v for partition in partitions for v in reversed(partition)]
+        positions, edges = graphs.complete_bipartite(5, 3)
+        g_35 = CompactGraph(
+            positions[[slots.index(v) for v in vertices]], edges, vertices,
+            vertex_color=GREY
         ).move_to([0, -1.5, 0])
         txt_g35 = Tex(
             r"$nm$", font_size=36, color=BLACK
@@ -229,7 +163,7 @@ class Graphe(MovingCameraScene):
             fill_color=WHITE, fill_opacity=1
         ).move_to(g_35.get_center_of_mass())
         self.play(
-            Create(g_35.rotate(PI/2)),
+            Create(g_35),
             FadeIn(rect_g35),
             Write(txt_g35)
         )
@@ -240,46 +174,17 @@ class Graphe(MovingCameraScene):
         )
 
         # Color edges
-        g_5_c = g_5.copy()
-        g_c = g.copy()
-        for idx, line in g_5_c.edges.items():
-            line.set_color(BLUE)
-        for idx, line in g_c.edges.items():
-            if (
-                idx[0] in ["1", "2", "3", "4", "5"] and
-                idx[1] in ["1", "2", "3", "4", "5"]
-            ):
-                line.set_color(BLUE)
         self.play(
-            Transform(g, g_c),
-            Transform(g_5, g_5_c)
+            RecolorEdges(g, g.edge_mask(numbers), BLUE),
+            RecolorEdges(g_5, g_5.edge_mask(numbers), BLUE)
         )
-
-        g_3_c = g_3.copy()
-        g_cc = g_c.copy()
-        for idx, line in g_3_c.edges.items():
-            line.set_color(RED)
-        for idx, line in g_cc.edges.items():
-            if idx[0] in ["A", "B", "C"] and idx[1] in ["A", "B", "C"]:
-                line.set_color(RED)
         self.play(
-            Transform(g_c, g_cc),
-            Transform(g_3, g_3_c)
+            RecolorEdges(g, g.edge_mask(letters), RED),
+            RecolorEdges(g_3, g_3.edge_mask(letters), RED)
         )
-
-        g_35_c = g_35.copy()
-        g_ccc = g_cc.copy()
-        for idx, line in g_35_c.edges.items():
-            line.set_color(VIOLET)
-        for idx, line in g_ccc.edges.items():
-            if (
-                (idx[0] in ["A", "B", "C"] and idx[1] in ["1", "2", "3", "4", "5"]) or
-                (idx[0] in ["1", "2", "3", "4", "5"] and idx[1] in ["A", "B", "C"])
-            ):
-                line.set_color(VIOLET)
         self.play(
-            Transform(g_cc, g_ccc),
-            Transform(g_35, g_35_c)
+            RecolorEdges(g, g.edge_mask(numbers, letters), VIOLET),
+            RecolorEdges(g_35, g_35.edge_mask(numbers, letters), VIOLET)
         )
 
         # Finish
@@ -297,16 +202,7 @@ class Graphe(MovingCameraScene):
 
         self.play(Write(ref))
 
-        text = Text(
-            "chill.maths", font="CMU Typewriter Text", weight=LIGHT, color=BLACK
-        )
-        # Ajouter un élément mathématique, par exemple une sinusoïde
-        sine_wave = FunctionGraph(
-            lambda x: 0.1 * np.sin(2 * np.pi * x),
-            x_range=[-3, 3],
-            color=BLACK
-        )
-        sine_wave.next_to(text, DOWN, buff=0.2)
+        text, sine_wave = logo()
         
         self.play(
             FadeIn(text, scale=0.5),
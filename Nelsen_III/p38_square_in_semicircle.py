@@ -7,13 +7,16 @@ import numpy as np
 
 from manim import MovingCameraScene
 from manim import Create, Uncreate, Write, Transform, TransformFromCopy
-from manim import VGroup, FadeIn, FadeOut , FunctionGraph, Rotate
+from manim import VGroup, FadeIn, FadeOut, Rotate
 from manim import Line, Point, Polygon, RoundedRectangle, Circle
 from manim import line_intersection, DashedLine, Arc, Sector
-from manim import Text, Tex, Intersection, Square, Rectangle
+from manim import Tex, Intersection, Square
 
-from manim import config
-from manim import ORIGIN, LEFT, RIGHT, DOWN, LIGHT, UP, PI, DEGREES
+from manim import ORIGIN, LEFT, RIGHT, DOWN, UP, PI, DEGREES
+
+from chillmaths.assets import demonstration, logo, watermark
+from chillmaths.formats import render_profile
+from chillmaths.grid import SquareGrid
 
 # COLORS
 BLUE = "#B0E1FA"
@@ -25,16 +28,6 @@ ORANGE = "#F6CCB0"
 BLACK = "#000000"
 WHITE = "#F4EDDE"
 
-# Make it vertical
-SCALE_FACTOR = 1
-# Flip width => height, height => width
-tmp_pixel_height = config.pixel_height
-config.pixel_height = config.pixel_width
-config.pixel_width = tmp_pixel_height
-# Change coord system dimensions
-config.frame_height = config.frame_height / SCALE_FACTOR
-config.frame_width = config.frame_height * 9 / 16
-
 
 def get_vertices(obj: Polygon) -> list[Line]:
     vertices = obj.get_vertices()
@@ -49,15 +42,13 @@ def get_vertices(obj: Polygon) -> list[Line]:
     return coords_vertices
 
 
+@render_profile("vertical")
 class SquareCircle(MovingCameraScene):
     def construct(self):
         self.camera.background_color = WHITE
         self.camera.frame.save_state()
 
-        txt_copy = Text(
-            r"@chill.maths", font_size=12,
-            font="CMU Typewriter Text", weight=LIGHT, color=BLACK
-        ).to_edge(RIGHT + DOWN, buff=0.1)
+        txt_copy = watermark()
         self.add(txt_copy)
 
         # Introduction text
@@ -67,11 +58,7 @@ class SquareCircle(MovingCameraScene):
         ]
         txt_title = VGroup(*txt_title).arrange(DOWN).move_to([0, 2, 0])
 
-        txt = [
-            Tex(r"Démonstration", font_size=36, color=BLACK),
-            Tex(r"Roger B. Nelsen", font_size=28, color=BLACK)
-        ]
-        txt = VGroup(*txt).arrange(DOWN)
+        txt = demonstration(r"Roger B. Nelsen")
 
         self.add(
             txt_title,
@@ -124,15 +111,11 @@ class SquareCircle(MovingCameraScene):
 
 
         # Create a big square consisting of 6 by 6 small squares
-        squares = VGroup()
-        for i in range(36):
-            square = Rectangle(
-                height=0.5, width=0.5,
-                fill_color=WHITE, fill_opacity=0.2,
-                stroke_color=BLACK, stroke_width=1
-            )
-            squares.add(square)
-        squares.arrange_in_grid(rows=6, cols=6, buff=0)
+        squares = SquareGrid(
+            6, 6, side_length=0.5,
+            fill_color=WHITE, fill_opacity=0.2,
+            stroke_color=BLACK, stroke_width=1
+        )
         squares.move_to([0, 0, 0])
         self.play(Create(squares, run_time=2))
 
@@ -163,10 +146,10 @@ class SquareCircle(MovingCameraScene):
 
         # Draw other square
         squares2 = Polygon(
-            squares[7].get_corner(UP + RIGHT),
-            squares[16].get_corner(UP + RIGHT),
-            squares[28].get_corner(DOWN + LEFT),
-            squares[19].get_corner(DOWN + LEFT),
+            squares.get_cell_corner(1, 1, UP + RIGHT),
+            squares.get_cell_corner(2, 4, UP + RIGHT),
+            squares.get_cell_corner(4, 4, DOWN + LEFT),
+            squares.get_cell_corner(3, 1, DOWN + LEFT),
             fill_color=BLUE, fill_opacity=0.5,
             stroke_width=0
         )
@@ -188,16 +171,7 @@ class SquareCircle(MovingCameraScene):
         
         self.play(Write(ref))
 
-        text = Text(
-            "chill.maths", font="CMU Typewriter Text", weight=LIGHT, color=BLACK
-        )
-        # Ajouter un élément mathématique, par exemple une sinusoïde
-        sine_wave = FunctionGraph(
-            lambda x: 0.1 * np.sin(2 * np.pi * x),
-            x_range=[-3, 3],
-            color=BLACK
-        )
-        sine_wave.next_to(text, DOWN, buff=0.2)
+        text, sine_wave = logo()
         
         self.play(
             FadeIn(text, scale=0.5),
@@ -2,15 +2,16 @@
 Visual proof of The Formulas of Strassnitzky.
 Proofs without Words III. Roger B. Nelsen. p. 75.
 """
-import numpy as np
-
 from manim import MovingCameraScene
-from manim import Create, Uncreate, Write, RightAngle, Square, Angle
-from manim import Axes, VGroup, FadeIn, FadeOut, FunctionGraph, Line, Polygon
-from manim import Text, Tex, DashedVMobject, DashedLine, RoundedRectangle
+from manim import Create, Uncreate, Write, RightAngle, Angle
+from manim import Axes, VGroup, FadeIn, FadeOut, Line, Polygon
+from manim import Tex, DashedVMobject, DashedLine, RoundedRectangle
+
+from manim import LEFT, RIGHT, DOWN, UP, PI
 
-from manim import config
-from manim import LEFT, RIGHT, DOWN, LIGHT, UP, PI
+from chillmaths.assets import demonstration, logo, watermark
+from chillmaths.formats import render_profile
+from chillmaths.grid import SquareGrid
 
 # COLORS
 BLUE = "#B0E1FA"
@@ -22,26 +23,14 @@ ORANGE = "#F6CCB0"
 BLACK = "#000000"
 WHITE = "#F4EDDE"
 
-# Make it vertical
-SCALE_FACTOR = 1
-# Flip width => height, height => width
-tmp_pixel_height = config.pixel_height
-config.pixel_height = config.pixel_width
-config.pixel_width = tmp_pixel_height
-# Change coord system dimensions
-config.frame_height = config.frame_height / SCALE_FACTOR
-config.frame_width = config.frame_height * 9 / 16
-
 
+@render_profile("vertical")
 class Formula(MovingCameraScene):
     def construct(self):
         self.camera.background_color = WHITE
         self.camera.frame.save_state()
 
-        txt_copy = Text(
-            r"@chill.maths", font_size=12,
-            font="CMU Typewriter Text", weight=LIGHT, color=BLACK
-        ).to_edge(RIGHT + DOWN, buff=0.1)
+        txt_copy = watermark()
         self.add(txt_copy)
 
         # Introduction text
@@ -51,11 +40,7 @@ class Formula(MovingCameraScene):
         ]
         txt_title = VGroup(*txt_title).arrange(DOWN).move_to([0, 2, 0])
 
-        txt = [
-            Tex(r"Démonstration", font_size=36, color=BLACK),
-            Tex(r"Roger B. Nelsen", font_size=28, color=BLACK)
-        ]
-        txt = VGroup(*txt).arrange(DOWN)
+        txt = demonstration(r"Roger B. Nelsen")
 
         self.add(
             txt_title,
@@ -72,17 +57,8 @@ class Formula(MovingCameraScene):
             .move_to([0, 3, 0])
         self.play(Write(txt_formula))
 
-        # Create 7 by 5 squares
-        squares = VGroup()
-        squares.add(Square(side_length=0.4, color=BLACK, stroke_width=1))
-        for idx in range(9):
-            new_square = Square(side_length=0.4, color=BLACK, stroke_width=1).\
-                next_to(squares[idx], direction=RIGHT, buff=0)
-            squares.add(new_square)
-        for idx in range(70):
-            new_square = Square(side_length=0.4, color=BLACK, stroke_width=1).\
-                next_to(squares[idx], direction=DOWN, buff=0)
-            squares.add(new_square)
+        # Create 8 by 10 squares
+        squares = SquareGrid(8, 10, side_length=0.4)
         squares.move_to([0, 0, 0])
         self.play(
             Create(squares)
@@ -90,19 +66,19 @@ class Formula(MovingCameraScene):
 
         # First triangle
         triangle_1 = Polygon(
-            squares[70].get_boundary_point(DOWN),
-            squares[69].get_boundary_point(RIGHT + UP),
-            squares[79].get_boundary_point(RIGHT + DOWN),
+            squares.get_cell_corner(7, 0, DOWN + LEFT),
+            squares.get_cell_corner(6, 9, UP + RIGHT),
+            squares.get_cell_corner(7, 9, DOWN + RIGHT),
             color=RED, fill_color=RED, fill_opacity=0.5, stroke_width=1
         )
         right_angle_1 = RightAngle(
             Line(
-                squares[79].get_boundary_point(RIGHT + DOWN),
-                squares[69].get_boundary_point(RIGHT + UP)
+                squares.get_cell_corner(7, 9, DOWN + RIGHT),
+                squares.get_cell_corner(6, 9, UP + RIGHT)
             ),
             Line(
-                squares[79].get_boundary_point(RIGHT + DOWN),
-                squares[70].get_boundary_point(DOWN)
+                squares.get_cell_corner(7, 9, DOWN + RIGHT),
+                squares.get_cell_corner(7, 0, DOWN + LEFT)
             ),
             length=0.2, color=BLACK, stroke_width=1
         )
@@ -113,19 +89,19 @@ class Formula(MovingCameraScene):
 
         # Second triangle
         triangle_2 = Polygon(
-            squares[70].get_boundary_point(DOWN),
-            squares[19].get_boundary_point(LEFT),
-            squares[69].get_boundary_point(RIGHT + UP),
+            squares.get_cell_corner(7, 0, DOWN + LEFT),
+            squares.get_cell_corner(1, 9, UP + LEFT),
+            squares.get_cell_corner(6, 9, UP + RIGHT),
             color=BLUE, fill_color=BLUE, fill_opacity=0.5, stroke_width=1
         )
         right_angle_2 = RightAngle(
             Line(
-                squares[69].get_boundary_point(RIGHT + UP),
-                squares[70].get_boundary_point(LEFT)
+                squares.get_cell_corner(6, 9, UP + RIGHT),
+                squares.get_cell_corner(7, 0, UP + LEFT)
             ),
             Line(
-                squares[69].get_boundary_point(RIGHT + UP),
-                squares[19].get_boundary_point(LEFT)
+                squares.get_cell_corner(6, 9, UP + RIGHT),
+                squares.get_cell_corner(1, 9, UP + LEFT)
             ),
             length=0.2, color=BLACK, stroke_width=1
         )
@@ -136,19 +112,19 @@ class Formula(MovingCameraScene):
 
         # Third triangle
         triangle_3 = Polygon(
-            squares[70].get_boundary_point(DOWN),
-            squares[8].get_boundary_point(LEFT),
-            squares[19].get_boundary_point(LEFT),
+            squares.get_cell_corner(7, 0, DOWN + LEFT),
+            squares.get_cell_corner(0, 8, UP + LEFT),
+            squares.get_cell_corner(1, 9, UP + LEFT),
             color=RED, fill_color=RED, fill_opacity=0.5, stroke_width=1
         )
         right_angle_3 = RightAngle(
             Line(
-                squares[8].get_boundary_point(LEFT),
-                squares[70].get_boundary_point(LEFT)
+                squares.get_cell_corner(0, 8, UP + LEFT),
+                squares.get_cell_corner(7, 0, UP + LEFT)
             ),
             Line(
-                squares[8].get_boundary_point(LEFT),
-                squares[19].get_boundary_point(LEFT)
+                squares.get_cell_corner(0, 8, UP + LEFT),
+                squares.get_cell_corner(1, 9, UP + LEFT)
             ),
             length=0.2, color=BLACK, stroke_width=1
         )
@@ -159,19 +135,19 @@ class Formula(MovingCameraScene):
 
         # Fourth triangle
         triangle_4 = Polygon(
-            squares[70].get_boundary_point(DOWN),
-            squares[8].get_boundary_point(LEFT),
-            squares[78].get_boundary_point(DOWN + LEFT),
+            squares.get_cell_corner(7, 0, DOWN + LEFT),
+            squares.get_cell_corner(0, 8, UP + LEFT),
+            squares.get_cell_corner(7, 8, DOWN + LEFT),
             color=BLACK, fill_color=BLACK, fill_opacity=0.5, stroke_width=1
         )
         right_angle_4 = RightAngle(
             Line(
-                squares[78].get_boundary_point(DOWN + LEFT),
-                squares[8].get_boundary_point(LEFT)
+                squares.get_cell_corner(7, 8, DOWN + LEFT),
+                squares.get_cell_corner(0, 8, UP + LEFT)
             ),
             Line(
-                squares[78].get_boundary_point(DOWN + LEFT),
-                squares[70].get_boundary_point(DOWN)
+                squares.get_cell_corner(7, 8, DOWN + LEFT),
+                squares.get_cell_corner(7, 0, DOWN + LEFT)
             ),
             length=0.2, color=BLACK, stroke_width=1
         )
@@ -183,12 +159,12 @@ class Formula(MovingCameraScene):
         # Last angle
         angle = Angle(
             Line(
-                squares[70].get_boundary_point(DOWN),
-                squares[78].get_boundary_point(LEFT + DOWN)
+                squares.get_cell_corner(7, 0, DOWN + LEFT),
+                squares.get_cell_corner(7, 8, DOWN + LEFT)
             ),
             Line(
-                squares[70].get_boundary_point(DOWN),
-                squares[8].get_boundary_point(LEFT)
+                squares.get_cell_corner(7, 0, DOWN + LEFT),
+                squares.get_cell_corner(0, 8, UP + LEFT)
             ),
             radius=0.3, color=WHITE, stroke_width=4
         )
@@ -213,16 +189,7 @@ class Formula(MovingCameraScene):
 
         self.play(Write(ref))
 
-        text = Text(
-            "chill.maths", font="CMU Typewriter Text", weight=LIGHT, color=BLACK
-        )
-        # Ajouter un élément mathématique, par exemple une sinusoïde
-        sine_wave = FunctionGraph(
-            lambda x: 0.1 * np.sin(2 * np.pi * x),
-            x_range=[-3, 3],
-            color=BLACK
-        )
-        sine_wave.next_to(text, DOWN, buff=0.2)
+        text, sine_wave = logo()
         
         self.play(
             FadeIn(text, scale=0.5),
@@ -6,12 +6,15 @@ import numpy as np
 
 from manim import MovingCameraScene
 from manim import Create, Uncreate, Write
-from manim import Arc, Arrow, Axes, VGroup, FadeIn, FadeOut, FunctionGraph, Angle
-from manim import Text, Tex, RoundedRectangle, Rectangle, Line, RightAngle, Polygon
+from manim import Arc, Arrow, Axes, VGroup, FadeIn, FadeOut, Angle
+from manim import Tex, RoundedRectangle, Rectangle, Line, RightAngle, Polygon
 from manim import TransformFromCopy, Transform
 
-from manim import config
-from manim import LEFT, RIGHT, DOWN, LIGHT, UP, PI
+from manim import LEFT, RIGHT, DOWN, UP, PI
+
+from chillmaths.assets import demonstration, logo, watermark
+from chillmaths.formats import render_profile
+from chillmaths.sampling import AdaptiveGraph, graph_points
 
 # COLORS
 BLUE = "#B0E1FA"
@@ -24,26 +27,14 @@ BLACK = "#000000"
 GREY = "#D3D3D3"
 WHITE = "#F4EDDE"
 
-# Make it vertical
-SCALE_FACTOR = 1
-# Flip width => height, height => width
-tmp_pixel_height = config.pixel_height
-config.pixel_height = config.pixel_width
-config.pixel_width = tmp_pixel_height
-# Change coord system dimensions
-config.frame_height = config.frame_height / SCALE_FACTOR
-config.frame_width = config.frame_height * 9 / 16
-
 
+@render_profile("vertical")
 class Log(MovingCameraScene):
     def construct(self):
         self.camera.background_color = WHITE
         self.camera.frame.save_state()
 
-        txt_copy = Text(
-            r"@chill.maths", font_size=12,
-            font="CMU Typewriter Text", weight=LIGHT, color=BLACK
-        ).to_edge(RIGHT + DOWN, buff=0.18)
+        txt_copy = watermark(buff=0.18)
         self.add(txt_copy)
 
         # Introduction text
@@ -53,11 +44,7 @@ class Log(MovingCameraScene):
         ]
         txt_title = VGroup(*txt_title).arrange(DOWN).move_to([0, 2, 0])
 
-        txt = [
-            Tex(r"Démonstration", font_size=36, color=BLACK),
-            Tex(r"Roger B. Nelsen", font_size=28, color=BLACK)
-        ]
-        txt = VGroup(*txt).arrange(DOWN)
+        txt = demonstration(r"Roger B. Nelsen")
 
         self.add(
             txt_title,
@@ -89,9 +76,10 @@ class Log(MovingCameraScene):
             }
         ).move_to([0.15, 0.58, 0])
 
-        log_curve = axes.plot(
+        log_curve = AdaptiveGraph(
             np.log,
-            x_range=[0.78, 5.55],
+            (0.78, 5.55),
+            axes=axes,
             color="#252324",
             stroke_width=2.6,
             use_smoothing=True
@@ -110,10 +98,7 @@ class Log(MovingCameraScene):
         inverse_area = Polygon(
             axes.c2p(0, ln_a),
             axes.c2p(a, ln_a),
-            *[
-                axes.c2p(x, np.log(x))
-                for x in np.linspace(a, b, 80)
-            ],
+            *graph_points(np.log, (a, b), axes),
             axes.c2p(0, ln_b),
             fill_color=RED,
             fill_opacity=0.55,
@@ -350,16 +335,7 @@ class Log(MovingCameraScene):
 
         self.play(Write(ref))
 
-        text = Text(
-            "chill.maths", font="CMU Typewriter Text", weight=LIGHT, color=BLACK
-        )
-        # Ajouter un élément mathématique, par exemple une sinusoïde
-        sine_wave = FunctionGraph(
-            lambda x: 0.1 * np.sin(2 * np.pi * x),
-            x_range=[-3, 3],
-            color=BLACK
-        )
-        sine_wave.next_to(text, DOWN, buff=0.2)
+        text, sine_wave = logo()
         
         self.play(
             FadeIn(text, scale=0.5),
@@ -6,12 +6,16 @@ import numpy as np
 
 from manim import MovingCameraScene
 from manim import Create, Uncreate, Write
-from manim import Arc, Arrow, Axes, VGroup, FadeIn, FadeOut, FunctionGraph, Angle
-from manim import Text, Tex, RoundedRectangle, Rectangle, Line, RightAngle, Polygon
+from manim import Arc, Arrow, Axes, VGroup, FadeIn, FadeOut, Angle
+from manim import Tex, RoundedRectangle, Rectangle, Line, RightAngle, Polygon
 from manim import TransformFromCopy, Transform
 
 from manim import config
-from manim import LEFT, RIGHT, DOWN, LIGHT, UP, PI
+from manim import LEFT, DOWN, UP, PI
+
+from chillmaths.assets import demonstration, logo, watermark
+from chillmaths.formats import render_profile
+from chillmaths.sampling import parametric_points
 
 # COLORS
 BLUE = "#B0E1FA"
@@ -24,26 +28,14 @@ BLACK = "#000000"
 GREY = "#D3D3D3"
 WHITE = "#F4EDDE"
 
-# Make it vertical
-SCALE_FACTOR = 1
-# Flip width => height, height => width
-tmp_pixel_height = config.pixel_height
-config.pixel_height = config.pixel_width
-config.pixel_width = tmp_pixel_height
-# Change coord system dimensions
-config.frame_height = config.frame_height / SCALE_FACTOR
-config.frame_width = config.frame_height * 9 / 16
-
 
+@render_profile("vertical")
 class Proof(MovingCameraScene):
     def construct(self):
         self.camera.background_color = WHITE
         self.camera.frame.save_state()
 
-        txt_copy = Text(
-            r"@chill.maths", font_size=12,
-            font="CMU Typewriter Text", weight=LIGHT, color=BLACK
-        ).to_edge(RIGHT + DOWN, buff=0.1)
+        txt_copy = watermark()
         self.add(txt_copy)
 
         # Introduction text
@@ -53,11 +45,7 @@ class Proof(MovingCameraScene):
         ]
         txt_title = VGroup(*txt_title).arrange(DOWN).move_to([0, 2, 0])
 
-        txt = [
-            Tex(r"Démonstration", font_size=36, color=BLACK),
-            Tex(r"Nick Lord", font_size=28, color=BLACK)
-        ]
-        txt = VGroup(*txt).arrange(DOWN)
+        txt = demonstration(r"Nick Lord")
 
         formula = Tex(
             r"$\int \cos^2 \theta d\theta = \frac{\theta}{2} + \frac{1}{4} \sin 2\theta$",
@@ -116,10 +104,9 @@ class Proof(MovingCameraScene):
                 )
             )
 
-        arc_points = [
-            p(1 + np.cos(theta), np.sin(theta))
-            for theta in np.linspace(PI, 0, 80)
-        ]
+        arc_points = parametric_points(
+            lambda theta: p(1 + np.cos(theta), np.sin(theta)), (PI, 0)
+        )
         shaded_region = Polygon(
             *arc_points,
             fill_color="#D8D8D8",
@@ -325,16 +312,7 @@ class Proof(MovingCameraScene):
 
         self.play(Write(ref))
 
-        text = Text(
-            "chill.maths", font="CMU Typewriter Text", weight=LIGHT, color=BLACK
-        )
-        # Ajouter un élément mathématique, par exemple une sinusoïde
-        sine_wave = FunctionGraph(
-            lambda x: 0.1 * np.sin(2 * np.pi * x),
-            x_range=[-3, 3],
-            color=BLACK
-        )
-        sine_wave.next_to(text, DOWN, buff=0.2)
+        text, sine_wave = logo()
         
         self.play(
             FadeIn(text, scale=0.5),
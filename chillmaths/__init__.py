@@ -0,0 +1,7 @@
+"""
+Shared tooling for the chill.maths videos.
+"""
+from pathlib import Path
+
+# Root of the repository, the book folders live just under it.
+ROOT = Path(__file__).resolve().parent.parent
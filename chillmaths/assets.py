@@ -0,0 +1,69 @@
+"""
+Mobjects shared by every scene: watermark, title block and closing logo.
+
+They are built once per process and memoised by (text, font, size, color),
+the sine wave by the resolution too, as its samples follow the pixel size;
+each call hands out a copy, so the scenes are free to move or animate it.
+"""
+from functools import lru_cache
+
+import numpy as np
+
+from manim import Tex, Text, VGroup
+from manim import DOWN, RIGHT, LIGHT
+
+from chillmaths.sampling import AdaptiveGraph, pixel_tolerance
+from chillmaths.style import BLACK, FONT
+
+
+@lru_cache(maxsize=None)
+def _text(text, font, font_size, color, weight):
+    return Text(
+        text, font=font, font_size=font_size, weight=weight, color=color
+    )
+
+
+@lru_cache(maxsize=None)
+def _tex(tex_string, font_size, color):
+    return Tex(tex_string, font_size=font_size, color=color)
+
+
+def _sine(x):
+    return 0.1 * np.sin(2 * np.pi * x)
+
+
+@lru_cache(maxsize=None)
+def _sine_wave(color, tolerance):
+    return AdaptiveGraph(_sine, (-3, 3), tolerance=tolerance, color=color)
+
+
+def text(text, font=FONT, font_size=48, color=BLACK, weight=LIGHT):
+    """Memoised `Text`, light weight in the typewriter font by default."""
+    return _text(text, font, font_size, color, weight).copy()
+
+
+def tex(tex_string, font_size=48, color=BLACK):
+    """Memoised single string `Tex`."""
+    return _tex(tex_string, font_size, color).copy()
+
+
+def watermark(buff=0.1):
+    """The `@chill.maths` signature in the bottom right corner."""
+    return text(r"@chill.maths", font_size=12)\
+        .to_edge(RIGHT + DOWN, buff=buff)
+
+
+def demonstration(author, title=r"Démonstration"):
+    """The "Démonstration / author" block shown after the title."""
+    return VGroup(
+        tex(title, font_size=36),
+        tex(author, font_size=28)
+    ).arrange(DOWN)
+
+
+def logo():
+    """The closing "chill.maths" text and the sine wave below it."""
+    txt = text("chill.maths")
+    sine_wave = _sine_wave(BLACK, pixel_tolerance()).copy()
+    sine_wave.next_to(txt, DOWN, buff=0.2)
+    return txt, sine_wave
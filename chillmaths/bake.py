@@ -0,0 +1,302 @@
+"""
+Bake a scene into a timeline that can be played back without its code.
+
+Usage:
+    python -m chillmaths.bake [-q h] [--rate 60] FILE SCENE
+
+`construct()` runs once, as for a render, but no frame is drawn: at each
+frame of each animation the display list (the VMobjects in drawing order,
+with their points and style as the camera draws them, projected and shaded
+by a `ThreeDCamera`) and the camera frame are recorded instead, and
+a static `self.wait()` is a single sample held for its duration. The samples
+share a pool of mobject states, so a mobject unchanged from one frame to the
+next is stored once. The timeline is written as a compressed ``.npz`` in
+``media/baked``, with the animations, rate functions and run times of each
+call as metadata.
+
+`chillmaths.player` rasterises that file at any resolution and frame rate,
+without manim nor the scene module; the file is loaded back and its first
+frame drawn once baked, to catch a timeline the player could not read.
+"""
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+
+from pathlib import Path
+
+import numpy as np
+
+from manim import logger
+from manim import ManimColor, ThreeDCamera, VMobject
+from manim.renderer.cairo_renderer import CairoRenderer
+from manim.utils.iterables import list_update
+
+from chillmaths import ROOT
+from chillmaths.player import FORMAT_VERSION, STYLE_COLUMNS, Baked
+
+BAKED_DIR = "baked"
+
+
+def style_row(vmobject, camera) -> np.ndarray:
+    """The style of a VMobject as drawn by `camera`, in the columns of
+    `STYLE_COLUMNS`. Gradients, as the shading of a `ThreeDCamera`, keep
+    their first colour."""
+    return np.array([
+        *camera.get_fill_rgbas(vmobject)[0],
+        *camera.get_stroke_rgbas(vmobject)[0],
+        vmobject.get_stroke_width(),
+        *camera.get_stroke_rgbas(vmobject, background=True)[0],
+        vmobject.get_stroke_width(background=True),
+        vmobject.joint_type.value,
+        vmobject.cap_style.value,
+    ], dtype=np.float32)
+
+
+class Timeline:
+    """Samples of the display list of a scene, over a pool of mobject
+    states (points and style)."""
+    def __init__(self):
+        self.points = []
+        self.styles = []
+        self.states = {}
+        self.times = []
+        self.cameras = []
+        self.sample_segments = []
+        self.sample_items = []
+        self.segments = []
+
+    def state(self, vmobject, camera) -> int:
+        """Index of the current state of a VMobject, as drawn by `camera`,
+        in the pool."""
+        points = camera.transform_points_pre_display(vmobject, vmobject.points)
+        points = np.ascontiguousarray(points[:, :2], dtype=np.float32)
+        style = style_row(vmobject, camera)
+        key = hashlib.blake2b(
+            points.tobytes() + style.tobytes(), digest_size=16
+        ).digest()
+        index = self.states.get(key)
+        if index is None:
+            index = self.states[key] = len(self.points)
+            self.points.append(points)
+            self.styles.append(style)
+        return index
+
+    def begin_segment(self, start, scene, hold):
+        self.segments.append({
+            "start": start,
+            "run_time": scene.duration,
+            "hold": hold,
+            "animations": [
+                {
+                    "animation": type(animation).__name__,
+                    "mobject": type(animation.mobject).__name__,
+                    "rate_func": getattr(
+                        animation.rate_func, "__name__", "rate_func"
+                    ),
+                    "run_time": animation.run_time,
+                }
+                for animation in scene.animations
+            ],
+        })
+
+    def sample(self, time, camera, mobjects):
+        self.times.append(time)
+        self.cameras.append([
+            *camera.frame_center[:2], camera.frame_width, camera.frame_height,
+        ])
+        self.sample_segments.append(len(self.segments) - 1)
+        self.sample_items.append([
+            self.state(mobject, camera) for mobject in mobjects
+            if len(mobject.points)
+        ])
+
+    def arrays(self) -> dict:
+        """The timeline as the arrays of the baked file."""
+        point_counts = [len(points) for points in self.points]
+        item_counts = [len(items) for items in self.sample_items]
+        return {
+            "points": np.concatenate(self.points or [np.zeros((0, 2), np.float32)]),
+            "point_starts": np.cumsum([0, *point_counts]),
+            "styles": np.array(self.styles, dtype=np.float32).reshape(
+                -1, len(STYLE_COLUMNS)
+            ),
+            "times": np.array(self.times),
+            "cameras": np.array(self.cameras, dtype=np.float32).reshape(-1, 4),
+            "sample_segments": np.array(self.sample_segments, dtype=np.int32),
+            "items": np.array(
+                [i for items in self.sample_items for i in items], dtype=np.int32
+            ),
+            "item_starts": np.cumsum([0, *item_counts]),
+        }
+
+
+class BakingRenderer(CairoRenderer):
+    """CairoRenderer recording the display list of each frame in a
+    `Timeline` instead of drawing it. Nothing is written to the movie."""
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.timeline = Timeline()
+        self.skipped_mobjects = set()
+        self.duration = 0.0
+
+    def _sample(self, scene):
+        if isinstance(self.camera, ThreeDCamera):
+            # As `ThreeDCamera.capture_mobjects`, for the current angles.
+            self.camera.reset_rotation_matrix()
+        mobjects = self.camera.get_mobjects_to_display(
+            list_update(scene.mobjects, scene.foreground_mobjects)
+        )
+        vmobjects = []
+        for mobject in mobjects:
+            if isinstance(mobject, VMobject):
+                vmobjects.append(mobject)
+            elif type(mobject).__name__ not in self.skipped_mobjects:
+                self.skipped_mobjects.add(type(mobject).__name__)
+                logger.warning(
+                    f"{type(mobject).__name__} is not a VMobject, not baked"
+                )
+        self.timeline.sample(self.time, self.camera, vmobjects)
+
+    def play(self, scene, *args, **kwargs):
+        self.skip_animations = False
+        scene.compile_animation_data(*args, **kwargs)
+        hold = scene.is_current_animation_frozen_frame()
+        self.timeline.begin_segment(self.time, scene, hold)
+        scene.begin_animations()
+        if hold:
+            self._sample(scene)
+            self.time += scene.duration
+        else:
+            scene.play_internal()
+        self.num_plays += 1
+
+    def render(self, scene, time, moving_mobjects=None):
+        self._sample(scene)
+        self.time += 1 / self.camera.frame_rate
+
+    def scene_finished(self, scene):
+        self.duration = self.time
+
+    def meta(self) -> dict:
+        camera = self.camera
+        return {
+            "version": FORMAT_VERSION,
+            "frame_rate": camera.frame_rate,
+            "duration": self.duration,
+            "pixel_width": camera.pixel_width,
+            "pixel_height": camera.pixel_height,
+            "background": [
+                # The scenes set it as a hex string, which the camera keeps.
+                *ManimColor.parse(camera.background_color).to_rgb(),
+                camera.background_opacity,
+            ],
+            "segments": self.timeline.segments,
+        }
+
+
+def use_baking_renderer(scene):
+    """Swap the renderer of a freshly created scene for a BakingRenderer."""
+    scene.renderer = BakingRenderer(camera_class=scene.camera_class)
+    scene.renderer.init_scene(scene)
+    return scene
+
+
+def save(path: Path, renderer, **meta) -> Path:
+    """Write the timeline of a baked scene."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "wb") as file:
+        np.savez_compressed(
+            file,
+            meta=np.array(json.dumps({**renderer.meta(), **meta})),
+            **renderer.timeline.arrays(),
+        )
+    return path
+
+
+def check(path: Path) -> Baked:
+    """Load a baked file back as the player does, and check that its arrays
+    agree with each other and that its first frame draws."""
+    from chillmaths.player import draw
+
+    baked = Baked.load(path)
+    samples = len(baked.times)
+    problems = [
+        message for message, ok in (
+            ("no sample", samples > 0),
+            ("point offsets", baked.point_starts[-1] == len(baked.points)),
+            ("state count", len(baked.point_starts) == len(baked.styles) + 1),
+            ("item offsets", baked.item_starts[-1] == len(baked.items)),
+            ("sample count", len(baked.item_starts) == samples + 1),
+            ("camera count", len(baked.cameras) == samples),
+            ("segment count", len(baked.sample_segments) == samples),
+            ("state indices", np.all(baked.items < len(baked.styles))),
+        )
+        if not ok
+    ]
+    if problems:
+        raise ValueError(f"{path} is inconsistent: {', '.join(problems)}")
+    draw(baked, 0.0, 32, 18)
+    return baked
+
+
+def bake(path: str, name: str, quality: str, rate: int, media_dir: str) -> Path:
+    """Run the construction of a scene once and write its timeline."""
+    from manim import config, tempconfig
+    from manim.utils.module_ops import get_module
+
+    from chillmaths.batch import QUALITIES
+
+    os.chdir(ROOT)
+    with tempconfig({
+        "input_file": path,
+        "media_dir": media_dir,
+        "progress_bar": "none",
+        "verbosity": "WARNING",
+        "disable_caching": True,
+    }):
+        config.quality = QUALITIES[quality]
+        config.frame_rate = rate
+        module = get_module(Path(path))
+        scene = use_baking_renderer(getattr(module, name)())
+        scene.render()
+    output = Path(media_dir) / BAKED_DIR / f"{name}.npz"
+    return save(output, scene.renderer, file=path, scene=name)
+
+
+def main(argv=None) -> int:
+    from chillmaths.batch import MEDIA_DIR, QUALITIES
+
+    parser = argparse.ArgumentParser(
+        prog="python -m chillmaths.bake",
+        description="Bake a scene into a timeline for chillmaths.player.",
+    )
+    parser.add_argument("file")
+    parser.add_argument("scene")
+    parser.add_argument(
+        "-q", "--quality", choices=sorted(QUALITIES), default="h",
+        help="default resolution of the playback",
+    )
+    parser.add_argument(
+        "--rate", type=int, default=60, help="samples per second",
+    )
+    parser.add_argument("--media-dir", type=Path, default=MEDIA_DIR)
+    args = parser.parse_args(argv)
+
+    path = Path(args.file).resolve().relative_to(ROOT).as_posix()
+    start = time.perf_counter()
+    output = bake(path, args.scene, args.quality, args.rate, str(args.media_dir))
+    baked = check(output)
+    print(
+        f"Baked {path}::{args.scene} in {time.perf_counter() - start:.1f}s: "
+        f"{output} ({output.stat().st_size / 2**20:.1f} MiB, "
+        f"{len(baked.times)} samples over {baked.meta['duration']:.1f}s)",
+        file=sys.stderr,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,375 @@
+"""
+Render the whole catalogue in parallel.
+
+Usage:
+    python -m chillmaths.batch [-q h] [-j 8] [--changed-only] [FILTER ...]
+    python -m chillmaths.batch --shards 8 FILTER
+
+The scenes are spread over a pool of worker processes, each rendering many
+scenes in turn: the format of a scene is applied for its render only (see
+`chillmaths.formats`), so the workers keep their imports and in-process
+caches from one scene to the next. A JSON report with the wall time,
+the number of frames and the output path of each scene is written at the end.
+
+With `--shards`, the scenes are instead rendered one after the other, each
+split over the whole pool (see `chillmaths.shards`).
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import traceback
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from chillmaths import ROOT
+from chillmaths.cache import DEFAULT_MAX_BYTES, RenderCache, render_key
+from chillmaths.catalogue import (
+    SceneEntry, discover, file_digest, shared_assets_digest
+)
+from chillmaths.formats import PRESETS
+from chillmaths.holds import hold_report, use_hold_writer
+from chillmaths.layers import layer_report, use_layer_cache
+from chillmaths.profile import Profiler, write_profile
+from chillmaths.shards import render_sharded
+from chillmaths.texcache import precompile
+
+# Same flags as the `-q` option of the manim CLI, and the named presets.
+QUALITIES = {
+    "l": "low_quality",
+    "m": "medium_quality",
+    "h": "high_quality",
+    "p": "production_quality",
+    "k": "fourk_quality",
+    **PRESETS,
+}
+
+MEDIA_DIR = ROOT / "media"
+CACHE_DIR = "render_cache"
+STATE_FILE = "batch_state.json"
+REPORT_FILE = "batch_report.json"
+
+
+def movie_frames(path) -> int:
+    """The number of frames encoded in a movie file."""
+    import av
+
+    with av.open(str(path)) as container:
+        stream = container.streams.video[0]
+        if stream.frames:
+            return stream.frames
+        # Containers without a frame count in their header, such as webm.
+        return sum(1 for packet in container.demux(stream) if packet.size)
+
+
+def render_entry(
+    path: str,
+    name: str,
+    quality: str,
+    media_dir: str,
+    cache_dir: str | None = None,
+    cache_max_bytes: int = DEFAULT_MAX_BYTES,
+    dedupe_holds: bool = False,
+    profile: bool = False,
+    layer_cache: bool = False,
+) -> dict:
+    """Render one scene. Runs in a worker process.
+
+    A profiled scene is always rendered, never restored from the cache.
+    """
+    from manim import config, tempconfig
+    from manim.utils.module_ops import get_module
+
+    os.chdir(ROOT)
+    result = {"file": path, "scene": name, "quality": quality}
+    start = time.perf_counter()
+    try:
+        with tempconfig({
+            "input_file": path,
+            "media_dir": media_dir,
+            "progress_bar": "none",
+            "verbosity": "WARNING",
+        }):
+            # The format of the scene is applied on top of the quality when
+            # it is created.
+            config.quality = QUALITIES[quality]
+            module = get_module(Path(path))
+            scene = getattr(module, name)()
+            if layer_cache:
+                use_layer_cache(scene)
+            if dedupe_holds:
+                use_hold_writer(scene)
+            output = scene.renderer.file_writer.movie_file_path
+            cache = key = None
+            if cache_dir is not None and not profile:
+                cache = RenderCache(Path(cache_dir), cache_max_bytes)
+                key = render_key(
+                    Path(path), name, module, config,
+                    dedupe_holds=dedupe_holds, layer_cache=layer_cache,
+                )
+                meta = cache.restore(key, output)
+                if meta is not None:
+                    result.update(
+                        status="cached", frames=meta["frames"],
+                        output=str(output),
+                    )
+                    return result
+            if profile:
+                profiler = Profiler()
+                profiler.render(scene)
+                result["profile"] = str(write_profile(
+                    profiler, media_dir, path, name, quality=quality
+                ))
+            else:
+                scene.render()
+            frames = movie_frames(output)
+            result.update(status="rendered", frames=frames, output=str(output))
+            if dedupe_holds:
+                result.update(hold_report(scene))
+            if layer_cache:
+                result.update(layer_report(scene))
+            if cache is not None:
+                cache.put(key, output, frames=frames)
+    except Exception:
+        result.update(status="failed", error=traceback.format_exc())
+    finally:
+        result["wall_time"] = time.perf_counter() - start
+    return result
+
+
+def load_state(media_dir: Path) -> dict:
+    path = media_dir / STATE_FILE
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def save_state(media_dir: Path, state: dict) -> None:
+    media_dir.mkdir(parents=True, exist_ok=True)
+    (media_dir / STATE_FILE).write_text(
+        json.dumps(state, indent=2, sort_keys=True), encoding="utf-8"
+    )
+
+
+def is_up_to_date(
+    entry: SceneEntry, state: dict, quality: str, assets: str
+) -> bool:
+    """Whether the last successful render of the scene is still valid."""
+    previous = state.get(entry.key)
+    if previous is None:
+        return False
+    return (
+        previous["quality"] == quality
+        and previous["source"] == file_digest(entry.path)
+        and previous["assets"] == assets
+        and Path(previous["output"]).exists()
+    )
+
+
+def select(entries: list[SceneEntry], filters: list[str]) -> list[SceneEntry]:
+    """Keep the entries whose key contains one of the filters."""
+    if not filters:
+        return entries
+    return [e for e in entries if any(f in e.key for f in filters)]
+
+
+def run(
+    entries: list[SceneEntry],
+    quality: str = "h",
+    jobs: int | None = None,
+    changed_only: bool = False,
+    media_dir: Path = MEDIA_DIR,
+    use_cache: bool = True,
+    cache_max_bytes: int = DEFAULT_MAX_BYTES,
+    precompile_tex: bool = True,
+    dedupe_holds: bool = False,
+    profile: bool = False,
+    layer_cache: bool = False,
+    shards: int = 1,
+) -> list[dict]:
+    """Render the entries with a process pool and return the report.
+
+    With `shards` > 1, each scene is split in that many ranges rendered in
+    parallel, and the scenes rendered in turn, without the render cache.
+    """
+    state = load_state(media_dir)
+    assets = shared_assets_digest()
+
+    report, todo = [], []
+    for entry in entries:
+        if changed_only and is_up_to_date(entry, state, quality, assets):
+            previous = state[entry.key]
+            report.append({
+                "file": entry.path.relative_to(ROOT).as_posix(),
+                "scene": entry.name,
+                "quality": quality,
+                "status": "skipped",
+                "wall_time": 0.0,
+                "frames": previous["frames"],
+                "output": previous["output"],
+            })
+        else:
+            todo.append(entry)
+
+    if precompile_tex and todo:
+        from manim import tempconfig
+
+        with tempconfig({"media_dir": str(media_dir)}):
+            stats = precompile(sorted({entry.path for entry in todo}), jobs)
+        print(
+            f"LaTeX: {stats['expressions']} expressions, "
+            f"hit rate {stats['hit_rate']:.0%}, {stats['compiled']} compiled "
+            f"in {stats['batch_time']:.1f}s, "
+            f"~{stats['estimated_time_saved']:.0f}s saved",
+            file=sys.stderr,
+        )
+
+    # The workers are reused: a scene restores the config after its render,
+    # and the tempconfig of render_entry drops anything else it changed.
+    with ProcessPoolExecutor(max_workers=jobs or os.cpu_count()) as pool:
+        if shards > 1:
+            done = (
+                (entry, render_sharded(
+                    pool,
+                    entry.path.relative_to(ROOT).as_posix(),
+                    entry.name,
+                    quality,
+                    str(media_dir),
+                    shards,
+                    dedupe_holds,
+                    layer_cache,
+                ))
+                for entry in todo
+            )
+        else:
+            futures = {
+                pool.submit(
+                    render_entry,
+                    entry.path.relative_to(ROOT).as_posix(),
+                    entry.name,
+                    quality,
+                    str(media_dir),
+                    str(media_dir / CACHE_DIR) if use_cache else None,
+                    cache_max_bytes,
+                    dedupe_holds,
+                    profile,
+                    layer_cache,
+                ): entry
+                for entry in todo
+            }
+            done = (
+                (futures[future], future.result())
+                for future in as_completed(futures)
+            )
+        for entry, result in done:
+            report.append(result)
+            print(
+                f"[{result['status']:>8}] {entry.key} "
+                f"({result['wall_time']:.1f}s)",
+                file=sys.stderr,
+            )
+            if result["status"] in ("rendered", "cached"):
+                state[entry.key] = {
+                    "quality": quality,
+                    "source": file_digest(entry.path),
+                    "assets": assets,
+                    "frames": result["frames"],
+                    "output": result["output"],
+                }
+                save_state(media_dir, state)
+
+    report.sort(key=lambda r: (r["file"], r["scene"]))
+    return report
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m chillmaths.batch",
+        description="Render every scene of the catalogue in parallel.",
+    )
+    parser.add_argument(
+        "filters", nargs="*",
+        help="only render the scenes whose 'file::Scene' key contains one "
+             "of these strings",
+    )
+    parser.add_argument(
+        "-q", "--quality", choices=sorted(QUALITIES), default="h",
+    )
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=None,
+        help="number of worker processes (default: number of cores)",
+    )
+    parser.add_argument(
+        "--changed-only", action="store_true",
+        help="skip the scenes whose source and shared assets did not change "
+             "since their last successful render",
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true",
+        help=f"do not read nor fill the render cache (MEDIA_DIR/{CACHE_DIR})",
+    )
+    parser.add_argument(
+        "--cache-size", type=float, default=DEFAULT_MAX_BYTES / 2**30,
+        help="maximum size of the render cache, in GiB (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--no-tex-precompile", action="store_true",
+        help="do not compile the literal Tex/MathTex of the scenes ahead "
+             "of the renders",
+    )
+    parser.add_argument(
+        "--dedupe-holds", action="store_true",
+        help="encode each static hold as one stretched frame (variable frame "
+             "rate output), the report gives the frames saved per scene",
+    )
+    parser.add_argument(
+        "--layer-cache", action="store_true",
+        help="cache the static mobjects in layers instead of rasterising "
+             "them on every frame (experimental)",
+    )
+    parser.add_argument(
+        "--profile", action="store_true",
+        help="profile the renders (bypasses the render cache), see "
+             "python -m chillmaths.profile --summary",
+    )
+    parser.add_argument(
+        "--shards", type=int, default=1,
+        help="split each scene in this many ranges of animations rendered "
+             "in parallel, the scenes one after the other (no render cache)",
+    )
+    parser.add_argument("--media-dir", type=Path, default=MEDIA_DIR)
+    parser.add_argument(
+        "--report", type=Path, default=None,
+        help=f"path of the JSON report (default: MEDIA_DIR/{REPORT_FILE})",
+    )
+    args = parser.parse_args(argv)
+    if args.shards > 1 and args.profile:
+        parser.error("--profile renders each scene in one piece, not with --shards")
+
+    entries = select(discover(), args.filters)
+    report = run(
+        entries,
+        quality=args.quality,
+        jobs=args.jobs,
+        changed_only=args.changed_only,
+        media_dir=args.media_dir,
+        use_cache=not args.no_cache,
+        cache_max_bytes=int(args.cache_size * 2**30),
+        precompile_tex=not args.no_tex_precompile,
+        dedupe_holds=args.dedupe_holds,
+        profile=args.profile,
+        layer_cache=args.layer_cache,
+        shards=args.shards,
+    )
+
+    report_path = args.report or args.media_dir / REPORT_FILE
+    report_path.parent.mkdir(parents=True, exist_ok=True)
+    report_path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    print(f"Report written in {report_path}", file=sys.stderr)
+    return int(any(r["status"] == "failed" for r in report))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,117 @@
+"""
+Micro-benchmarks of the shared animations against the manim code they replace.
+
+Usage:
+    python -m chillmaths.bench [-n 60] [-r 5] [NAME ...]
+
+Each benchmark plays an animation off-screen, without a scene nor a camera:
+`begin`, one `interpolate` per frame and `finish`, and reports the best time
+of the repeats for each implementation.
+"""
+import argparse
+import sys
+import time
+
+
+def _play(animation, frames):
+    animation.begin()
+    for frame in range(1, frames + 1):
+        animation.interpolate(frame / frames)
+    animation.finish()
+
+
+def _best(make, frames, repeats):
+    times = []
+    for _ in range(repeats):
+        animation = make()
+        start = time.perf_counter()
+        _play(animation, frames)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def rotate_and_color():
+    """`RotateAndColor` against the `Rotate` + `Transform` class the
+    Pythagorean scenes used to define."""
+    from manim import Polygon, Rotate, Square, Transform, VGroup
+    from manim import PI, RIGHT
+
+    from chillmaths.recolor import RotateAndColor
+
+    class TransformRotateAndColor(Rotate, Transform):
+        def __init__(self, mobject, angle, new_color, **kwargs):
+            self.new_color = new_color
+            super().__init__(mobject, angle=angle, **kwargs)
+
+        def create_target(self):
+            target = self.mobject.copy()
+            target.set_fill(self.new_color)
+            target.rotate(
+                self.angle,
+                axis=self.axis,
+                about_point=self.about_point,
+                about_edge=self.about_edge,
+            )
+            return target
+
+    def triangle():
+        return Polygon([0, 0, 0], [3, 0, 0], [0, 4, 0], fill_opacity=0.9)
+
+    def squares():
+        return VGroup(*[
+            Square(0.2, fill_opacity=0.9).shift(0.25 * i * RIGHT)
+            for i in range(100)
+        ])
+
+    cases = {}
+    for name, make in (("triangle", triangle), ("100 squares", squares)):
+        cases[name] = {
+            "Rotate + Transform": lambda make=make: TransformRotateAndColor(
+                make(), PI / 2, "#F79BC5"
+            ),
+            "RotateAndColor": lambda make=make: RotateAndColor(
+                make(), PI / 2, "#F79BC5"
+            ),
+        }
+    return cases
+
+
+BENCHMARKS = {
+    "rotate_and_color": rotate_and_color,
+}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m chillmaths.bench",
+        description="Time the shared animations against manim's.",
+    )
+    parser.add_argument(
+        "names", nargs="*", help=f"benchmarks to run, among {list(BENCHMARKS)}",
+    )
+    parser.add_argument("-n", "--frames", type=int, default=60)
+    parser.add_argument("-r", "--repeats", type=int, default=5)
+    args = parser.parse_args(argv)
+    unknown = set(args.names) - set(BENCHMARKS)
+    if unknown:
+        parser.error(f"unknown benchmarks: {', '.join(sorted(unknown))}")
+
+    for name in args.names or BENCHMARKS:
+        for case, implementations in BENCHMARKS[name]().items():
+            times = {
+                label: _best(make, args.frames, args.repeats)
+                for label, make in implementations.items()
+            }
+            reference = next(iter(times.values()))
+            for label, elapsed in times.items():
+                print(
+                    f"{name} [{case}] {label}: "
+                    f"{1000 * elapsed / args.frames:.3f} ms/frame "
+                    f"(x{reference / elapsed:.1f})",
+                    file=sys.stderr,
+                )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
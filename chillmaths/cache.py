@@ -0,0 +1,159 @@
+"""
+Content-addressed cache of finished renders.
+
+A render is keyed by everything that changes its pixels: the scene source,
+the resolved frame/pixel config, the palette constants of the scene file,
+the fonts it uses and the shared `chillmaths` code. The finished MP4 files
+are stored in a size-bounded LRU directory.
+"""
+import ast
+import hashlib
+import json
+import os
+import re
+import shutil
+import subprocess
+
+from pathlib import Path
+
+from chillmaths.catalogue import parse, shared_assets_digest
+
+# Options of the config that change the output of a scene file.
+CONFIG_KEYS = (
+    "pixel_width", "pixel_height", "frame_width", "frame_height",
+    "frame_rate", "background_color", "background_opacity",
+    "movie_file_extension", "renderer",
+)
+
+HEX_COLOR = re.compile(r"^#[0-9A-Fa-f]{6}$")
+
+DEFAULT_MAX_BYTES = 5 * 2**30
+
+
+def palette(module) -> dict:
+    """The hex colour constants defined in a scene module."""
+    return {
+        name: value
+        for name, value in sorted(vars(module).items())
+        if name.isupper() and isinstance(value, str) and HEX_COLOR.match(value)
+    }
+
+
+def fonts(path: Path) -> list[str]:
+    """The fonts passed as a literal `font=...` argument in a scene file."""
+    found = set()
+    for node in ast.walk(parse(path)):
+        if not isinstance(node, ast.Call):
+            continue
+        for keyword in node.keywords:
+            if keyword.arg == "font" and isinstance(keyword.value, ast.Constant):
+                found.add(keyword.value.value)
+    return sorted(found)
+
+
+def font_file(font: str) -> str:
+    """Identity of the file fontconfig resolves a font name to."""
+    try:
+        path = subprocess.run(
+            ["fc-match", "-f", "%{file}", font],
+            capture_output=True, text=True, check=True
+        ).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+    if not path or not os.path.exists(path):
+        return path
+    stat = os.stat(path)
+    return f"{path}:{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def render_key(path: Path, name: str, module, config, **options) -> str:
+    """Key of a render, to be computed once the scene module is imported.
+
+    `options` are the render options changing the output movie.
+    """
+    import manim
+
+    description = {
+        "version": manim.__version__,
+        "scene": name,
+        "source": hashlib.sha256(path.read_bytes()).hexdigest(),
+        "config": {key: str(config[key]) for key in CONFIG_KEYS},
+        "palette": palette(module),
+        "fonts": {font: font_file(font) for font in fonts(path)},
+        # The shared code the scene builds its mobjects with.
+        "shared_assets": shared_assets_digest(),
+        "options": options,
+    }
+    return hashlib.sha256(
+        json.dumps(description, sort_keys=True).encode()
+    ).hexdigest()
+
+
+class RenderCache:
+    """LRU directory of finished renders, bounded by its total size.
+
+    Each entry is a movie `<key><ext>` next to a `<key>.json` file holding
+    the metadata of the render. The modification time of the movie is used
+    as the last access time.
+    """
+    def __init__(self, directory: Path, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _meta_path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def get(self, key: str) -> tuple[Path, dict] | None:
+        """The cached movie and its metadata, or None on a miss."""
+        meta_path = self._meta_path(key)
+        if not meta_path.exists():
+            return None
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        movie = self.directory / meta["movie"]
+        if not movie.exists():
+            return None
+        os.utime(movie)
+        return movie, meta
+
+    def restore(self, key: str, output: Path) -> dict | None:
+        """Copy a cached movie to `output`, return its metadata on a hit."""
+        hit = self.get(key)
+        if hit is None:
+            return None
+        movie, meta = hit
+        output.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(movie, output)
+        return meta
+
+    def put(self, key: str, movie: Path, **meta) -> None:
+        """Store a finished movie, then evict the least recently used ones."""
+        movie = Path(movie)
+        name = f"{key}{movie.suffix}"
+        tmp = self.directory / f"{name}.tmp"
+        shutil.copyfile(movie, tmp)
+        os.replace(tmp, self.directory / name)
+        meta["movie"] = name
+        self._meta_path(key).write_text(json.dumps(meta), encoding="utf-8")
+        self.evict()
+
+    def evict(self) -> None:
+        entries = []
+        for meta_path in self.directory.glob("*.json"):
+            key = meta_path.stem
+            movies = [
+                p for p in self.directory.glob(f"{key}.*")
+                if p.suffix not in (".json", ".tmp")
+            ]
+            size = sum(p.stat().st_size for p in movies)
+            mtime = max((p.stat().st_mtime for p in movies), default=0)
+            entries.append((mtime, size, key, movies))
+
+        total = sum(size for _, size, _, _ in entries)
+        for _, size, key, movies in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            for path in movies:
+                path.unlink(missing_ok=True)
+            self._meta_path(key).unlink(missing_ok=True)
+            total -= size
@@ -0,0 +1,92 @@
+"""
+Static discovery of the scenes of the catalogue.
+
+The scene files are parsed, not imported: discovering the catalogue does not
+need manim, nor the time to import it.
+"""
+import ast
+import hashlib
+import warnings
+
+from dataclasses import dataclass
+from pathlib import Path
+
+from chillmaths import ROOT
+
+# Folders holding the scenes, relative to the root of the repository.
+SCENE_FOLDERS = ("Nelsen_I", "Nelsen_II", "Nelsen_III", "logo/verticals")
+
+# Files shared by every scene: a change in one of them invalidates all the
+# renders.
+SHARED_ASSETS = ("chillmaths/*.py", "pyproject.toml", "uv.lock")
+
+
+@dataclass(frozen=True)
+class SceneEntry:
+    """A Scene subclass defined in a file of the catalogue."""
+    path: Path
+    name: str
+
+    @property
+    def key(self) -> str:
+        return f"{self.path.relative_to(ROOT).as_posix()}::{self.name}"
+
+
+def is_scene_base(base: ast.expr) -> bool:
+    """Whether a base class looks like a manim Scene."""
+    if isinstance(base, ast.Attribute):
+        name = base.attr
+    elif isinstance(base, ast.Name):
+        name = base.id
+    else:
+        return False
+    return name.endswith("Scene")
+
+
+def parse(path: Path) -> ast.Module:
+    # Some scene files hold non raw strings such as "\cdot".
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", SyntaxWarning)
+        return ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+
+
+def scenes_in_file(path: Path) -> list[SceneEntry]:
+    """List the Scene subclasses defined at the top level of a file,
+    directly or through other classes of the file."""
+    classes = [node for node in parse(path).body if isinstance(node, ast.ClassDef)]
+    scenes = set()
+    found = True
+    while found:
+        found = False
+        for node in classes:
+            if node.name not in scenes and any(
+                is_scene_base(base)
+                or isinstance(base, ast.Name) and base.id in scenes
+                for base in node.bases
+            ):
+                scenes.add(node.name)
+                found = True
+    return [SceneEntry(path, node.name) for node in classes if node.name in scenes]
+
+
+def discover(folders=SCENE_FOLDERS, root: Path = ROOT) -> list[SceneEntry]:
+    """List every scene of the catalogue, sorted by file and name."""
+    entries = []
+    for folder in folders:
+        for path in sorted((root / folder).glob("*.py")):
+            entries.extend(scenes_in_file(path))
+    return entries
+
+
+def file_digest(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def shared_assets_digest(root: Path = ROOT) -> str:
+    """Hash of the files every scene depends on."""
+    digest = hashlib.sha256()
+    for pattern in SHARED_ASSETS:
+        for path in sorted(root.glob(pattern)):
+            digest.update(path.relative_to(root).as_posix().encode())
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
@@ -0,0 +1,183 @@
+"""
+Geometric constructions updated incrementally, in place.
+
+A `Construction` is a graph of nodes (points, lines, circles, labels), each
+declaring the nodes it is computed from. On every frame only the nodes whose
+inputs changed are recomputed, and their mobjects are moved in place: no
+mobject is created and no `Tex` is laid out again.
+
+    geometry = Construction()
+    a = geometry.point(A)
+    circle = geometry.circle(big_circle)
+    p = geometry.point_on_circle(circle, geometry.tracker(tracker), P)
+    ap = geometry.line_through(a, p, line_AP)
+    geometry.label(p, txt_P, UP + LEFT, buff=0.1)
+    geometry.add_updaters()
+"""
+import numpy as np
+
+
+def same(a, b) -> bool:
+    """Equality of node values: numbers, arrays or tuples of them."""
+    if isinstance(a, tuple) and isinstance(b, tuple):
+        return len(a) == len(b) and all(same(x, y) for x, y in zip(a, b))
+    if a is None or b is None:
+        return a is b
+    return np.array_equal(a, b)
+
+
+class Node:
+    """A value computed from the values of its inputs.
+
+    `apply(mobject, value)` moves the mobject of the node, if any, when the
+    value changes. A node without inputs is a source: it is polled on every
+    update.
+    """
+    def __init__(self, compute, inputs=(), mobject=None, apply=None):
+        self.compute = compute
+        self.inputs = tuple(inputs)
+        self.mobject = mobject
+        self.apply = apply
+        self.value = None
+        self.version = 0
+        self.seen = None
+
+
+class Construction:
+    def __init__(self):
+        self.nodes = []
+
+    def node(self, compute, inputs=(), mobject=None, apply=None) -> Node:
+        node = Node(compute, inputs, mobject, apply)
+        self.nodes.append(node)
+        return node
+
+    def update(self) -> int:
+        """Recompute the nodes whose inputs changed, return their number."""
+        updated = 0
+        for node in self.nodes:
+            seen = tuple(i.version for i in node.inputs)
+            if node.inputs and seen == node.seen:
+                continue
+            node.seen = seen
+            value = node.compute(*[i.value for i in node.inputs])
+            if same(value, node.value):
+                continue
+            node.value = value
+            node.version += 1
+            updated += 1
+            if node.apply is not None and node.mobject is not None:
+                node.apply(node.mobject, value)
+        return updated
+
+    def reset(self) -> None:
+        """Forget the values, so that the next update applies every node."""
+        for node in self.nodes:
+            node.value, node.seen = None, None
+
+    def _updater(self, mobject):
+        self.update()
+
+    def add_updaters(self) -> None:
+        """Update the construction on every frame.
+
+        The updater is added to the mobject of every computed node, so the
+        scene redraws them all; the first one to run does the work.
+        """
+        self.reset()
+        for node in self.nodes:
+            if node.inputs and node.mobject is not None:
+                node.mobject.add_updater(self._updater)
+
+    def clear_updaters(self) -> None:
+        for node in self.nodes:
+            if node.mobject is not None:
+                node.mobject.remove_updater(self._updater)
+
+    # Sources
+
+    def point(self, mobject) -> Node:
+        """The center of a mobject."""
+        return self.node(mobject.get_center)
+
+    def circle(self, circle) -> Node:
+        """(center, radius) of a circle mobject."""
+        return self.node(lambda: (circle.get_center(), circle.width / 2))
+
+    def tracker(self, tracker) -> Node:
+        return self.node(tracker.get_value)
+
+    # Constructions
+
+    def point_on_circle(self, circle, proportion, mobject=None) -> Node:
+        """The point at a proportion of a circle, from its rightmost point."""
+        def compute(circle, proportion):
+            center, radius = circle
+            angle = 2 * np.pi * proportion
+            return center + radius * np.array([np.cos(angle), np.sin(angle), 0])
+        return self.node(
+            compute, (circle, proportion), mobject,
+            lambda mob, point: mob.move_to(point)
+        )
+
+    def line_through(self, p1, p2, mobject=None, length=20) -> Node:
+        """(start, end) of a line through two points, centred on the first."""
+        def compute(p1, p2):
+            direction = p2 - p1
+            norm = np.linalg.norm(direction)
+            if norm == 0:
+                return None
+            half = length / 2 * direction / norm
+            return p1 - half, p1 + half
+        return self.node(compute, (p1, p2), mobject, _put_line)
+
+    def segment(self, p1, p2, mobject=None) -> Node:
+        return self.node(
+            lambda p1, p2: (p1, p2), (p1, p2), mobject, _put_line
+        )
+
+    def second_intersection(self, line, circle, point, mobject=None) -> Node:
+        """The intersection of a line and a circle furthest from `point`.
+
+        With `point` on both, this is the second intersection. The previous
+        value is kept when the line misses the circle.
+        """
+        node = None
+
+        def compute(line, circle, point):
+            if line is None:
+                return node.value
+            start, end = line
+            center, radius = circle
+            direction = end - start
+            # |start + t direction - center|^2 = radius^2
+            offset = start - center
+            a = direction @ direction
+            b = 2 * direction @ offset
+            c = offset @ offset - radius**2
+            discriminant = b**2 - 4 * a * c
+            if discriminant < 0:
+                return node.value
+            roots = (-b + np.array([1, -1]) * np.sqrt(discriminant)) / (2 * a)
+            candidates = start + roots[:, None] * direction
+            distances = np.linalg.norm(candidates - point, axis=1)
+            return candidates[np.argmax(distances)]
+
+        node = self.node(
+            compute, (line, circle, point), mobject,
+            lambda mob, point: mob.move_to(point)
+        )
+        return node
+
+    def label(self, point, mobject, direction, buff=0.1) -> Node:
+        """Keep a label next to a point, or next to the mobject of its node."""
+        anchor = point.mobject
+
+        def apply(mob, value):
+            mob.next_to(value if anchor is None else anchor, direction, buff=buff)
+        return self.node(lambda point: point, (point,), mobject, apply)
+
+
+def _put_line(line, ends):
+    if ends is not None:
+        line.put_start_and_end_on(*ends)
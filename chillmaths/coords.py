@@ -0,0 +1,158 @@
+"""
+Coordinates without a coordinate system mobject.
+
+A `NumberPlane` only there to place points still builds its number lines and
+every background line, however invisible, and carries them through its
+`scale` and `move_to`. A `CoordinateMap` is the affine map of such a plane
+and nothing else:
+
+    ax = CoordinateMap((1, 2, 0.1), (0, 1, 0.1), 5, 5)\\
+        .scale(0.5).move_to([0, 1, 0])
+    graph = ax.plot(lambda x: 1 / x, x_range=[1, 2], color=BLACK)
+
+The ranges and lengths place the points as a `NumberPlane` (or an `Axes`
+without tips nor numbers) of the same arguments does, the middle of the
+ranges at the origin; `scale`, `shift` and `move_to` move the map as they
+would move the plane, whose bounding box is the rectangle of the ranges.
+`plot`, `get_vertical_line` and `get_horizontal_line` build the same
+mobjects as manim's, and `axes` the two axis lines, when they are shown.
+"""
+import numpy as np
+
+from manim import DashedLine, Line, ManimColor, Mobject, ParametricFunction
+from manim import VGroup, VMobject
+from manim import ORIGIN
+
+# As `CoordinateSystem.num_sampled_graph_points_per_tick`.
+SAMPLES_PER_TICK = 10
+
+
+def _range(values):
+    """(min, max, step) of a range, the step defaulting to 1 as manim's."""
+    values = [float(value) for value in values]
+    return np.array(values if len(values) == 3 else [*values, 1.0])
+
+
+def _origin(values):
+    """The coordinate an axis crosses the other one at, as in `Axes`."""
+    return min(max(0.0, values[0]), values[1])
+
+
+class CoordinateMap:
+    """The coordinates of a `NumberPlane(x_range, y_range, x_length,
+    y_length)`, as an affine map without mobjects."""
+    def __init__(self, x_range, y_range, x_length, y_length):
+        self.x_range, self.y_range = _range(x_range), _range(y_range)
+        self.unit = np.array([
+            x_length / (self.x_range[1] - self.x_range[0]),
+            y_length / (self.y_range[1] - self.y_range[0]),
+        ])
+        self.middle = np.array([
+            (self.x_range[0] + self.x_range[1]) / 2,
+            (self.y_range[0] + self.y_range[1]) / 2,
+        ])
+        self.center = np.array(ORIGIN, dtype=float)
+
+    def get_center(self):
+        return self.center.copy()
+
+    def shift(self, *vectors):
+        self.center = self.center + sum(np.asarray(v, dtype=float) for v in vectors)
+        return self
+
+    def move_to(self, point_or_mobject):
+        if isinstance(point_or_mobject, Mobject):
+            point_or_mobject = point_or_mobject.get_center()
+        self.center = np.array(point_or_mobject, dtype=float)
+        return self
+
+    def scale(self, scale_factor, about_point=None):
+        if about_point is not None:
+            about_point = np.asarray(about_point, dtype=float)
+            self.center = about_point + scale_factor * (self.center - about_point)
+        self.unit = scale_factor * self.unit
+        return self
+
+    def coords_to_point(self, x, y):
+        """The point of coordinates (x, y); arrays of coordinates give a
+        (3, n) array, as manim's."""
+        x, y = np.broadcast_arrays(
+            np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+        )
+        return np.array([
+            self.center[0] + (x - self.middle[0]) * self.unit[0],
+            self.center[1] + (y - self.middle[1]) * self.unit[1],
+            np.full_like(x, self.center[2]),
+        ])
+
+    c2p = coords_to_point
+
+    def point_to_coords(self, point):
+        point = np.asarray(point, dtype=float)
+        return tuple(
+            self.middle + (point[..., :2] - self.center[:2]) / self.unit
+        )
+
+    p2c = point_to_coords
+
+    def plot(self, function, x_range=None, **kwargs):
+        """The graph of `function`, as `CoordinateSystem.plot`."""
+        t_range = self.x_range.copy()
+        if x_range is not None:
+            t_range[:len(x_range)] = x_range
+        if x_range is None or len(x_range) < 3:
+            t_range[2] /= SAMPLES_PER_TICK
+        graph = ParametricFunction(
+            lambda t: self.coords_to_point(t, function(t)),
+            t_range=t_range,
+            **kwargs,
+        )
+        graph.underlying_function = function
+        return graph
+
+    def _line_from_axis(
+        self, index, point, line_func, line_config, color, stroke_width
+    ):
+        line_config = dict(line_config or {})
+        if color is None:
+            color = VMobject().color
+        line_config["color"] = ManimColor.parse(color)
+        line_config["stroke_width"] = stroke_width
+        point = np.asarray(point, dtype=float)
+        origin = self.coords_to_point(
+            _origin(self.x_range), _origin(self.y_range)
+        )
+        # The projection of the point on the axis.
+        start = point.copy()
+        start[1 - index] = origin[1 - index]
+        start[2] = origin[2]
+        return line_func(start, point, **line_config)
+
+    def get_vertical_line(
+        self, point, line_func=DashedLine, line_config=None, color=None,
+        stroke_width=2,
+    ):
+        """A line from the x-axis to a point, as manim's."""
+        return self._line_from_axis(
+            0, point, line_func, line_config, color, stroke_width
+        )
+
+    def get_horizontal_line(
+        self, point, line_func=DashedLine, line_config=None, color=None,
+        stroke_width=2,
+    ):
+        """A line from the y-axis to a point, as manim's."""
+        return self._line_from_axis(
+            1, point, line_func, line_config, color, stroke_width
+        )
+
+    def axes(self, **kwargs):
+        """The x and y axes, as two plain lines crossing where the axes of a
+        `NumberPlane` do."""
+        x0, x1 = self.x_range[:2]
+        y0, y1 = self.y_range[:2]
+        x, y = _origin(self.x_range), _origin(self.y_range)
+        return VGroup(
+            Line(self.c2p(x0, y), self.c2p(x1, y), **kwargs),
+            Line(self.c2p(x, y0), self.c2p(x, y1), **kwargs),
+        )
@@ -0,0 +1,215 @@
+"""
+A warm render server, to iterate on a scene without paying the start-up.
+
+Usage:
+    python -m chillmaths.daemon serve [--socket PATH]
+    python -m chillmaths.daemon render [-q l] [--profile] FILE SCENE
+    python -m chillmaths.daemon stop
+
+The server imports manim, builds the shared assets (fonts discovered, title
+blocks compiled) and listens on a Unix socket. Each render request is run in
+a child forked from this warm process, so the scene module and whatever it
+leaves in memory die with the child. The reply gives the time to the
+first frame, counted from the reception of the request.
+
+The shared assets are those of the server's start: restart it after changing
+the ``chillmaths`` package (the replies warn about it).
+"""
+import argparse
+import contextlib
+import importlib
+import json
+import os
+import signal
+import socket
+import sys
+import tempfile
+import time
+import traceback
+
+from pathlib import Path
+
+from chillmaths import ROOT
+from chillmaths.catalogue import shared_assets_digest
+
+SOCKET = Path(tempfile.gettempdir()) / f"chillmaths-{os.getuid()}.sock"
+
+PRELOAD = (
+    "manim",
+    "manim.renderer.cairo_renderer",
+    "manim.scene.scene_file_writer",
+    "chillmaths.batch",
+)
+
+
+def warm() -> None:
+    """Import what every render needs, and fill the in-process caches."""
+    os.chdir(ROOT)
+    for module in PRELOAD:
+        importlib.import_module(module)
+
+    from chillmaths import assets
+    assets.watermark()
+    assets.demonstration(r"Roger B. Nelsen")
+    assets.logo()
+
+
+def run_job(request: dict, received: float, digest: str) -> dict:
+    """Render a request in the forked child."""
+    from manim.renderer.cairo_renderer import CairoRenderer
+    from chillmaths.batch import MEDIA_DIR, render_entry
+
+    first_frame = []
+    add_frame = CairoRenderer.add_frame
+
+    def timed_add_frame(self, *args, **kwargs):
+        if not first_frame:
+            first_frame.append(time.perf_counter())
+        return add_frame(self, *args, **kwargs)
+
+    CairoRenderer.add_frame = timed_add_frame
+    result = render_entry(
+        request["file"],
+        request["scene"],
+        request.get("quality", "l"),
+        request.get("media_dir", str(MEDIA_DIR)),
+        dedupe_holds=request.get("dedupe_holds", False),
+        profile=request.get("profile", False),
+    )
+    result["time_to_first_frame"] = (
+        first_frame[0] - received if first_frame else None
+    )
+    if shared_assets_digest() != digest:
+        result["warning"] = (
+            "the shared code changed since the server started, restart it"
+        )
+    return result
+
+
+def _send(connection, message: dict) -> None:
+    connection.sendall((json.dumps(message) + "\n").encode())
+
+
+def _receive(connection) -> dict:
+    """The JSON object of the next line, ValueError if it is not one."""
+    line = connection.makefile("r").readline()
+    if not line:
+        raise ValueError("the connection closed without a message")
+    message = json.loads(line)
+    if not isinstance(message, dict):
+        raise ValueError(f"expected a JSON object, got {line.strip()!r}")
+    return message
+
+
+def serve(path: Path = SOCKET) -> None:
+    warm()
+    digest = shared_assets_digest()
+    path.unlink(missing_ok=True)
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(str(path))
+    server.listen()
+    # The children are reaped by the kernel.
+    signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+    print(f"Listening on {path}", file=sys.stderr)
+    try:
+        while True:
+            connection, _ = server.accept()
+            with connection:
+                try:
+                    message = _receive(connection)
+                except ValueError as error:
+                    # A stray client must not stop the server.
+                    with contextlib.suppress(OSError):
+                        _send(connection, {
+                            "status": "failed",
+                            "error": f"Malformed request: {error}",
+                        })
+                    continue
+                received = time.perf_counter()
+                if message.get("command") == "stop":
+                    _send(connection, {"status": "stopped"})
+                    break
+                if os.fork() == 0:
+                    # LaTeX runs in subprocesses, which have to be waited for.
+                    signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+                    server.close()
+                    try:
+                        result = run_job(message, received, digest)
+                    except Exception:
+                        result = {"status": "failed", "error": traceback.format_exc()}
+                    try:
+                        _send(connection, result)
+                    finally:
+                        os._exit(0)
+    finally:
+        server.close()
+        path.unlink(missing_ok=True)
+
+
+def request(message: dict, path: Path = SOCKET) -> dict:
+    """Send a request to the server and wait for its reply."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(str(path))
+        _send(client, message)
+        try:
+            return _receive(client)
+        except ValueError as error:
+            # The child died before replying, or replied garbage.
+            return {"status": "failed", "error": f"No valid reply: {error}"}
+
+
+def main(argv=None) -> int:
+    from chillmaths.batch import QUALITIES
+
+    parser = argparse.ArgumentParser(
+        prog="python -m chillmaths.daemon",
+        description="Render scenes from a warm, long-lived manim process.",
+    )
+    parser.add_argument("--socket", type=Path, default=SOCKET)
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("serve", help="start the server, in the foreground")
+    commands.add_parser("stop", help="stop the server")
+    render = commands.add_parser("render", help="render a scene")
+    render.add_argument("file")
+    render.add_argument("scene")
+    render.add_argument(
+        "-q", "--quality", choices=sorted(QUALITIES), default="l",
+    )
+    render.add_argument("--profile", action="store_true")
+    render.add_argument("--dedupe-holds", action="store_true")
+    args = parser.parse_args(argv)
+
+    if args.command == "serve":
+        serve(args.socket)
+        return 0
+    if args.command == "stop":
+        request({"command": "stop"}, args.socket)
+        return 0
+
+    start = time.perf_counter()
+    result = request({
+        "command": "render",
+        "file": Path(args.file).resolve().relative_to(ROOT).as_posix(),
+        "scene": args.scene,
+        "quality": args.quality,
+        "profile": args.profile,
+        "dedupe_holds": args.dedupe_holds,
+    }, args.socket)
+    if result["status"] == "failed":
+        print(result["error"], file=sys.stderr)
+        return 1
+    first = result["time_to_first_frame"]
+    print(
+        f"[{result['status']}] {result['output']}\n"
+        f"first frame after {'-' if first is None else f'{first:.2f}s'}, "
+        f"render {result['wall_time']:.2f}s, "
+        f"total {time.perf_counter() - start:.2f}s",
+        file=sys.stderr,
+    )
+    if "warning" in result:
+        print(f"Warning: {result['warning']}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
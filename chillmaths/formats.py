@@ -0,0 +1,93 @@
+"""
+Render profiles: the format of a video, applied for the render of a scene.
+
+A scene declares its format with a decorator instead of flipping the global
+``config`` when its module is imported:
+
+    @render_profile("vertical")
+    class Sums(MovingCameraScene):
+        ...
+
+The format is applied on top of the quality of the render when the scene is
+created, and the previous config restored once the scene is rendered, so one
+process can render many scenes back to back.
+"""
+import functools
+
+from dataclasses import dataclass
+
+from manim import config
+
+
+@dataclass(frozen=True)
+class Format:
+    """Frame of a video, as an aspect ratio (width / height) and a frame
+    height in scene units. `pixel_height` fixes the resolution, otherwise the
+    long side keeps the pixel width of the quality."""
+    aspect_ratio: float
+    frame_height: float = 8.0
+    pixel_height: int | None = None
+
+    def options(self, pixel_width: int, pixel_height: int) -> dict:
+        """Config options for a render at the given landscape resolution."""
+        long_side = max(pixel_width, pixel_height)
+        if self.pixel_height is not None:
+            height = self.pixel_height
+        elif self.aspect_ratio < 1:
+            height = long_side
+        else:
+            height = round(long_side / self.aspect_ratio)
+        return {
+            "pixel_height": height,
+            "pixel_width": round(height * self.aspect_ratio),
+            "frame_height": self.frame_height,
+            "frame_width": self.frame_height * self.aspect_ratio,
+        }
+
+
+FORMATS = {
+    "vertical": Format(9 / 16),
+    "square": Format(1, frame_height=7, pixel_height=1080),
+    "landscape": Format(16 / 9),
+}
+
+# Named qualities, for the `-q` option of the command line tools.
+PRESETS = {
+    "preview": "low_quality",
+    "final": "high_quality",
+}
+
+
+def apply_format(name: str) -> dict:
+    """Apply a format to the global config, return the options it replaced."""
+    options = FORMATS[name].options(config.pixel_width, config.pixel_height)
+    previous = {key: config[key] for key in options}
+    config.update(options)
+    return previous
+
+
+def render_profile(name: str):
+    """Class decorator rendering a Scene in the format `name`."""
+    if name not in FORMATS:
+        raise ValueError(f"Unknown format {name!r}, expected one of {list(FORMATS)}")
+
+    def decorate(cls):
+        init, render = cls.__init__, cls.render
+
+        @functools.wraps(init)
+        def __init__(self, *args, **kwargs):
+            self._replaced_config = apply_format(name)
+            init(self, *args, **kwargs)
+
+        @functools.wraps(render)
+        def render_in_format(self, *args, **kwargs):
+            try:
+                return render(self, *args, **kwargs)
+            finally:
+                config.update(self._replaced_config)
+
+        cls.__init__ = __init__
+        cls.render = render_in_format
+        cls.render_format = name
+        return cls
+    return decorate
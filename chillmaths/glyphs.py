@@ -0,0 +1,130 @@
+"""
+Numeric labels assembled from a glyph atlas.
+
+The digits, signs and a few letters are shaped (`Text`) or compiled (`Tex`)
+once per font, in a single sample string, and their outlines kept with their
+advance. A label is then the outlines of its characters placed side by side
+and scaled to the font size: labelling a hundred circles costs no shaping nor
+LaTeX call past the first one.
+
+    label = GlyphLabel(str(i + 1), font_size=16, color=WHITE)
+    txt_1 = GlyphLabel(r"k = 1", font_size=20, tex=True)
+
+As a `Text`/`Tex`, a label is a group of one VMobject per glyph, centered on
+the origin. The math spacing around the signs (`k = 2n - 1`) is the one of
+the sample, where each glyph sits between two zeros.
+"""
+from dataclasses import dataclass
+from functools import lru_cache
+
+from manim import MathTex, Tex, Text, VGroup, VMobject
+
+from chillmaths.style import BLACK
+
+# Size at which the atlases are built, the labels scale from it.
+ATLAS_SIZE = 48
+
+TEXT_TOKENS = tuple("0123456789+-=.,()")
+TEX_TOKENS = (*"0123456789+-=.,()kn", r"\cdot")
+
+
+@dataclass(frozen=True)
+class Atlas:
+    """Outlines of glyphs, relative to their origin on the baseline, and
+    their advances, at `ATLAS_SIZE`."""
+    outlines: dict
+    advances: dict
+
+
+def tokens(string, tex=False) -> list:
+    """The atlas tokens of a string: characters, or TeX control words."""
+    if not tex:
+        return list(string)
+    result, i = [], 0
+    while i < len(string):
+        if string[i].isspace():
+            i += 1
+            continue
+        j = i + 1
+        if string[i] == "\\":
+            while j < len(string) and string[j].isalpha():
+                j += 1
+        result.append(string[i:j])
+        i = j
+    return result
+
+
+def covers(string, tex=False) -> bool:
+    """Whether a string can be assembled from the atlas."""
+    available = TEX_TOKENS if tex else TEXT_TOKENS
+    return all(token in available for token in tokens(string, tex))
+
+
+@lru_cache(maxsize=None)
+def atlas(font="", tex=False) -> Atlas:
+    """The atlas of a `Text` font, or of the LaTeX math font."""
+    available = TEX_TOKENS if tex else TEXT_TOKENS
+    # Two zeros give the advance of a zero, then each glyph sits between two.
+    sample = ["0", "0", *[part for token in available for part in (token, "0")]]
+    if tex:
+        mobject = Tex("$" + " ".join(sample) + "$", font_size=ATLAS_SIZE)
+    else:
+        mobject = Text("".join(sample), font=font, font_size=ATLAS_SIZE)
+    glyphs = mobject.family_members_with_points()
+    if len(glyphs) != len(sample):
+        raise ValueError(
+            f"{len(glyphs)} glyphs for the {len(sample)} tokens of the atlas"
+        )
+
+    lefts = [glyph.points[:, 0].min() for glyph in glyphs]
+    baseline = glyphs[0].points[:, 1].min()
+    zero_advance = lefts[1] - lefts[0]
+    outlines = {"0": glyphs[0].points - [lefts[0], baseline, 0]}
+    advances = {"0": zero_advance}
+    for position in range(2, len(sample), 2):
+        token, glyph = sample[position], glyphs[position]
+        origin = lefts[position - 1] + zero_advance
+        outlines[token] = glyph.points - [origin, baseline, 0]
+        advances[token] = lefts[position + 1] - origin
+    return Atlas(outlines, advances)
+
+
+class GlyphLabel(VGroup):
+    """A short label of digits and signs, assembled from an atlas.
+
+    Parameters
+    ----------
+    string
+        The label; with `tex`, in math mode without the dollars and with
+        the spaces ignored, as LaTeX does.
+    font
+        Font of a `Text` label, ignored with `tex`.
+    tex
+        Use the LaTeX math font, as `Tex(r"$...$")` does.
+    """
+    def __init__(
+        self, string, font_size=48, color=BLACK, font="", tex=False, **kwargs
+    ):
+        super().__init__(**kwargs)
+        glyphs = atlas("" if tex else font, tex)
+        scale = font_size / ATLAS_SIZE
+        x = 0.0
+        for token in tokens(string, tex):
+            if token not in glyphs.outlines:
+                raise ValueError(f"No glyph for {token!r} in the atlas")
+            glyph = VMobject(fill_color=color, fill_opacity=1, stroke_width=0)
+            glyph.set_points(scale * (glyphs.outlines[token] + [x, 0, 0]))
+            self.add(glyph)
+            x += glyphs.advances[token]
+        self.center()
+
+
+def math_entry(string, **kwargs):
+    """A `MathTable` entry: a `GlyphLabel` when the atlas covers it, a
+    `MathTex` otherwise.
+
+        MathTable(rows, element_to_mobject=math_entry)
+    """
+    if string.strip() and covers(string, tex=True):
+        return GlyphLabel(string, tex=True, **kwargs)
+    return MathTex(string, **kwargs)
@@ -0,0 +1,188 @@
+"""
+Complete and complete bipartite graphs drawn as a few VMobjects.
+
+The edges of a `CompactGraph` are stored once per unordered pair of vertices,
+in an (E, 2) array of vertex indices, with a colour label each. As the dots of
+a `DotLattice`, all the edges of a colour are the subpaths of one stroke-only
+VMobject and all the vertices the subpaths of one more, so recolouring the
+edges between two sets of vertices is a couple of array operations.
+
+    positions, edges = graphs.complete(8)
+    graph = CompactGraph(positions, edges, names)
+    graph.set_edge_colors(graph.edge_mask(names[:5]), BLUE)
+    self.play(RecolorEdges(graph, graph.edge_mask(names[5:]), RED))
+"""
+import numpy as np
+
+from manim import Animation, MathTex, VGroup, VMobject
+from manim import DEFAULT_DOT_RADIUS, SMALL_BUFF
+
+from chillmaths.lattice import POINTS_PER_DOT, _ANCHORS, dots_points
+from chillmaths.style import BLACK, WHITE
+from chillmaths.voxels import segments
+
+
+def complete(n, radius=2.0):
+    """K_n, the vertices counterclockwise on a circle from its rightmost
+    point, as manim's circular layout.
+
+    Returns the positions of the vertices and the (i, j) edges, i < j.
+    """
+    angles = 2 * np.pi * np.arange(n) / n
+    positions = radius * np.stack(
+        [np.cos(angles), np.sin(angles), np.zeros(n)], axis=1
+    )
+    return positions, np.stack(np.triu_indices(n, k=1), axis=1)
+
+
+def complete_bipartite(n, m, spacing=1.0, gap=1.0):
+    """K_{n,m}, the first n vertices on a row below the m others, both rows
+    centred and `gap` apart.
+
+    Returns the positions of the vertices and the (i, j) edges, i < n <= j.
+    """
+    x = np.concatenate([np.arange(n) - (n - 1) / 2, np.arange(m) - (m - 1) / 2])
+    y = np.repeat([-gap / 2, gap / 2], [n, m])
+    positions = np.stack([spacing * x, y, np.zeros(n + m)], axis=1)
+    first, second = np.meshgrid(np.arange(n), n + np.arange(m), indexing="ij")
+    return positions, np.stack([first.ravel(), second.ravel()], axis=1)
+
+
+class CompactGraph(VGroup):
+    """An undirected graph with straight edges, coloured by an index into a
+    palette.
+
+    Parameters
+    ----------
+    positions
+        Array of shape (n, 3) of the positions of the vertices.
+    edges
+        Array of shape (E, 2) of vertex indices, one row per edge.
+    names
+        Optional names of the vertices, written as `MathTex` labels over
+        them; `edge_mask` also accepts names.
+    palette, edge_labels
+        Stroke colours, and the index into `palette` of each edge (default
+        0). The submobject `i` of `edge_layers` holds the edges of colour
+        `palette[i]`; they are drawn under the `vertex_dots` and `labels`.
+    vertex_radius
+        Default: large enough for the labels, as manim's `LabeledDot`.
+    """
+    def __init__(
+        self,
+        positions,
+        edges,
+        names=None,
+        palette=(BLACK,),
+        edge_labels=None,
+        vertex_radius=None,
+        vertex_color=WHITE,
+        stroke_width=1,
+        label_size=14,
+        label_color=BLACK,
+        **kwargs
+    ):
+        super().__init__(**kwargs)
+        positions = np.asarray(positions, dtype=float).reshape(-1, 3)
+        self.edges = np.asarray(edges, dtype=int).reshape(-1, 2)
+        if edge_labels is None:
+            edge_labels = np.zeros(len(self.edges), dtype=int)
+        self.edge_labels = np.asarray(edge_labels, dtype=int).copy()
+        self.palette = list(palette)
+        self.names = list(names) if names is not None else None
+        self.edge_style = dict(stroke_width=stroke_width, fill_opacity=0)
+
+        self.labels = VGroup(*[
+            MathTex(name, color=label_color, font_size=label_size).move_to(point)
+            for name, point in zip(self.names or [], positions)
+        ])
+        if vertex_radius is None:
+            vertex_radius = DEFAULT_DOT_RADIUS
+            if len(self.labels):
+                vertex_radius = SMALL_BUFF + max(
+                    np.hypot(label.width, label.height) / 2 for label in self.labels
+                )
+        self.vertex_dots = VMobject(
+            fill_color=vertex_color, fill_opacity=1, stroke_width=0
+        )
+        self.vertex_dots.set_points(dots_points(positions, vertex_radius))
+
+        self.edge_layers = VGroup(*[
+            VMobject(stroke_color=color, **self.edge_style)
+            for color in self.palette
+        ])
+        self.add(self.edge_layers, self.vertex_dots, self.labels)
+        self._rebuild()
+
+    @property
+    def positions(self):
+        """Positions of the vertices, read back from the points."""
+        dots = self.vertex_dots.points.reshape(-1, POINTS_PER_DOT, 3)
+        return dots[:, _ANCHORS].mean(axis=1)
+
+    def edge_points(self, selection=slice(None)):
+        """Points of the selected edges, as one array."""
+        positions, edges = self.positions, self.edges[selection]
+        if not len(edges):
+            return np.zeros((0, 3))
+        return segments(positions[edges[:, 0]], positions[edges[:, 1]])
+
+    def _rebuild(self):
+        for i, layer in enumerate(self.edge_layers):
+            layer.set_points(self.edge_points(self.edge_labels == i))
+        return self
+
+    def _indices(self, vertices):
+        return np.array([
+            self.names.index(v) if isinstance(v, str) else v for v in vertices
+        ], dtype=int)
+
+    def edge_mask(self, first, second=None):
+        """Mask of the edges between two sets of vertices.
+
+        With `second` omitted, the edges with both ends in `first`. The
+        vertices are given by index, or by name.
+        """
+        first = np.isin(self.edges, self._indices(first))
+        if second is None:
+            return first.all(axis=1)
+        second = np.isin(self.edges, self._indices(second))
+        return (first[:, 0] & second[:, 1]) | (first[:, 1] & second[:, 0])
+
+    def set_edge_colors(self, selection, color):
+        """Recolour the edges selected by a boolean mask or an index array."""
+        if color not in self.palette:
+            self.palette.append(color)
+            self.edge_layers.add(VMobject(stroke_color=color, **self.edge_style))
+        self.edge_labels[selection] = self.palette.index(color)
+        return self._rebuild()
+
+
+class RecolorEdges(Animation):
+    """Fade the selected edges of a graph into a new colour.
+
+    The edges are drawn again in the new colour, over the old ones, with an
+    opacity going from 0 to 1; the graph itself is recoloured at the end.
+    """
+    def __init__(self, graph, selection, color, **kwargs):
+        self.selection = selection
+        self.color = color
+        super().__init__(graph, **kwargs)
+
+    def begin(self):
+        graph = self.mobject
+        self.overlay = VMobject(
+            stroke_color=self.color, stroke_opacity=0, **graph.edge_style
+        )
+        self.overlay.set_points(graph.edge_points(self.selection))
+        # Over the edges, under the vertices.
+        graph.submobjects.insert(1, self.overlay)
+        super().begin()
+
+    def interpolate_mobject(self, alpha):
+        self.overlay.set_stroke(opacity=self.rate_func(alpha))
+
+    def finish(self):
+        super().finish()
+        self.mobject.remove(self.overlay)
+        self.mobject.set_edge_colors(self.selection, self.color)
@@ -0,0 +1,149 @@
+"""
+Grids of square cells drawn as a few VMobjects.
+
+The outline of every cell is one subpath of a single stroke-only VMobject,
+and the cells of a same fill are the subpaths of one fill-only VMobject, so a
+grid is drawn in one pass per fill colour whatever its number of cells.
+"""
+import numpy as np
+
+from manim import ManimColor, VGroup, VMobject
+
+from chillmaths.style import BLACK
+
+# A cell as four straight cubic curves, from the upper right corner and
+# counterclockwise like manim's `Square`.
+_CORNERS = np.array([[1, 1, 0], [-1, 1, 0], [-1, -1, 0], [1, -1, 0]]) / 2
+_THIRDS = np.linspace(0, 1, 4)[:, None]
+CELL = np.concatenate([
+    start + _THIRDS * (end - start)
+    for start, end in zip(_CORNERS, np.roll(_CORNERS, -1, axis=0))
+])
+POINTS_PER_CELL = len(CELL)
+_ANCHORS = np.arange(0, POINTS_PER_CELL, 4)
+
+
+class SquareGrid(VGroup):
+    """A `rows` x `columns` grid of squares, rows from top to bottom.
+
+    The fill of each cell is stored in `fill_rgbas`, an array of shape
+    (rows, columns, 4); the submobjects are one VMobject per distinct fill,
+    followed by the `outline` of the cells.
+    """
+    def __init__(
+        self,
+        rows,
+        columns,
+        side_length=1.0,
+        fill_color=BLACK,
+        fill_opacity=0,
+        stroke_color=BLACK,
+        stroke_width=1,
+        **kwargs
+    ):
+        super().__init__(**kwargs)
+        self.rows, self.columns = rows, columns
+        self.fill_rgbas = np.tile(
+            ManimColor(fill_color).to_rgba_with_alpha(fill_opacity),
+            (rows, columns, 1)
+        )
+        row, column = np.indices((rows, columns)).reshape(2, -1)
+        centers = np.stack([
+            (column - (columns - 1) / 2) * side_length,
+            ((rows - 1) / 2 - row) * side_length,
+            np.zeros(rows * columns),
+        ], axis=1)
+        self.outline = VMobject(
+            stroke_color=stroke_color, stroke_width=stroke_width,
+            fill_opacity=0
+        )
+        self.outline.set_points(
+            (centers[:, None] + side_length * CELL[None]).reshape(-1, 3)
+        )
+        self._rebuild()
+
+    def _cell_points(self):
+        return self.outline.points.reshape(-1, POINTS_PER_CELL, 3)
+
+    def _rebuild(self):
+        """Group the cells by fill, one VMobject per distinct fill."""
+        rgbas = self.fill_rgbas.reshape(-1, 4)
+        fills, inverse = np.unique(rgbas, axis=0, return_inverse=True)
+        inverse = inverse.reshape(-1)
+        cells = self._cell_points()
+        layers = []
+        for i, rgba in enumerate(fills):
+            if rgba[3] == 0:
+                continue
+            layer = VMobject(
+                fill_color=ManimColor(rgba[:3]), fill_opacity=rgba[3],
+                stroke_width=0
+            )
+            layer.set_points(cells[inverse == i].reshape(-1, 3))
+            layers.append(layer)
+        self.submobjects = [*layers, self.outline]
+        return self
+
+    def split_fills(self, target_rgbas):
+        """Group the cells by their current and target fills, for a
+        recolouring (see `chillmaths.recolor.Recolor`).
+
+        Returns the fill-only layers, one per (current, target) pair, and
+        their current and target fills as two (k, 4) arrays.
+        """
+        pairs = np.concatenate([
+            self.fill_rgbas.reshape(-1, 4),
+            np.asarray(target_rgbas).reshape(-1, 4),
+        ], axis=1)
+        fills, inverse = np.unique(pairs, axis=0, return_inverse=True)
+        inverse = inverse.reshape(-1)
+        visible = (fills[:, 3] > 0) | (fills[:, 7] > 0)
+        cells = self._cell_points()
+        layers = []
+        for i in np.flatnonzero(visible):
+            layer = VMobject(stroke_width=0)
+            layer.set_points(cells[inverse == i].reshape(-1, 3))
+            layers.append(layer)
+        self.submobjects = [*layers, self.outline]
+        return layers, fills[visible, :4], fills[visible, 4:]
+
+    def cell_mask(self, rows=slice(None), columns=slice(None), mask=None):
+        """Boolean mask of the cells in the given rows and columns.
+
+        `rows` and `columns` are an index, a slice or a range; `mask` is an
+        optional boolean array of shape (rows, columns) to intersect with.
+        """
+        selected = np.zeros((self.rows, self.columns), dtype=bool)
+        selected[np.ix_(
+            np.atleast_1d(np.arange(self.rows)[rows]),
+            np.atleast_1d(np.arange(self.columns)[columns]),
+        )] = True
+        if mask is not None:
+            selected &= mask
+        return selected
+
+    def set_cell_fill(
+        self, color, opacity=1, rows=slice(None), columns=slice(None), mask=None
+    ):
+        """Fill the cells selected as in `cell_mask`."""
+        selected = self.cell_mask(rows, columns, mask)
+        self.fill_rgbas[selected] = ManimColor(color).to_rgba_with_alpha(opacity)
+        return self._rebuild()
+
+    def get_cell_center(self, row, column):
+        cell = self._cell_points()[row * self.columns + column]
+        return cell[_ANCHORS].mean(axis=0)
+
+    def get_cell_corner(self, row, column, direction):
+        """The corner of a cell furthest in `direction`, e.g. `UP + LEFT`."""
+        corners = self._cell_points()[row * self.columns + column][_ANCHORS]
+        return corners[np.argmax(corners @ np.asarray(direction))].copy()
+
+    def get_cell(self, row, column):
+        """A standalone copy of one cell, with its fill and outline."""
+        rgba = self.fill_rgbas[row, column]
+        cell = self.outline.copy().set_fill(
+            ManimColor(rgba[:3]), opacity=rgba[3]
+        )
+        cell.set_points(self._cell_points()[row * self.columns + column])
+        return cell
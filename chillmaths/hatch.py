@@ -0,0 +1,81 @@
+"""
+Hatch fills: regions covered with parallel strokes, drawn as one path.
+
+The lines of the hatching are clipped against every edge of the outline at
+once: each edge crossing a line gives an intersection, and the intersections
+along a line are paired by the even-odd rule, so the outline may be any
+polygon, convex or not, or a region bounded by curves sampled with
+`chillmaths.stipple.outline`.
+"""
+import numpy as np
+
+from manim import VMobject
+from manim import PI
+
+from chillmaths.stipple import polygon_edges
+from chillmaths.style import BLACK
+from chillmaths.voxels import segments
+
+
+def hatch_segments(vertices, angle, spacing, anchor=None):
+    """(starts, ends) of the strokes of a hatching of a polygon.
+
+    The strokes are at `angle` from the x axis, `spacing` apart, one of
+    their lines going through `anchor` (default: the first vertex).
+    """
+    starts, ends = polygon_edges(vertices)
+    anchor = starts[0] if anchor is None else np.asarray(anchor, dtype=float)[:2]
+    direction = np.array([np.cos(angle), np.sin(angle)])
+    normal = np.array([-direction[1], direction[0]])
+    # Signed distances of the vertices to the line through the anchor.
+    offsets = (starts - anchor) @ normal
+    lines = np.arange(
+        np.floor(offsets.min() / spacing), np.ceil(offsets.max() / spacing) + 1
+    )[:, None] * spacing
+    d_start, d_end = offsets[None] - lines, np.roll(offsets, -1)[None] - lines
+    crosses = (d_start > 0) != (d_end > 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = d_start / (d_start - d_end)
+        points = starts[None] + ratio[:, :, None] * (ends - starts)[None]
+    t = np.where(crosses, points @ direction, np.nan)
+    # Sorted intersections along each line, paired two by two.
+    t = np.sort(t, axis=1)
+    t = t[:, :t.shape[1] // 2 * 2].reshape(len(lines), -1, 2)
+    keep = ~np.isnan(t).any(axis=2) & (t[:, :, 0] < t[:, :, 1])
+    bases = anchor + lines * normal
+    bases = np.broadcast_to(bases[:, None], (*t.shape[:2], 2))[keep]
+    t = t[keep]
+    along = (bases @ direction)[:, None]
+    ends_2d = bases[:, None] + (t - along)[:, :, None] * direction
+    ends_3d = np.pad(ends_2d, ((0, 0), (0, 0), (0, 1)))
+    return ends_3d[:, 0], ends_3d[:, 1]
+
+
+class Hatch(VMobject):
+    """The hatching of a polygon, every stroke a subpath of one VMobject.
+
+    Parameters
+    ----------
+    vertices
+        Vertices of the polygon, e.g. `Polygon.get_vertices()` or the
+        `outline` of a region bounded by curves.
+    angle, spacing, anchor
+        The strokes, see `hatch_segments`.
+    """
+    def __init__(
+        self,
+        vertices,
+        angle=PI / 4,
+        spacing=0.2,
+        anchor=None,
+        color=BLACK,
+        stroke_width=1,
+        **kwargs
+    ):
+        super().__init__(
+            stroke_color=color, stroke_width=stroke_width, fill_opacity=0,
+            **kwargs
+        )
+        starts, ends = hatch_segments(vertices, angle, spacing, anchor)
+        if len(starts):
+            self.set_points(segments(starts, ends))
@@ -0,0 +1,87 @@
+"""
+Encode the static holds of a scene once instead of once per frame.
+
+Manim already notices when a `self.wait()` is static (no time-based updater,
+no stop condition) and rasterises its frame only once, but the frame is then
+sent to the encoder once per frame of the hold. `HoldSceneFileWriter` encodes
+a hold as its first and last frames only, the presentation timestamps
+stretching the first one over the whole hold.
+
+The movies made this way have a variable frame rate, which is why the mode is
+opt-in (`python -m chillmaths.batch --dedupe-holds`). Their partial movie
+files are kept apart from manim's, under the same play-call hashes, so that
+a later plain render never reuses a stretched hold.
+"""
+import av
+
+from manim.scene.scene_file_writer import SceneFileWriter
+from manim.utils.file_ops import guarantee_existence
+
+# Subdirectory of manim's partial movie files holding those of this writer.
+HOLDS_DIR = "holds"
+
+
+class HoldSceneFileWriter(SceneFileWriter):
+    """SceneFileWriter encoding each hold as two frames.
+
+    Attributes
+    ----------
+    holds : list[int]
+        Number of frames of each hold met so far.
+    frames_saved : int
+        Number of frames which did not go through the encoder.
+    """
+    def __init__(self, renderer, scene_name, **kwargs):
+        super().__init__(renderer, scene_name, **kwargs)
+        self.holds = []
+        self.frames_saved = 0
+
+    def init_output_directories(self, scene_name):
+        super().init_output_directories(scene_name)
+        if hasattr(self, "partial_movie_directory"):
+            self.partial_movie_directory = guarantee_existence(
+                self.partial_movie_directory / HOLDS_DIR
+            )
+
+    def open_partial_movie_stream(self, file_path=None):
+        self.next_pts = 0
+        super().open_partial_movie_stream(file_path=file_path)
+
+    def _encode(self, frame, pts):
+        # A new av.VideoFrame per encoded frame, see the note in
+        # SceneFileWriter.encode_and_write_frame.
+        av_frame = av.VideoFrame.from_ndarray(frame, format="rgba")
+        if self.video_stream.codec_context.time_base is not None:
+            av_frame.time_base = self.video_stream.codec_context.time_base
+        av_frame.pts = pts
+        for packet in self.video_stream.encode(av_frame):
+            self.video_container.mux(packet)
+
+    def encode_and_write_frame(self, frame, num_frames):
+        if num_frames <= 2:
+            for _ in range(num_frames):
+                self._encode(frame, self.next_pts)
+                self.next_pts += 1
+            return
+        self._encode(frame, self.next_pts)
+        self._encode(frame, self.next_pts + num_frames - 1)
+        self.next_pts += num_frames
+        self.holds.append(num_frames)
+        self.frames_saved += num_frames - 2
+
+
+def use_hold_writer(scene):
+    """Swap the file writer of a freshly created scene for a HoldSceneFileWriter."""
+    scene.renderer._file_writer_class = HoldSceneFileWriter
+    scene.renderer.init_scene(scene)
+    return scene
+
+
+def hold_report(scene) -> dict:
+    """Frames saved by the HoldSceneFileWriter of a rendered scene."""
+    writer = scene.renderer.file_writer
+    return {
+        "holds": len(getattr(writer, "holds", [])),
+        "held_frames": sum(getattr(writer, "holds", [])),
+        "frames_saved": getattr(writer, "frames_saved", 0),
+    }
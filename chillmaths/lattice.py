@@ -0,0 +1,237 @@
+"""
+Dot lattices for the figurate-number scenes.
+
+A `DotLattice` is drawn from one array of centres and one array of colour
+labels: all the dots of a colour are the subpaths of a single VMobject, so a
+lattice of thousands of dots holds a handful of mobjects.
+
+The layout functions return the centres of the usual lattices together with
+integer coordinates, from which the scenes derive the colour labels with
+vectorised masks.
+"""
+import numpy as np
+
+from manim import Animation, VGroup, VMobject
+from manim.utils.rate_functions import smooth
+
+from chillmaths.style import BLACK
+
+# A unit circle as four cubic Bézier arcs, in manim's layout of the points
+# (anchor, handle, handle, anchor for each curve).
+_KAPPA = 4 * (np.sqrt(2) - 1) / 3
+_QUARTER = np.array([[1, 0, 0], [1, _KAPPA, 0], [_KAPPA, 1, 0], [0, 1, 0]])
+_ROTATION = np.array([[0, -1, 0], [1, 0, 0], [0, 0, 1]])
+CIRCLE = np.concatenate([
+    _QUARTER @ np.linalg.matrix_power(_ROTATION, k).T for k in range(4)
+])
+POINTS_PER_DOT = len(CIRCLE)
+_ANCHORS = np.arange(0, POINTS_PER_DOT, 4)
+
+
+def dots_points(centers, radius, scales=None):
+    """Points of the circles of the given centres, as one array."""
+    centers = np.asarray(centers, dtype=float).reshape(-1, 3)
+    radii = np.full(len(centers), radius, dtype=float)
+    if scales is not None:
+        radii *= scales
+    points = centers[:, None, :] + radii[:, None, None] * CIRCLE[None]
+    return points.reshape(-1, 3)
+
+
+class DotLattice(VGroup):
+    """Dots of equal radius, coloured by an index into a palette.
+
+    Parameters
+    ----------
+    centers
+        Array of shape (n, 3) of the centres of the dots.
+    labels
+        Array of n indices into `palette`, the colour of each dot.
+    palette
+        Fill colours. The submobject `i` of the lattice holds all the dots
+        of colour `palette[i]`, in the order of `centers`.
+    """
+    def __init__(
+        self,
+        centers,
+        labels=None,
+        palette=(BLACK,),
+        radius=0.1,
+        stroke_width=1,
+        stroke_color=BLACK,
+        fill_opacity=1,
+        **kwargs
+    ):
+        super().__init__(**kwargs)
+        centers = np.asarray(centers, dtype=float).reshape(-1, 3)
+        if labels is None:
+            labels = np.zeros(len(centers), dtype=int)
+        self.labels = np.asarray(labels, dtype=int).copy()
+        self.palette = list(palette)
+        self.dot_style = dict(
+            stroke_width=stroke_width,
+            stroke_color=stroke_color,
+            fill_opacity=fill_opacity,
+        )
+        self.add(*[
+            VMobject(fill_color=color, **self.dot_style)
+            for color in self.palette
+        ])
+        self._rebuild(centers, radius)
+
+    def _groups(self):
+        """Indices of the dots of each colour, in the order of the lattice."""
+        return [np.flatnonzero(self.labels == i) for i in range(len(self.palette))]
+
+    def _rebuild(self, centers, radius, scales=None):
+        for group, indices in zip(self.submobjects, self._groups()):
+            group.set_points(dots_points(
+                centers[indices], radius,
+                None if scales is None else scales[indices],
+            ))
+
+    @property
+    def centers(self):
+        """Centres of the dots, read back from the points."""
+        centers = np.zeros((len(self.labels), 3))
+        for group, indices in zip(self.submobjects, self._groups()):
+            if len(indices):
+                anchors = group.points.reshape(-1, POINTS_PER_DOT, 3)[:, _ANCHORS]
+                centers[indices] = anchors.mean(axis=1)
+        return centers
+
+    @property
+    def radius(self):
+        for group in self.submobjects:
+            if len(group.points):
+                dot = group.points[:POINTS_PER_DOT]
+                return np.linalg.norm(dot[0] - dot[_ANCHORS].mean(axis=0))
+        return 0.0
+
+    def dot_center(self, index):
+        return self.centers[index]
+
+    def set_dot_colors(self, selection, color):
+        """Recolour the dots selected by a boolean mask or an index array."""
+        centers, radius = self.centers, self.radius
+        if color not in self.palette:
+            self.palette.append(color)
+            self.add(VMobject(fill_color=color, **self.dot_style))
+        self.labels[selection] = self.palette.index(color)
+        self._rebuild(centers, radius)
+        return self
+
+
+class GrowDots(Animation):
+    """Grow the dots of a lattice one after the other, in lattice order.
+
+    The lattice counterpart of a `LaggedStart` of one `GrowFromCenter` per
+    dot, without one animation (and one mobject) per dot.
+    """
+    def __init__(self, lattice, lag_ratio=0.1, dot_rate_func=smooth, **kwargs):
+        self.dot_lag_ratio = lag_ratio
+        self.dot_rate_func = dot_rate_func
+        super().__init__(lattice, **kwargs)
+
+    def begin(self):
+        self.target_centers = self.mobject.centers
+        self.target_radius = self.mobject.radius
+        n = len(self.target_centers)
+        # Start and length of each dot in [0, 1], as in a LaggedStart.
+        self.dot_length = 1 / (1 + self.dot_lag_ratio * max(n - 1, 0))
+        self.dot_starts = np.arange(n) * self.dot_lag_ratio * self.dot_length
+        super().begin()
+
+    def interpolate_mobject(self, alpha):
+        local = np.clip((alpha - self.dot_starts) / self.dot_length, 0, 1)
+        scales = np.vectorize(self.dot_rate_func, otypes=[float])(local)
+        self.mobject._rebuild(self.target_centers, self.target_radius, scales)
+
+
+def rectangular(rows, columns, spacing=1.0):
+    """Rows from top to bottom, the lattice centred on the origin.
+
+    Returns the centres and the (row, column) of each dot.
+    """
+    row, column = np.divmod(np.arange(rows * columns), columns)
+    centers = np.stack([
+        (column - (columns - 1) / 2) * spacing,
+        ((rows - 1) / 2 - row) * spacing,
+        np.zeros(rows * columns),
+    ], axis=1)
+    return centers, (row, column)
+
+
+def triangular(rows, spacing=1.0):
+    """Row `r` (from the top) holds `r + 1` dots, on a regular lattice.
+
+    Returns the centres and the (row, column) of each dot.
+    """
+    row = np.repeat(np.arange(rows), np.arange(1, rows + 1))
+    column = np.arange(len(row)) - row * (row + 1) // 2
+    centers = np.stack([
+        (column - row / 2) * spacing,
+        (rows - 1 - row) * spacing * np.sqrt(3) / 2,
+        np.zeros(len(row)),
+    ], axis=1)
+    return centers, (row, column)
+
+
+def hexagonal(n, spacing=1.0, width=np.sqrt(3) / 2):
+    """The hexagonal number H_n as T_n plus three copies of T_{n-1}.
+
+    `width` is the horizontal step between the columns, in units of
+    `spacing`. Returns the centres and the sector (0 for T_n, 1 to 3 for the
+    copies of T_{n-1}) of each dot.
+    """
+    order = n - 1
+    q, r, sector = [], [], []
+
+    def add(qs, rs, label):
+        q.extend(qs)
+        r.extend(rs)
+        sector.extend([label] * len(qs))
+
+    # T_n: the large upper-right sector.
+    for i in range(order + 1):
+        rs = range(-order, i - order + 1)
+        add([i] * len(rs), rs, 0)
+    # Three copies of T_{n-1} around the other sides.
+    for i in range(-order, 0):
+        start = -order - i
+        rs = range(start, start - i)
+        add([i] * len(rs), rs, 1)
+    for i in range(-order, 0):
+        rs = range(-2 * i - order, order + 1, 2)
+        add([i] * len(rs), rs, 2)
+    for i in range(order):
+        rs = range(i - order + 2, order - i + 1, 2)
+        add([i] * len(rs), rs, 3)
+
+    q, r = np.array(q, dtype=float), np.array(r, dtype=float)
+    centers = np.stack([
+        width * spacing * q,
+        -spacing * (q / 2 + r),
+        np.zeros(len(q)),
+    ], axis=1)
+    return centers, np.array(sector)
+
+
+def centred(sides, n, spacing=1.0):
+    """Centred polygonal number: a centre dot and `n - 1` polygonal rings.
+
+    Ring `k` is a regular polygon with `k` dots per side, so that
+    `centred(3, n)` gives the centred triangular numbers and `centred(6, n)`
+    the centred hexagonal ones. Returns the centres and the ring of each dot.
+    """
+    centers, ring = [np.zeros((1, 3))], [np.zeros(1, dtype=int)]
+    angles = np.pi / 2 + 2 * np.pi * np.arange(sides + 1) / sides
+    unit = np.stack([np.cos(angles), np.sin(angles), np.zeros(sides + 1)], 1)
+    for k in range(1, n):
+        # Distance of the vertices for a side of k * spacing.
+        vertices = unit * k * spacing / (2 * np.sin(np.pi / sides))
+        t = (np.arange(k) / k)[None, :, None]
+        points = vertices[:-1, None] + t * (vertices[1:] - vertices[:-1])[:, None]
+        centers.append(points.reshape(-1, 3))
+        ring.append(np.full(sides * k, k))
+    return np.concatenate(centers), np.concatenate(ring)
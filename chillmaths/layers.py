@@ -0,0 +1,207 @@
+"""
+Cache the static layers of a scene across and within its animations.
+
+For each animation, manim draws the mobjects placed before the first moving
+one into a background image, then draws every other mobject on it, frame
+after frame. `LayerCachedRenderer` goes further:
+
+- the background is kept from one animation to the next, and only drawn
+  again when its fingerprint changes (points, colours, stroke widths and
+  z-index of the static mobjects, state of the camera);
+- the static mobjects placed after the last moving one (a label added late,
+  a finished construction line, ...) are drawn once into a transparent
+  overlay, composited over each frame instead of being rasterised again.
+
+Both fingerprints are checked on every frame: a static mobject modified by
+the updater of another one invalidates its layer, which is drawn again (the
+background) or dropped for the rest of the animation (the overlay).
+"""
+import hashlib
+
+import numpy as np
+
+from manim import ThreeDCamera
+from manim.renderer.cairo_renderer import CairoRenderer
+
+_STYLE = (
+    "fill_rgbas", "stroke_rgbas", "background_stroke_rgbas", "stroke_width",
+    "background_stroke_width", "sheen_factor", "sheen_direction", "z_index",
+    "shade_in_3d", "pixel_array",
+)
+
+
+def fingerprint(mobjects, camera=None) -> bytes:
+    """Digest of the points and style of mobjects, and of the camera."""
+    digest = hashlib.blake2b(digest_size=16)
+    for mob in mobjects:
+        digest.update(id(mob).to_bytes(8, "little"))
+        digest.update(np.ascontiguousarray(mob.points).tobytes())
+        for attr in _STYLE:
+            value = getattr(mob, attr, None)
+            if value is not None:
+                digest.update(np.ascontiguousarray(value).tobytes())
+    if camera is not None:
+        state = [
+            *camera.frame_center, camera.frame_width, camera.frame_height,
+            camera.background_opacity,
+        ]
+        state += [t.get_value() for t in getattr(camera, "get_value_trackers", list)()]
+        digest.update(np.array(state, dtype=float).tobytes())
+        digest.update(str(camera.background_color).encode())
+    return digest.digest()
+
+
+class Overlay:
+    """Premultiplied RGBA image of static mobjects, cropped to its pixels.
+
+    `below` are the moving mobjects drawn under it, on each frame.
+    """
+    def __init__(self, mobjects, below, key, image):
+        self.mobjects = mobjects
+        self.below = below
+        self.key = key
+        rows = np.flatnonzero(image[:, :, 3].any(axis=1))
+        columns = np.flatnonzero(image[:, :, 3].any(axis=0))
+        self.window = None
+        if len(rows):
+            self.window = (
+                slice(rows[0], rows[-1] + 1), slice(columns[0], columns[-1] + 1)
+            )
+            crop = image[self.window]
+            self.over = crop.astype(np.uint16)
+            self.under = 255 - self.over[:, :, 3:]
+
+    def composite(self, pixel_array):
+        if self.window is None:
+            return
+        region = pixel_array[self.window]
+        region[:] = self.over + (region * self.under + 127) // 255
+
+
+class LayerCachedRenderer(CairoRenderer):
+    """CairoRenderer keeping the static layers of the scene between frames.
+
+    Attributes
+    ----------
+    layers_drawn, layers_reused : int
+        Backgrounds rasterised, and reused from the previous animation.
+    overlay_frames : int
+        Frames whose foreground static mobjects came from an overlay.
+    invalidations : int
+        Layers invalidated during an animation.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.static_mobjects = []
+        self.background_key = None
+        self.background = None
+        self.overlay = None
+        self.layers_drawn = 0
+        self.layers_reused = 0
+        self.overlay_frames = 0
+        self.invalidations = 0
+
+    def _draw_background(self, scene):
+        super().save_static_frame_data(scene, self.static_mobjects)
+        self.background = self.static_image
+        self.layers_drawn += 1
+
+    def save_static_frame_data(self, scene, static_mobjects):
+        self.static_mobjects = list(static_mobjects or [])
+        previous, self.overlay = self.overlay, None
+        if not self.static_mobjects:
+            self.static_image = self.background_key = None
+        else:
+            key = fingerprint(self.static_mobjects, self.camera)
+            if key == self.background_key:
+                self.static_image = self.background
+                self.layers_reused += 1
+            else:
+                self._draw_background(scene)
+                self.background_key = key
+        if not scene.is_current_animation_frozen_frame():
+            self.overlay = self._make_overlay(scene, previous)
+        return self.static_image
+
+    def _make_overlay(self, scene, previous):
+        """Overlay of the moving mobjects placed after every really moving
+        one, i.e. neither animated, nor updated, nor in the foreground."""
+        if isinstance(self.camera, ThreeDCamera):
+            # The 3D camera sorts the mobjects by depth, not by order.
+            return None
+        active = set()
+        for animation in scene.animations:
+            if animation.mobject is not None:
+                active.update(map(id, animation.mobject.get_family()))
+        for mob in [*scene.moving_mobjects, *scene.foreground_mobjects]:
+            if mob.updaters:
+                active.update(map(id, mob.get_family()))
+        active.update(
+            id(m) for mob in scene.foreground_mobjects for m in mob.get_family()
+        )
+        frame = getattr(self.camera, "frame", None)
+        if frame is not None and (id(frame) in active or frame.get_family_updaters()):
+            return None
+        moving = scene.moving_mobjects
+        last = max(
+            (i for i, mob in enumerate(moving) if id(mob) in active), default=-1
+        )
+        mobjects = [mob for mob in moving[last + 1:] if mob.has_points()]
+        if last < 0 or not mobjects:
+            return None
+        key = fingerprint(mobjects, self.camera)
+        if previous is not None and previous.key == key:
+            previous.below = moving[:last + 1]
+            return previous
+        pixel_array = self.camera.pixel_array
+        saved = pixel_array.copy()
+        pixel_array[:] = 0
+        self.camera.capture_mobjects(mobjects, include_submobjects=False)
+        overlay = Overlay(mobjects, moving[:last + 1], key, pixel_array.copy())
+        pixel_array[:] = saved
+        return overlay
+
+    def render(self, scene, time, moving_mobjects=None):
+        if self.static_mobjects:
+            key = fingerprint(self.static_mobjects, self.camera)
+            if key != self.background_key:
+                self._draw_background(scene)
+                self.background_key = key
+                self.invalidations += 1
+        overlay = self.overlay
+        if overlay is not None and fingerprint(overlay.mobjects, self.camera) != overlay.key:
+            self.overlay = overlay = None
+            self.invalidations += 1
+        if overlay is None:
+            return super().render(scene, time, moving_mobjects)
+        # The moving mobjects are the flattened families of the scene, in
+        # drawing order: the ones under the overlay are drawn one by one, as
+        # excluding the overlay would exclude the families of its mobjects.
+        self.update_frame(scene, overlay.below, include_submobjects=False)
+        overlay.composite(self.camera.pixel_array)
+        self.overlay_frames += 1
+        self.add_frame(self.get_frame())
+
+
+def use_layer_cache(scene):
+    """Swap the renderer of a freshly created scene for a LayerCachedRenderer.
+
+    To be called before any other change to the renderer or its file writer.
+    """
+    scene.renderer = LayerCachedRenderer(
+        camera_class=scene.camera_class,
+        skip_animations=scene.renderer._original_skipping_status,
+    )
+    scene.renderer.init_scene(scene)
+    return scene
+
+
+def layer_report(scene) -> dict:
+    """Layers drawn and reused by the LayerCachedRenderer of a rendered scene."""
+    renderer = scene.renderer
+    return {
+        "layers_drawn": getattr(renderer, "layers_drawn", 0),
+        "layers_reused": getattr(renderer, "layers_reused", 0),
+        "overlay_frames": getattr(renderer, "overlay_frames", 0),
+        "layer_invalidations": getattr(renderer, "invalidations", 0),
+    }
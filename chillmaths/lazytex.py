@@ -0,0 +1,156 @@
+"""
+Lazy `Tex`: LaTeX compiled in bulk, when the first of them is used.
+
+A `LazyTex` records its strings when it is created and compiles nothing. The
+first time one is used (drawn, measured, added to a group that arranges it,
+...), every expression recorded so far is compiled at once, in multi-page
+documents on a thread pool (see `chillmaths.texcache`), and the object turns
+into the plain `Tex` it stands for. The next ones find their SVG in manim's
+cache.
+
+The placements chained to the creation, as in
+
+    txt_a = LazyTex(r"$a$", font_size=36, color=BLACK).\\
+        next_to(rect_a, UP, buff=0.1)
+
+are recorded too, the point they move to being read at once from the target,
+so a run of labels does not compile them one by one.
+"""
+import inspect
+
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from manim import config
+from manim import MathTex, Mobject, Tex
+
+from chillmaths.texcache import TexCall, compile_all, missing_expressions
+
+# Chained calls recorded instead of compiling the LaTeX.
+DEFERRED = ("move_to", "next_to", "shift", "scale")
+
+
+@dataclass(eq=False)
+class Request:
+    """The arguments of a lazy Tex, and the placements to replay."""
+    cls: type
+    args: tuple
+    kwargs: dict
+    calls: list = field(default_factory=list)
+
+    def tex_call(self) -> TexCall:
+        environment, separator = {
+            Tex: ("center", ""), MathTex: ("align*", " "),
+        }[self.cls]
+        kwargs = self.kwargs
+        return TexCall(
+            self.args,
+            kwargs.get("tex_environment", environment),
+            kwargs.get("arg_separator", separator),
+            tuple(kwargs.get("substrings_to_isolate") or ())
+            + tuple(kwargs.get("tex_to_color_map") or {}),
+        )
+
+
+# Requests whose LaTeX is not compiled yet.
+_pending = []
+
+
+def flush(jobs=None) -> int:
+    """Compile the LaTeX of every pending request, return the expressions
+    compiled."""
+    by_template = {}
+    for request in _pending:
+        template = request.kwargs.get("tex_template") or config["tex_template"]
+        by_template.setdefault(id(template), (template, []))[1].append(request)
+    _pending.clear()
+
+    compiled = 0
+    for template, requests in by_template.values():
+        missing = missing_expressions(
+            {request.tex_call() for request in requests}, template
+        )
+        # A failing expression is compiled, and reported, by its own Tex.
+        compile_all(missing, template, jobs, errors="ignore")
+        compiled += len(missing)
+    return compiled
+
+
+def _bind(method, mobject, *args, **kwargs) -> dict:
+    """The arguments of a method call, by name and with the defaults."""
+    bound = inspect.signature(method).bind(mobject, *args, **kwargs)
+    bound.apply_defaults()
+    return dict(list(bound.arguments.items())[1:])
+
+
+class _Lazy:
+    """Mixin deferring the `__init__` of a `Tex` class to its first use."""
+
+    def __init__(self, *tex_strings, **kwargs):
+        request = Request(self._lazy_class, tex_strings, kwargs)
+        object.__setattr__(self, "_lazy_request", request)
+        _pending.append(request)
+
+    def __getattribute__(self, name):
+        if name.startswith("_lazy") or name in ("__class__", "__dict__"):
+            return object.__getattribute__(self, name)
+        if name in DEFERRED:
+            return object.__getattribute__(self, f"_lazy_{name}")
+        realise(self)
+        return object.__getattribute__(self, name)
+
+    def _lazy_record(self, name, *args, **kwargs):
+        self._lazy_request.calls.append((name, args, kwargs))
+        return self
+
+    def _lazy_move_to(self, *args, **kwargs):
+        arguments = _bind(Mobject.move_to, self, *args, **kwargs)
+        target = arguments["point_or_mobject"]
+        if isinstance(target, Mobject):
+            arguments["point_or_mobject"] = target.get_critical_point(
+                arguments["aligned_edge"]
+            )
+        return self._lazy_record("move_to", **arguments)
+
+    def _lazy_next_to(self, *args, **kwargs):
+        arguments = _bind(Mobject.next_to, self, *args, **kwargs)
+        target = arguments["mobject_or_point"]
+        if isinstance(target, Mobject):
+            # As `Mobject.next_to` does, with the target as it is now.
+            index = arguments["index_of_submobject_to_align"]
+            if index is not None:
+                target = target[index]
+            arguments["mobject_or_point"] = target.get_critical_point(
+                np.asarray(arguments["aligned_edge"])
+                + np.asarray(arguments["direction"])
+            )
+        return self._lazy_record("next_to", **arguments)
+
+    def _lazy_shift(self, *vectors):
+        return self._lazy_record("shift", *vectors)
+
+    def _lazy_scale(self, scale_factor, **kwargs):
+        return self._lazy_record("scale", scale_factor, **kwargs)
+
+
+def realise(mobject) -> None:
+    """Turn a lazy Tex into the Tex it stands for."""
+    request = object.__getattribute__(mobject, "_lazy_request")
+    if request in _pending:
+        flush()
+    object.__setattr__(mobject, "__class__", request.cls)
+    del mobject.__dict__["_lazy_request"]
+    request.cls.__init__(mobject, *request.args, **request.kwargs)
+    for name, args, kwargs in request.calls:
+        getattr(mobject, name)(*args, **kwargs)
+
+
+class LazyTex(_Lazy, Tex):
+    """A `Tex` compiled with the other pending ones, on its first use."""
+    _lazy_class = Tex
+
+
+class LazyMathTex(_Lazy, MathTex):
+    """A `MathTex` compiled with the other pending ones, on its first use."""
+    _lazy_class = MathTex
@@ -0,0 +1,225 @@
+"""
+Play back a timeline baked by `chillmaths.bake`, at any resolution and fps.
+
+Usage:
+    python -m chillmaths.player [--height 1920] [--fps 30] [-o OUT] BAKED
+
+The player needs numpy, pycairo and PyAV only: neither manim nor the scene
+is imported, re-encoding a scene is rasterisation only. Each frame is drawn
+as manim's camera draws the VMobjects (background stroke, fill, stroke) from
+the sample at its time. Between two samples of the same animation the points
+and styles are interpolated when the display lists match, so a timeline
+baked at 60 samples per second plays at any frame rate.
+"""
+import argparse
+import json
+import sys
+
+from dataclasses import dataclass
+from fractions import Fraction
+from pathlib import Path
+
+import av
+import cairo
+import numpy as np
+
+# Bumped when the layout of the baked files changes.
+FORMAT_VERSION = 1
+
+# Columns of the style of a mobject state.
+STYLE_COLUMNS = (
+    "fill_r", "fill_g", "fill_b", "fill_a",
+    "stroke_r", "stroke_g", "stroke_b", "stroke_a", "stroke_width",
+    "background_r", "background_g", "background_b", "background_a",
+    "background_width", "joint_type", "cap_style",
+)
+FILL, STROKE, STROKE_WIDTH = slice(0, 4), slice(4, 8), 8
+BACKGROUND, BACKGROUND_WIDTH = slice(9, 13), 13
+JOINT_TYPE, CAP_STYLE = 14, 15
+
+# manim's `LineJointType` and `CapStyleType`, 0 being cairo's default.
+LINE_JOINS = {1: cairo.LineJoin.ROUND, 2: cairo.LineJoin.BEVEL, 3: cairo.LineJoin.MITER}
+LINE_CAPS = {1: cairo.LineCap.ROUND, 2: cairo.LineCap.BUTT, 3: cairo.LineCap.SQUARE}
+
+# Stroke widths are in hundredths of a scene unit, as in manim's camera.
+LINE_WIDTH_MULTIPLE = 0.01
+
+
+@dataclass
+class Baked:
+    """The arrays of a baked file, see `chillmaths.bake.Timeline`."""
+    meta: dict
+    points: np.ndarray
+    point_starts: np.ndarray
+    styles: np.ndarray
+    times: np.ndarray
+    cameras: np.ndarray
+    sample_segments: np.ndarray
+    items: np.ndarray
+    item_starts: np.ndarray
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            meta = json.loads(str(data["meta"]))
+            if meta["version"] != FORMAT_VERSION:
+                raise ValueError(
+                    f"{path} is a version {meta['version']} timeline, "
+                    f"expected {FORMAT_VERSION}: bake the scene again"
+                )
+            return cls(meta, **{
+                name: data[name] for name in cls.__dataclass_fields__
+                if name != "meta"
+            })
+
+    def state_points(self, state):
+        return self.points[self.point_starts[state]:self.point_starts[state + 1]]
+
+    def sample_states(self, sample):
+        return self.items[self.item_starts[sample]:self.item_starts[sample + 1]]
+
+    def display_list(self, t) -> tuple[np.ndarray, list]:
+        """The camera frame and the (points, style) of each mobject at time
+        `t`, interpolated between the two samples around it if possible."""
+        sample = max(int(np.searchsorted(self.times, t, side="right")) - 1, 0)
+        states = self.sample_states(sample)
+        display = [(self.state_points(s), self.styles[s]) for s in states]
+        camera = self.cameras[sample]
+
+        following = sample + 1
+        if (
+            following == len(self.times)
+            or self.sample_segments[following] != self.sample_segments[sample]
+        ):
+            return camera, display
+        next_states = self.sample_states(following)
+        next_display = [(self.state_points(s), self.styles[s]) for s in next_states]
+        if len(next_display) != len(display) or any(
+            len(a) != len(b) for (a, _), (b, _) in zip(display, next_display)
+        ):
+            return camera, display
+        w = (t - self.times[sample]) / (self.times[following] - self.times[sample])
+        return camera + w * (self.cameras[following] - camera), [
+            (points + w * (next_points - points), style + w * (next_style - style))
+            for (points, style), (next_points, next_style)
+            in zip(display, next_display)
+        ]
+
+
+def _is_close(a, b) -> bool:
+    # As `VMobject.consider_points_equals_2d`.
+    return bool(np.all(np.isclose(a, b, rtol=1e-5, atol=1e-6)))
+
+
+def set_path(ctx, points):
+    """The cubic bezier curves of a mobject as the current cairo path, one
+    subpath per run of contiguous curves, closed when it loops."""
+    quads = points[:len(points) // 4 * 4].reshape(-1, 4, 2)
+    ctx.new_path()
+    if not len(quads):
+        return
+    gaps = ~np.all(np.isclose(quads[1:, 0], quads[:-1, 3], rtol=1e-5, atol=1e-6), axis=1)
+    bounds = [0, *(np.flatnonzero(gaps) + 1), len(quads)]
+    for first, last in zip(bounds[:-1], bounds[1:]):
+        ctx.new_sub_path()
+        ctx.move_to(*quads[first, 0])
+        for _, p1, p2, p3 in quads[first:last]:
+            ctx.curve_to(*p1, *p2, *p3)
+        if _is_close(quads[first, 0], quads[last - 1, 3]):
+            ctx.close_path()
+
+
+def _set_color(ctx, rgba):
+    # The pixel array is RGBA, which cairo reads as BGRA.
+    ctx.set_source_rgba(rgba[2], rgba[1], rgba[0], rgba[3])
+
+
+def _stroke(ctx, rgba, width, style):
+    if width <= 0:
+        return
+    _set_color(ctx, rgba)
+    ctx.set_line_width(width * LINE_WIDTH_MULTIPLE)
+    if style[JOINT_TYPE] in LINE_JOINS:
+        ctx.set_line_join(LINE_JOINS[style[JOINT_TYPE]])
+    if style[CAP_STYLE] in LINE_CAPS:
+        ctx.set_line_cap(LINE_CAPS[style[CAP_STYLE]])
+    ctx.stroke_preserve()
+
+
+def draw(baked, t, width, height) -> np.ndarray:
+    """The frame at time `t`, as a (height, width, 4) RGBA array."""
+    camera, display = baked.display_list(t)
+    cx, cy, fw, fh = camera
+    pixels = np.empty((height, width, 4), dtype=np.uint8)
+    pixels[:] = np.round(255 * np.asarray(baked.meta["background"]))
+    surface = cairo.ImageSurface.create_for_data(
+        pixels.data, cairo.FORMAT_ARGB32, width, height
+    )
+    ctx = cairo.Context(surface)
+    ctx.set_matrix(cairo.Matrix(
+        width / fw, 0, 0, -height / fh,
+        width / 2 - cx * width / fw, height / 2 + cy * height / fh,
+    ))
+    for points, style in display:
+        set_path(ctx, points)
+        _stroke(ctx, style[BACKGROUND], style[BACKGROUND_WIDTH], style)
+        _set_color(ctx, style[FILL])
+        ctx.fill_preserve()
+        _stroke(ctx, style[STROKE], style[STROKE_WIDTH], style)
+    surface.finish()
+    return pixels
+
+
+def play(baked, output, height=None, fps=None) -> int:
+    """Encode a baked timeline, return the number of frames."""
+    meta = baked.meta
+    height = height or meta["pixel_height"]
+    # Even dimensions, for yuv420p.
+    height += height % 2
+    width = round(height * meta["pixel_width"] / meta["pixel_height"])
+    width += width % 2
+    fps = fps or meta["frame_rate"]
+    frames = round(meta["duration"] * fps)
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with av.open(str(output), mode="w") as container:
+        stream = container.add_stream("libx264", rate=Fraction(fps).limit_denominator())
+        stream.width, stream.height = width, height
+        stream.pix_fmt = "yuv420p"
+        for frame in range(frames):
+            image = draw(baked, frame / fps, width, height)
+            video_frame = av.VideoFrame.from_ndarray(image, format="rgba")
+            for packet in stream.encode(video_frame):
+                container.mux(packet)
+        for packet in stream.encode():
+            container.mux(packet)
+    return frames
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m chillmaths.player",
+        description="Rasterise a timeline baked by chillmaths.bake.",
+    )
+    parser.add_argument("baked", type=Path)
+    parser.add_argument(
+        "--height", type=int, help="pixel height (default: the baked one)",
+    )
+    parser.add_argument(
+        "--fps", type=float, help="frame rate (default: the baked one)",
+    )
+    parser.add_argument(
+        "-o", "--output", type=Path,
+        help="movie to write (default: next to the baked file, .mp4)",
+    )
+    args = parser.parse_args(argv)
+
+    baked = Baked.load(args.baked)
+    output = args.output or args.baked.with_suffix(".mp4")
+    frames = play(baked, output, args.height, args.fps)
+    print(f"{frames} frames written in {output}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,353 @@
+"""
+Profile the render of a scene, one record per `self.play`/`self.wait`.
+
+Usage:
+    python -m chillmaths.profile [-q l] FILE SCENE
+    python -m chillmaths.profile --summary [--top 20]
+
+Each record covers a call and the scene code run since the previous one, its
+time split into phases:
+
+- construction: the scene code, building the mobjects;
+- latex, fonts: compiling `Tex` and shaping `Text` in that code;
+- setup: preparing the animations (copies, alignment, static frame);
+- hashing: the hash of the play call for manim's partial movie cache;
+- interpolation, updaters: computing the frames;
+- rasterise: drawing the frames with Cairo;
+- encode_wait: waiting for the encoder at the end of the call;
+- encode: encoding, in the writer thread (overlaps the other phases).
+
+The profiles are written as JSON next to a Chrome trace (chrome://tracing,
+ui.perfetto.dev) in ``media/profiles``; `--summary` ranks the most expensive
+calls of all the profiles found there.
+"""
+import argparse
+import functools
+import json
+import resource
+import sys
+import threading
+import time
+
+from pathlib import Path
+
+from chillmaths import ROOT
+
+PROFILE_DIR = "profiles"
+
+PHASES = (
+    "construction", "latex", "fonts", "setup", "hashing",
+    "interpolation", "updaters", "rasterise", "encode_wait", "encode",
+    "combine",
+)
+
+
+def peak_rss_mb() -> float:
+    """Peak resident memory of the process so far, in MiB (Linux)."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def describe(args) -> tuple[str, str]:
+    """Kind ("play" or "wait") and short description of a play call."""
+    from manim import Wait
+
+    names = []
+    for arg in args:
+        if hasattr(arg, "mobject") and hasattr(arg, "interpolate"):
+            mobject = type(arg.mobject).__name__ if arg.mobject is not None else ""
+            names.append(f"{type(arg).__name__}({mobject})")
+        else:
+            names.append(type(arg).__name__)
+    kind = "wait" if args and all(isinstance(a, Wait) for a in args) else "play"
+    return kind, ", ".join(names)
+
+
+class Profiler:
+    """Exclusive time per phase of a scene render.
+
+    The phases nest (the LaTeX of a `Tex` built by an updater is counted as
+    latex, not as updaters): entering a phase pauses the enclosing one.
+    """
+    def __init__(self):
+        self.origin = time.perf_counter()
+        self.records = []
+        self.spans = []
+        self.lock = threading.Lock()
+        self.stack = []
+        self._patches = []
+        self._new_record()
+
+    def _new_record(self):
+        self.current = {
+            "index": len(self.records),
+            "phases": dict.fromkeys(PHASES, 0.0),
+            "start": time.perf_counter() - self.origin,
+        }
+
+    def _add(self, phase, duration):
+        with self.lock:
+            self.current["phases"][phase] += duration
+
+    def push(self, phase):
+        now = time.perf_counter()
+        if self.stack:
+            self._add(self.stack[-1][0], now - self.stack[-1][1])
+        # phase, last resumed, started
+        self.stack.append([phase, now, now])
+
+    def pop(self):
+        now = time.perf_counter()
+        phase, resumed, started = self.stack.pop()
+        self._add(phase, now - resumed)
+        self.spans.append((phase, started - self.origin, now - started, 0))
+        if self.stack:
+            self.stack[-1][1] = now
+
+    def timed(self, phase, function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            self.push(phase)
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self.pop()
+        return wrapper
+
+    def timed_in_thread(self, phase, function):
+        """Time a function run in another thread, without the phase stack."""
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                duration = time.perf_counter() - start
+                self._add(phase, duration)
+                with self.lock:
+                    self.spans.append((phase, start - self.origin, duration, 1))
+        return wrapper
+
+    def patch(self, owner, name, wrapper):
+        self._patches.append((owner, name, owner.__dict__.get(name)))
+        setattr(owner, name, wrapper(getattr(owner, name)))
+
+    def unpatch(self):
+        for owner, name, original in reversed(self._patches):
+            if original is None:
+                delattr(owner, name)
+            else:
+                setattr(owner, name, original)
+        self._patches.clear()
+
+    def end_record(self, scene, **fields):
+        renderer = scene.renderer
+        self.current.update(fields)
+        self.current.update(
+            end=time.perf_counter() - self.origin,
+            mobjects=len(scene.get_mobject_family_members()),
+            moving_mobjects=len(getattr(scene, "moving_mobjects", None) or []),
+            peak_rss_mb=peak_rss_mb(),
+            time=renderer.time,
+        )
+        self.current["wall_time"] = self.current["end"] - self.current["start"]
+        self.records.append(self.current)
+        self._new_record()
+
+    def instrument(self, scene):
+        """Wrap the methods of the scene, its renderer and its file writer.
+
+        Methods are patched on the instances; the module level functions and
+        the `Text` classes are restored by `unpatch`.
+        """
+        from manim import MarkupText, Text
+        from manim.mobject.text import tex_mobject
+        from manim.renderer import cairo_renderer
+
+        from chillmaths import lazytex
+
+        renderer = scene.renderer
+        writer = renderer.file_writer
+        self.patch(tex_mobject, "tex_to_svg_file", functools.partial(self.timed, "latex"))
+        self.patch(lazytex, "flush", functools.partial(self.timed, "latex"))
+        self.patch(Text, "_text2svg", functools.partial(self.timed, "fonts"))
+        self.patch(MarkupText, "_text2svg", functools.partial(self.timed, "fonts"))
+        self.patch(
+            cairo_renderer, "get_hash_from_play_call",
+            functools.partial(self.timed, "hashing"),
+        )
+        scene.update_to_time = self.timed("interpolation", scene.update_to_time)
+        scene.update_mobjects = self.timed("updaters", scene.update_mobjects)
+        renderer.update_frame = self.timed("rasterise", renderer.update_frame)
+        writer.encode_and_write_frame = self.timed_in_thread(
+            "encode", writer.encode_and_write_frame
+        )
+        writer.close_partial_movie_stream = self.timed(
+            "encode_wait", writer.close_partial_movie_stream
+        )
+        writer.combine_to_movie = self.timed("combine", writer.combine_to_movie)
+
+        play = scene.play
+
+        @functools.wraps(play)
+        def profiled_play(*args, **kwargs):
+            kind, animations = describe(args)
+            time_before = renderer.time
+            self.push("setup")
+            try:
+                return play(*args, **kwargs)
+            finally:
+                self.pop()
+                self.end_record(
+                    scene, kind=kind, animations=animations,
+                    frames=round((renderer.time - time_before) * scene.camera.frame_rate),
+                )
+
+        scene.play = profiled_play
+
+    def render(self, scene):
+        """Render an instrumented scene; the code after the last call and
+        the final combination of the movie make the last record."""
+        self.instrument(scene)
+        self.push("construction")
+        try:
+            scene.render()
+        finally:
+            self.pop()
+            self.unpatch()
+            self.end_record(scene, kind="finish", animations="", frames=0)
+
+    def report(self) -> dict:
+        totals = dict.fromkeys(PHASES, 0.0)
+        for record in self.records:
+            for phase, duration in record["phases"].items():
+                totals[phase] += duration
+        return {
+            "wall_time": self.records[-1]["end"] if self.records else 0.0,
+            "peak_rss_mb": peak_rss_mb(),
+            "phases": totals,
+            "calls": self.records,
+        }
+
+    def chrome_trace(self, name="scene") -> dict:
+        """The calls and the phase spans, in the Chrome trace event format."""
+        events = [
+            {"ph": "M", "name": "thread_name", "pid": 0, "tid": 0,
+             "args": {"name": name}},
+            {"ph": "M", "name": "thread_name", "pid": 0, "tid": 1,
+             "args": {"name": "encoder"}},
+        ]
+        for record in self.records:
+            events.append({
+                "ph": "X", "pid": 0, "tid": 0,
+                "name": f"{record['kind']} {record['index']}: {record['animations']}",
+                "ts": record["start"] * 1e6,
+                "dur": record["wall_time"] * 1e6,
+                "args": {
+                    key: record[key] for key in (
+                        "phases", "frames", "mobjects", "moving_mobjects",
+                        "peak_rss_mb",
+                    )
+                },
+            })
+        for phase, start, duration, tid in self.spans:
+            events.append({
+                "ph": "X", "pid": 0, "tid": tid, "name": phase,
+                "ts": start * 1e6, "dur": duration * 1e6,
+            })
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+def profile_paths(media_dir: Path, path: str, name: str) -> tuple[Path, Path]:
+    stem = f"{Path(path).with_suffix('').as_posix().replace('/', '__')}__{name}"
+    directory = Path(media_dir) / PROFILE_DIR
+    return directory / f"{stem}.json", directory / f"{stem}.trace.json"
+
+
+def write_profile(profiler, media_dir, path, name, **meta) -> Path:
+    """Write the JSON profile and the Chrome trace of a render."""
+    json_path, trace_path = profile_paths(media_dir, path, name)
+    json_path.parent.mkdir(parents=True, exist_ok=True)
+    report = {"file": path, "scene": name, **meta, **profiler.report()}
+    json_path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    trace_path.write_text(
+        json.dumps(profiler.chrome_trace(f"{path}::{name}")), encoding="utf-8"
+    )
+    return json_path
+
+
+def load_profiles(media_dir: Path) -> list[dict]:
+    directory = Path(media_dir) / PROFILE_DIR
+    return [
+        json.loads(p.read_text(encoding="utf-8"))
+        for p in sorted(directory.glob("*.json"))
+        if not p.name.endswith(".trace.json")
+    ]
+
+
+def summary(profiles, top=20) -> str:
+    """Table of the most expensive calls of all the profiles."""
+    calls = [
+        (profile, call)
+        for profile in profiles
+        for call in profile["calls"]
+    ]
+    calls.sort(key=lambda item: item[1]["wall_time"], reverse=True)
+    lines = [
+        f"{'time':>8}  {'main phase':<14} {'frames':>6} {'mobjects':>8}  "
+        "call"
+    ]
+    for profile, call in calls[:top]:
+        phases = {k: v for k, v in call["phases"].items() if k != "encode"}
+        phase = max(phases, key=phases.get)
+        lines.append(
+            f"{call['wall_time']:>7.2f}s  {phase:<14} {call['frames']:>6} "
+            f"{call['mobjects']:>8}  {profile['file']}::{profile['scene']} "
+            f"#{call['index']} {call['kind']} {call['animations']}"[:160]
+        )
+
+    totals = dict.fromkeys(PHASES, 0.0)
+    for profile in profiles:
+        for phase, duration in profile["phases"].items():
+            totals[phase] += duration
+    lines.append("")
+    lines.append(f"Catalogue ({len(profiles)} scenes):")
+    for phase, duration in sorted(totals.items(), key=lambda t: -t[1]):
+        lines.append(f"  {phase:<14} {duration:>9.2f}s")
+    return "\n".join(lines)
+
+
+def main(argv=None) -> int:
+    from chillmaths.batch import MEDIA_DIR, QUALITIES, render_entry
+
+    parser = argparse.ArgumentParser(
+        prog="python -m chillmaths.profile",
+        description="Profile the render of a scene, or summarise the "
+                    "profiles of the catalogue.",
+    )
+    parser.add_argument("file", nargs="?")
+    parser.add_argument("scene", nargs="?")
+    parser.add_argument(
+        "-q", "--quality", choices=sorted(QUALITIES), default="l",
+    )
+    parser.add_argument("--summary", action="store_true")
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument("--media-dir", type=Path, default=MEDIA_DIR)
+    args = parser.parse_args(argv)
+
+    if not args.summary:
+        if args.file is None or args.scene is None:
+            parser.error("FILE and SCENE are required without --summary")
+        path = Path(args.file).resolve().relative_to(ROOT).as_posix()
+        result = render_entry(
+            path, args.scene, args.quality, str(args.media_dir), profile=True,
+        )
+        if result["status"] == "failed":
+            print(result["error"], file=sys.stderr)
+            return 1
+        print(f"Profile written in {result['profile']}", file=sys.stderr)
+    print(summary(load_profiles(args.media_dir), args.top))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
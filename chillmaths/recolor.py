@@ -0,0 +1,175 @@
+"""
+Colour-only transforms.
+
+`Recolor(mobject, target)` animates a mobject to the colours of a target of
+the same shape, typically a recoloured copy. The points are neither aligned
+nor interpolated: the fill and stroke colours of the whole family are stacked
+in one array, interpolated in one step and handed back to each submobject.
+
+    target = l_figure.copy()
+    target[0].set_cell_fill(GREEN)
+    self.play(Recolor(l_figure, target))
+
+The cells of a `SquareGrid` are regrouped for the animation by their current
+and target fills, so a grid still takes one VMobject per pair of colours.
+
+`RotateAndColor` turns a mobject while its fill changes colour, the points
+rotated from their starting positions by one matrix product per frame.
+"""
+import numpy as np
+
+from manim import Animation, ManimColor
+from manim import OUT
+from manim.utils.iterables import stretch_array_to_length
+from manim.utils.space_ops import rotation_matrix
+
+from chillmaths.grid import SquareGrid
+
+COLOR_ATTRIBUTES = ("fill_rgbas", "stroke_rgbas")
+
+
+def _pairs(mobject, target):
+    """The (mobject, target) pairs of the two families, checked to have the
+    same points."""
+    if isinstance(mobject, SquareGrid):
+        if not (
+            isinstance(target, SquareGrid)
+            and np.array_equal(mobject.outline.points, target.outline.points)
+        ):
+            raise ValueError("Recolor needs a grid of the same cells, use Transform")
+        yield mobject, target
+        return
+    if (
+        len(mobject.submobjects) != len(target.submobjects)
+        or not np.array_equal(mobject.points, target.points)
+    ):
+        raise ValueError("Recolor needs a target of the same shape, use Transform")
+    yield mobject, target
+    for submobject, target_submobject in zip(mobject.submobjects, target.submobjects):
+        yield from _pairs(submobject, target_submobject)
+
+
+def _aligned(start, end):
+    """Both colour arrays stretched to the same number of rows."""
+    length = max(len(start), len(end))
+    return (
+        stretch_array_to_length(start, length),
+        stretch_array_to_length(end, length),
+    )
+
+
+def _rows(lengths):
+    """Slices of consecutive blocks of the given lengths."""
+    bounds = np.cumsum([0, *lengths])
+    return [slice(first, last) for first, last in zip(bounds[:-1], bounds[1:])]
+
+
+class Recolor(Animation):
+    """Interpolate the colours of a mobject to those of `target`.
+
+    The target has the same family as the mobject, with the same points;
+    `ValueError` otherwise. It is not added to the scene.
+    """
+    def __init__(self, mobject, target, **kwargs):
+        self.target = target
+        super().__init__(mobject, **kwargs)
+
+    def begin(self):
+        # (mobject, attribute, start colours, end colours)
+        entries, self.grids = [], []
+        for mobject, target in _pairs(self.mobject, self.target):
+            if isinstance(mobject, SquareGrid):
+                self.grids.append((mobject, target.fill_rgbas.copy()))
+                layers, start, end = mobject.split_fills(target.fill_rgbas)
+                entries += [
+                    (layer, "fill_rgbas", layer_start[None], layer_end[None])
+                    for layer, layer_start, layer_end in zip(layers, start, end)
+                ]
+                continue
+            for attribute in COLOR_ATTRIBUTES:
+                start = getattr(mobject, attribute, None)
+                end = getattr(target, attribute, None)
+                if start is not None and end is not None:
+                    entries.append((mobject, attribute, *_aligned(start, end)))
+
+        self.slots = [
+            (mobject, attribute, rows)
+            for (mobject, attribute, _, _), rows
+            in zip(entries, _rows(len(entry[2]) for entry in entries))
+        ]
+        self.start = np.concatenate([e[2] for e in entries] or [np.zeros((0, 4))])
+        self.end = np.concatenate([e[3] for e in entries] or [np.zeros((0, 4))])
+        super().begin()
+
+    def create_starting_mobject(self):
+        # The colours are read in `begin`, there is no need of a copy.
+        return self.mobject
+
+    def interpolate_mobject(self, alpha):
+        t = self.rate_func(alpha)
+        rgbas = self.start + t * (self.end - self.start)
+        for mobject, attribute, rows in self.slots:
+            setattr(mobject, attribute, rgbas[rows])
+
+    def finish(self):
+        super().finish()
+        for grid, fill_rgbas in self.grids:
+            grid.fill_rgbas = fill_rgbas
+            grid._rebuild()
+
+
+class RotateAndColor(Animation):
+    """Rotate a mobject by `angle` about a point (default: its center) while
+    its fill turns to `new_color`.
+
+    The same frames as `Rotate` with the target recoloured, without the
+    target: the stacked points of the family are rotated, and the fill
+    colours blended, from their values at the start of the animation.
+    """
+    def __init__(
+        self, mobject, angle, new_color, axis=OUT, about_point=None, **kwargs
+    ):
+        self.angle = angle
+        self.new_color = new_color
+        self.axis = axis
+        if about_point is None:
+            about_point = mobject.get_center()
+        self.about_point = np.array(about_point, dtype=float)
+        super().__init__(mobject, **kwargs)
+
+    def begin(self):
+        self.family = self.mobject.family_members_with_points()
+        self.start_points = np.concatenate(
+            [mobject.points for mobject in self.family]
+        ) - self.about_point
+        self.start_fill = np.concatenate(
+            [mobject.fill_rgbas for mobject in self.family]
+        )
+        self.end_fill = self.start_fill.copy()
+        self.end_fill[:, :3] = ManimColor(self.new_color).to_rgb()
+        self.point_rows = _rows(len(mobject.points) for mobject in self.family)
+        self.fill_rows = _rows(len(mobject.fill_rgbas) for mobject in self.family)
+        super().begin()
+
+    def create_starting_mobject(self):
+        # The points are read in `begin`, there is no need of a copy.
+        return self.mobject
+
+    def interpolate_mobject(self, alpha):
+        t = self.rate_func(alpha)
+        matrix = rotation_matrix(t * self.angle, self.axis)
+        points = self.start_points @ matrix.T + self.about_point
+        fill = self.start_fill + t * (self.end_fill - self.start_fill)
+        for mobject, point_rows, fill_rows in zip(
+            self.family, self.point_rows, self.fill_rows
+        ):
+            mobject.points = points[point_rows]
+            mobject.fill_rgbas = fill[fill_rows]
+
+    def finish(self):
+        super().finish()
+        # Own arrays for the points, and the new colour on the whole family.
+        for mobject in self.family:
+            mobject.points = mobject.points.copy()
+        self.mobject.set_fill(self.new_color)
+
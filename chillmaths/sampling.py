@@ -0,0 +1,157 @@
+"""
+Curves sampled where they bend, to the size of a pixel.
+
+manim samples a graph uniformly, ten points per tick, and the scenes build
+their regions from as many points of `np.linspace`: too few where the curve
+bends and far too many where it is straight. Here a curve is sampled from a
+coarse uniform grid, and an interval is split in two as long as the curve
+at its middle strays from its chord by more than a tolerance, half a pixel
+at the resolution of the render by default. The deviation of the chord is
+the curvature times the square of the length over 8, so the samples gather
+where the curve bends and a line takes a single segment.
+
+The samples are memoised by function, range, coordinates and tolerance, the
+tolerance following the resolution: a curve drawn twice, such as the sine
+wave of the outro, is sampled once per process and resolution, and preview
+renders sample less.
+
+    graph = AdaptiveGraph(np.log, (0.78, 5.55), axes=axes, color=BLACK)
+    region = Polygon(*graph_points(np.log, (a, b), axes), ...)
+"""
+from functools import lru_cache
+
+import numpy as np
+
+from manim import VMobject
+from manim import config
+
+
+def pixel_tolerance(pixels=0.5):
+    """`pixels` pixels of the render, in scene units."""
+    return pixels * config.frame_width / config.pixel_width
+
+
+def samples(point_function, t_min, t_max, tolerance, initial=16, max_depth=12):
+    """The parameters and points of a curve from `t_min` to `t_max`, the
+    polyline through them staying within `tolerance` of the curve.
+
+    `point_function` maps a parameter to a point. The curve starts as
+    `initial` uniform intervals, each split at most `max_depth` times.
+    """
+    def evaluate(ts):
+        return np.array([point_function(t) for t in ts], dtype=float)
+
+    ts = np.linspace(t_min, t_max, initial + 1)
+    points = evaluate(ts)
+    active = np.ones(initial, dtype=bool)
+    for _ in range(max_depth):
+        intervals = np.flatnonzero(active)
+        if not len(intervals):
+            break
+        middles = (ts[intervals] + ts[intervals + 1]) / 2
+        middle_points = evaluate(middles)
+        chords = (points[intervals] + points[intervals + 1]) / 2
+        bent = np.linalg.norm(middle_points - chords, axis=1) > tolerance
+        split = intervals[bent]
+        ts = np.insert(ts, split + 1, middles[bent])
+        points = np.insert(points, split + 1, middle_points[bent], axis=0)
+        # Only the halves of the intervals just split may need more.
+        halves = split + np.arange(len(split))
+        active = np.zeros(len(ts) - 1, dtype=bool)
+        active[halves] = active[halves + 1] = True
+    return ts, points
+
+
+def _frame(axes):
+    """The origin and the units of linear axes, as a hashable key; None for
+    the coordinates of the scene."""
+    if axes is None:
+        return None
+    origin = np.asarray(axes.c2p(0, 0), dtype=float)
+    return tuple(
+        tuple(float(c) for c in vector)
+        for vector in (
+            origin,
+            np.asarray(axes.c2p(1, 0), dtype=float) - origin,
+            np.asarray(axes.c2p(0, 1), dtype=float) - origin,
+        )
+    )
+
+
+def _graph_point(function, frame, x):
+    if frame is None:
+        return np.array([x, function(x), 0.0])
+    origin, x_unit, y_unit = (np.array(vector) for vector in frame)
+    return origin + x * x_unit + function(x) * y_unit
+
+
+@lru_cache(maxsize=256)
+def _graph(function, x_min, x_max, frame, tolerance):
+    _, points = samples(
+        lambda x: _graph_point(function, frame, x), x_min, x_max, tolerance
+    )
+    points.setflags(write=False)
+    return points
+
+
+@lru_cache(maxsize=256)
+def _parametric(function, t_min, t_max, tolerance):
+    _, points = samples(function, t_min, t_max, tolerance)
+    points.setflags(write=False)
+    return points
+
+
+def graph_points(function, x_range, axes=None, tolerance=None):
+    """Memoised points of the graph of `function` over `x_range`, in the
+    coordinates of linear `axes` (an `Axes`, a `NumberPlane` or a
+    `chillmaths.coords.CoordinateMap`) or of the scene."""
+    tolerance = tolerance or pixel_tolerance()
+    x_min, x_max = (float(x) for x in x_range[:2])
+    return _graph(function, x_min, x_max, _frame(axes), tolerance).copy()
+
+
+def parametric_points(function, t_range, tolerance=None):
+    """Memoised points of the curve `function` (a parameter to a point) over
+    `t_range`."""
+    tolerance = tolerance or pixel_tolerance()
+    t_min, t_max = (float(t) for t in t_range[:2])
+    return _parametric(function, t_min, t_max, tolerance).copy()
+
+
+class AdaptiveGraph(VMobject):
+    """The graph of `function` over `x_range`, as `FunctionGraph` or
+    `axes.plot` but adaptively sampled, see `graph_points`.
+
+    Like manim's graphs it has an `underlying_function` and maps `function`
+    from x to a point, so `axes.get_area` and `axes.i2gp` take it.
+    """
+    def __init__(
+        self, function, x_range, axes=None, tolerance=None,
+        use_smoothing=True, **kwargs,
+    ):
+        self.underlying_function = function
+        self.t_min, self.t_max = (float(x) for x in x_range[:2])
+        self.frame = _frame(axes)
+        self.tolerance = tolerance or pixel_tolerance()
+        self.use_smoothing = use_smoothing
+        super().__init__(**kwargs)
+
+    def function(self, x):
+        return _graph_point(self.underlying_function, self.frame, x)
+
+    def get_point_from_function(self, x):
+        return self.function(x)
+
+    def generate_points(self):
+        points = _graph(
+            self.underlying_function, self.t_min, self.t_max, self.frame,
+            self.tolerance,
+        )
+        self.start_new_path(points[0])
+        self.add_points_as_corners(points[1:])
+        if self.use_smoothing:
+            self.make_smooth()
+        return self
+
+    def init_points(self):
+        self.generate_points()
@@ -0,0 +1,272 @@
+"""
+Render one long scene on several processes.
+
+    python -m chillmaths.batch --shards 4 p16_triangle_medians
+
+A scene is split into contiguous ranges of its animations (its
+`self.play`/`self.wait` calls) of about the same number of frames, planned
+from a first run where manim skips every animation. Each shard then runs
+`construct()` and:
+
+- fast-forwards the animations before its range, frame by frame as a render
+  does (so the updaters see the same steps), without drawing nor encoding;
+- renders the animations of its range into manim's partial movie files;
+- stops the scene at the end of its range.
+
+The partial movie files of all the shards are finally combined by manim's
+own `SceneFileWriter.finish`, which remuxes them without re-encoding: the
+movie is the one of a serial render.
+"""
+import contextlib
+import os
+import time
+import traceback
+
+from pathlib import Path
+
+from chillmaths import ROOT
+from chillmaths.holds import use_hold_writer
+from chillmaths.layers import use_layer_cache
+
+
+@contextlib.contextmanager
+def scene_config(path: str, quality: str, media_dir: str):
+    """The config of a scene render in a worker, as in `render_entry`."""
+    from manim import config, tempconfig
+
+    from chillmaths.batch import QUALITIES
+
+    os.chdir(ROOT)
+    with tempconfig({
+        "input_file": path,
+        "media_dir": media_dir,
+        "progress_bar": "none",
+        "verbosity": "WARNING",
+    }):
+        config.quality = QUALITIES[quality]
+        yield config
+
+
+def load_scene(path: str, name: str):
+    """A new instance of a scene, with its format applied to the config."""
+    from manim.utils.module_ops import get_module
+
+    return getattr(get_module(Path(path)), name)()
+
+
+def plan(frames: list[int], shards: int) -> list[tuple[int, int | None]]:
+    """Split animations of the given frame counts into at most `shards`
+    contiguous ranges (first, last) of about the same number of frames.
+    The last range is open: it runs to the end of the scene."""
+    total = sum(frames)
+    ranges, first, done = [], 0, 0
+    for index, count in enumerate(frames):
+        done += count
+        if done * shards >= total * (len(ranges) + 1) and index + 1 < len(frames):
+            ranges.append((first, index + 1))
+            first = index + 1
+            if len(ranges) == shards - 1:
+                break
+    ranges.append((first, None))
+    return ranges
+
+
+def plan_entry(path: str, name: str, quality: str, media_dir: str) -> dict:
+    """Frames of each animation of a scene, from a run where manim skips
+    them all. Runs in a worker process."""
+    result = {"file": path, "scene": name}
+    try:
+        with scene_config(path, quality, media_dir) as config:
+            scene = load_scene(path, name)
+            renderer = scene.renderer
+            renderer._original_skipping_status = True
+            play = renderer.play
+            frames = []
+
+            def planned_play(scene, *args, **kwargs):
+                play(scene, *args, **kwargs)
+                frames.append(round(scene.duration * config.frame_rate))
+
+            renderer.play = planned_play
+            # Nothing was written, there is nothing to combine.
+            renderer.scene_finished = lambda scene: None
+            scene.render()
+        result.update(status="planned", frames=frames)
+    except Exception:
+        result.update(status="failed", error=traceback.format_exc())
+    return result
+
+
+def fast_forward(renderer, scene, *args, **kwargs):
+    """Play an animation as a render does, without drawing nor encoding it."""
+    renderer.skip_animations = False
+    scene.compile_animation_data(*args, **kwargs)
+    # Keep the partial movie files aligned with the animations.
+    renderer.file_writer.add_partial_movie_file(None)
+    renderer.animations_hashes.append(None)
+    scene.begin_animations()
+    dt = 1 / renderer.camera.frame_rate
+    if scene.is_current_animation_frozen_frame():
+        renderer.time += int(scene.duration / dt) * dt
+    else:
+        render = renderer.render
+        renderer.render = lambda scene, time, moving_mobjects=None: setattr(
+            renderer, "time", renderer.time + dt
+        )
+        try:
+            scene.play_internal()
+        finally:
+            renderer.render = render
+    renderer.num_plays += 1
+
+
+def use_shard(scene, first: int, last: int | None):
+    """Render only the animations `first` to `last` (excluded, None for the
+    end) of a freshly created scene, into its partial movie files.
+
+    To be called after the other changes to the renderer and its writer.
+    """
+    from manim.utils.exceptions import EndSceneEarlyException
+
+    renderer = scene.renderer
+    play = renderer.play
+
+    def sharded_play(scene, *args, **kwargs):
+        if last is not None and renderer.num_plays >= last:
+            raise EndSceneEarlyException()
+        if renderer.num_plays < first:
+            return fast_forward(renderer, scene, *args, **kwargs)
+        return play(scene, *args, **kwargs)
+
+    renderer.play = sharded_play
+    # The movie is combined once all the shards are rendered.
+    renderer.scene_finished = lambda scene: None
+    return scene
+
+
+def render_shard(
+    path: str,
+    name: str,
+    quality: str,
+    media_dir: str,
+    first: int,
+    last: int | None,
+    dedupe_holds: bool = False,
+    layer_cache: bool = False,
+) -> dict:
+    """Render the animations `first` to `last` of a scene. Runs in a worker
+    process; returns the partial movie files, by animation index."""
+    result = {"file": path, "scene": name, "first": first, "last": last}
+    try:
+        with scene_config(path, quality, media_dir):
+            scene = load_scene(path, name)
+            if layer_cache:
+                use_layer_cache(scene)
+            if dedupe_holds:
+                use_hold_writer(scene)
+            use_shard(scene, first, last)
+            scene.render()
+            renderer = scene.renderer
+            files = renderer.file_writer.partial_movie_files
+            result.update(
+                status="rendered",
+                partial_movie_files={
+                    index: file for index, file in enumerate(files)
+                    if file is not None and index >= first
+                },
+                plays=renderer.num_plays,
+            )
+    except Exception:
+        result.update(status="failed", error=traceback.format_exc())
+    return result
+
+
+def combine_shards(
+    path: str, name: str, quality: str, media_dir: str, files: list[str]
+) -> dict:
+    """Combine the partial movie files of a scene into its movie, as the end
+    of a serial render does. Runs in a worker process."""
+    from chillmaths.batch import movie_frames
+
+    result = {"file": path, "scene": name}
+    try:
+        with scene_config(path, quality, media_dir):
+            writer = load_scene(path, name).renderer.file_writer
+            writer.partial_movie_files = files
+            writer.finish()
+        result.update(
+            status="combined",
+            output=str(writer.movie_file_path),
+            frames=movie_frames(writer.movie_file_path),
+        )
+    except Exception:
+        result.update(status="failed", error=traceback.format_exc())
+    return result
+
+
+def render_sharded(
+    pool,
+    path: str,
+    name: str,
+    quality: str,
+    media_dir: str,
+    shards: int,
+    dedupe_holds: bool = False,
+    layer_cache: bool = False,
+) -> dict:
+    """Render one scene in `shards` ranges on a process pool, then combine
+    them. Same report as `chillmaths.batch.render_entry`."""
+    result = {"file": path, "scene": name, "quality": quality}
+    start = time.perf_counter()
+    try:
+        planned = pool.submit(plan_entry, path, name, quality, media_dir).result()
+        if planned["status"] == "failed":
+            result.update(status="failed", error=planned["error"])
+            return result
+        ranges = plan(planned["frames"], shards)
+        futures = [
+            pool.submit(
+                render_shard, path, name, quality, media_dir, first, last,
+                dedupe_holds, layer_cache,
+            )
+            for first, last in ranges
+        ]
+        rendered = [future.result() for future in futures]
+        failed = [shard for shard in rendered if shard["status"] == "failed"]
+        if failed:
+            result.update(status="failed", error=failed[0]["error"])
+            return result
+
+        # The last shard ran to the end of the scene.
+        plays = rendered[-1]["plays"]
+        files = {}
+        for shard in rendered:
+            files.update(shard["partial_movie_files"])
+        missing = set(range(plays)) - {int(index) for index in files}
+        if missing or any(
+            shard["plays"] != (shard["last"] if shard["last"] is not None else plays)
+            for shard in rendered
+        ):
+            result.update(
+                status="failed",
+                error=f"The animations of {name} differ from one run to the "
+                      "next, it cannot be sharded",
+            )
+            return result
+
+        combined = pool.submit(
+            combine_shards, path, name, quality, media_dir,
+            [files[index] for index in sorted(files)],
+        ).result()
+        if combined["status"] == "failed":
+            result.update(status="failed", error=combined["error"])
+            return result
+        result.update(
+            status="rendered",
+            frames=combined["frames"],
+            output=combined["output"],
+            shards=len(ranges),
+        )
+    finally:
+        result["wall_time"] = time.perf_counter() - start
+    return result
@@ -0,0 +1,101 @@
+"""
+Stipple fills: regions textured with a regular pattern of small dots.
+
+The candidate dots of the pattern are tested against the outline of the
+region in one vectorised even-odd ray casting, and the dots kept are drawn as
+the subpaths of a single VMobject.
+
+    stipple = Stipple(polygon.get_vertices(), spacing=0.08, radius=0.007)
+    stipple = Stipple(outline(area), spacing=0.08)  # area under a graph
+"""
+import numpy as np
+
+from manim import VMobject
+
+from chillmaths.lattice import dots_points
+from chillmaths.style import BLACK
+
+
+def polygon_edges(vertices):
+    """(starts, ends) of the edges of a closed polygon."""
+    vertices = np.asarray(vertices, dtype=float)[:, :2]
+    return vertices, np.roll(vertices, -1, axis=0)
+
+
+def outline(vmobject, samples=8):
+    """Vertices of a polygon following a VMobject, `samples` per curve.
+
+    Only the first subpath is followed, e.g. the boundary of an area
+    between curves or of a closed graph.
+    """
+    curves = vmobject.get_subpaths()[0].reshape(-1, 4, 3)
+    t = np.linspace(0, 1, samples, endpoint=False)[:, None]
+    bernstein = np.hstack([
+        (1 - t)**3, 3 * (1 - t)**2 * t, 3 * (1 - t) * t**2, t**3
+    ])
+    return np.einsum("sk,ckd->csd", bernstein, curves).reshape(-1, 3)
+
+
+def inside(points, starts, ends):
+    """Mask of the points inside the closed outline made of the edges
+    `starts[i] -> ends[i]`, by the even-odd rule."""
+    x, y = np.asarray(points, dtype=float)[:, :2].T[:, :, None]
+    (xi, yi), (xj, yj) = starts.T[:, None], ends.T[:, None]
+    crosses = (yi > y) != (yj > y)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        x_intersection = (xj - xi) * (y - yi) / (yj - yi) + xi
+    return np.count_nonzero(crosses & (x < x_intersection), axis=1) % 2 == 1
+
+
+def stipple_centers(vertices, spacing, stagger=0.0, anchor=None):
+    """Centres of the dots of a pattern inside a polygon.
+
+    The pattern is a square lattice of step `spacing` through `anchor`
+    (default: the lower left corner of the polygon), every other row
+    shifted right by `stagger`.
+    """
+    vertices = np.asarray(vertices, dtype=float)
+    low, high = vertices[:, :2].min(axis=0), vertices[:, :2].max(axis=0)
+    anchor = low if anchor is None else np.asarray(anchor, dtype=float)[:2]
+    first = np.floor((low - anchor) / spacing).astype(int) - 1
+    last = np.ceil((high - anchor) / spacing).astype(int) + 1
+    rows, columns = np.meshgrid(
+        np.arange(first[1], last[1] + 1), np.arange(first[0], last[0] + 1),
+        indexing="ij",
+    )
+    x = anchor[0] + columns * spacing + stagger * (rows % 2)
+    y = anchor[1] + rows * spacing
+    candidates = np.stack([x.ravel(), y.ravel(), np.zeros(x.size)], axis=1)
+    return candidates[inside(candidates, *polygon_edges(vertices))]
+
+
+class Stipple(VMobject):
+    """A polygon filled with dots, as a single VMobject.
+
+    Parameters
+    ----------
+    vertices
+        Vertices of the polygon, e.g. `Polygon.get_vertices()` or `outline`
+        of a region bounded by curves.
+    spacing, stagger, anchor
+        The pattern, see `stipple_centers`.
+    radius
+        Radius of the dots.
+    """
+    def __init__(
+        self,
+        vertices,
+        spacing=0.1,
+        radius=0.01,
+        stagger=0.0,
+        anchor=None,
+        color=BLACK,
+        fill_opacity=1,
+        **kwargs
+    ):
+        super().__init__(
+            fill_color=color, fill_opacity=fill_opacity, stroke_width=0,
+            **kwargs
+        )
+        self.centers = stipple_centers(vertices, spacing, stagger, anchor)
+        self.set_points(dots_points(self.centers, radius))
@@ -0,0 +1,15 @@
+"""
+Colours and fonts of the chill.maths videos.
+"""
+# COLORS
+BLUE = "#B0E1FA"
+VIOLET = "#E8C9FA"
+RED = "#F79BC5"
+GREEN = "#DBF9E7"
+YELLOW = "#EFE9B7"
+ORANGE = "#F6CCB0"
+BLACK = "#000000"
+WHITE = "#F4EDDE"
+
+# FONTS
+FONT = "CMU Typewriter Text"
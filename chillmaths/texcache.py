@@ -0,0 +1,338 @@
+"""
+Batch precompilation of the LaTeX of the catalogue.
+
+Usage:
+    python -m chillmaths.texcache [-j 8] [FILTER ...]
+
+Every `Tex`/`MathTex` whose strings are literals is collected statically from
+the scene files. The expressions missing from manim's SVG cache
+(``media/Tex``) are compiled in a few multi-page LaTeX documents, one per
+worker, and each page is stored under the name manim looks for. The scenes
+then find all their LaTeX already compiled.
+"""
+import argparse
+import ast
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+from chillmaths import ROOT
+from chillmaths.catalogue import discover, parse
+
+# Calls compiled as a `Tex` or a `MathTex`: name -> (environment, separator).
+TEX_CALLS = {
+    "Tex": ("center", ""),
+    "MathTex": ("align*", " "),
+    # chillmaths.lazytex
+    "LazyTex": ("center", ""),
+    "LazyMathTex": ("align*", " "),
+    # chillmaths.assets
+    "tex": ("center", ""),
+}
+
+# Literal keyword arguments changing what is compiled.
+TEX_KEYWORDS = (
+    "arg_separator", "tex_environment",
+    "substrings_to_isolate", "tex_to_color_map",
+)
+
+
+@dataclass(frozen=True)
+class TexCall:
+    """A statically resolved `Tex`/`MathTex` call."""
+    strings: tuple
+    environment: str | None
+    separator: str
+    isolate: tuple = ()
+
+
+def literal(node):
+    try:
+        return ast.literal_eval(node)
+    except ValueError:
+        raise LookupError from None
+
+
+def resolve_call(node: ast.Call) -> list[TexCall]:
+    """The Tex calls made by a call node, LookupError if not literal."""
+    func = node.func
+    if isinstance(func, ast.Attribute):
+        name = func.attr
+    else:
+        name = getattr(func, "id", None)
+
+    if name == "demonstration":
+        # chillmaths.assets.demonstration(author, title=...)
+        strings = [literal(arg) for arg in node.args]
+        strings += [literal(k.value) for k in node.keywords if k.arg == "title"]
+        if not any(k.arg == "title" for k in node.keywords):
+            strings.append(r"Démonstration")
+        return [TexCall((s,), "center", "") for s in strings]
+
+    if name not in TEX_CALLS:
+        return []
+    if any(isinstance(arg, ast.Starred) for arg in node.args):
+        raise LookupError
+    environment, separator = TEX_CALLS[name]
+    options = {}
+    for keyword in node.keywords:
+        if keyword.arg in TEX_KEYWORDS:
+            options[keyword.arg] = literal(keyword.value)
+        elif keyword.arg is None:
+            raise LookupError
+    strings = tuple(literal(arg) for arg in node.args)
+    if not all(isinstance(s, str) for s in strings):
+        raise LookupError
+    isolate = tuple(options.get("substrings_to_isolate", ())) + tuple(
+        options.get("tex_to_color_map", {})
+    )
+    return [TexCall(
+        strings,
+        options.get("tex_environment", environment),
+        options.get("arg_separator", separator),
+        isolate,
+    )]
+
+
+def collect(paths) -> tuple[set, int]:
+    """Collect the Tex calls of the files, and count the unresolved ones."""
+    calls, unresolved = set(), 0
+    for path in paths:
+        for node in ast.walk(parse(path)):
+            if not isinstance(node, ast.Call):
+                continue
+            try:
+                calls.update(resolve_call(node))
+            except LookupError:
+                unresolved += 1
+    return calls, unresolved
+
+
+def expressions(call: TexCall) -> set:
+    """The (expression, environment) pairs manim compiles for a call.
+
+    `MathTex` compiles the joined strings, then each of its parts on its own.
+    """
+    from manim import MathTex, SingleStringMathTex
+
+    mathtex = object.__new__(MathTex)
+    mathtex.substrings_to_isolate = list(call.isolate)
+    mathtex.tex_to_color_map = {}
+    mathtex.brace_notation_split_occurred = False
+    parts = mathtex._break_up_tex_strings(call.strings)
+
+    single = object.__new__(SingleStringMathTex)
+    return {
+        (single._get_modified_expression(s), call.environment)
+        for s in [call.separator.join(parts), *parts]
+    }
+
+
+def in_environment(expression, environment):
+    from manim.utils.tex import _texcode_for_environment
+
+    if environment is None:
+        return expression
+    begin, end = _texcode_for_environment(environment)
+    return "\n".join([begin, expression, end])
+
+
+def texcode(expression, environment, template):
+    if environment is None:
+        return template.get_texcode_for_expression(expression)
+    return template.get_texcode_for_expression_in_env(expression, environment)
+
+
+def svg_path(expression, environment, template) -> Path:
+    """Path of the SVG manim looks for before compiling an expression."""
+    from manim import config
+    from manim.utils.tex_file_writing import tex_hash
+
+    code = texcode(expression, environment, template)
+    return config.get_dir("tex_dir") / f"{tex_hash(code)}.svg"
+
+
+def can_batch(template) -> bool:
+    """Whether the template can be turned into a multi-page document."""
+    return (
+        not template._body
+        and template.output_format == ".dvi"
+        and "standalone" in template.documentclass
+    )
+
+
+def compile_one(expression, environment, template) -> None:
+    from manim.utils.tex_file_writing import tex_to_svg_file
+
+    tex_to_svg_file(expression, environment, template)
+
+
+def compile_chunk(chunk, template) -> None:
+    """Compile a list of (expression, environment) as one document.
+
+    The standalone class is swapped for an article with one expression per
+    page; dvisvgm crops each page to its content, as it does for standalone.
+    """
+    if not can_batch(template) or len(chunk) == 1:
+        for expression, environment in chunk:
+            compile_one(expression, environment, template)
+        return
+
+    document = template.copy()
+    document.documentclass = r"\documentclass{article}"
+    document.post_doc_commands = "\n".join(
+        filter(None, [template.post_doc_commands, r"\pagestyle{empty}"])
+    )
+    pages = "\n\\clearpage\n".join(
+        in_environment(expression, environment)
+        for expression, environment in chunk
+    )
+    source = document.get_texcode_for_expression(pages)
+
+    with tempfile.TemporaryDirectory(prefix="chillmaths-tex-") as tmp:
+        tmp = Path(tmp)
+        (tmp / "batch.tex").write_text(source, encoding="utf-8")
+        latex = subprocess.run(
+            [
+                template.tex_compiler, "-interaction=batchmode",
+                "-halt-on-error", "batch.tex",
+            ],
+            cwd=tmp, stdout=subprocess.DEVNULL,
+        )
+        if latex.returncode == 0:
+            subprocess.run(
+                [
+                    "dvisvgm", "--page=1-", "--no-fonts", "--verbosity=0",
+                    "--output=page-%p.svg", "batch.dvi",
+                ],
+                cwd=tmp, stdout=subprocess.DEVNULL,
+            )
+        svgs = sorted(
+            tmp.glob("page-*.svg"), key=lambda p: int(p.stem.split("-")[1])
+        )
+        if latex.returncode != 0 or len(svgs) != len(chunk):
+            # A failing or empty expression shifts the pages: compile the
+            # chunk one expression at a time, manim reports the errors.
+            for expression, environment in chunk:
+                compile_one(expression, environment, template)
+            return
+        for (expression, environment), svg in zip(chunk, svgs):
+            target = svg_path(expression, environment, template)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.move(svg, target)
+
+
+def compile_all(items, template, jobs=None, chunk_size=64, errors="raise"):
+    """Compile (expression, environment) pairs in chunks, on a thread pool.
+
+    With `errors="ignore"`, a chunk failing to compile is left for the
+    `Tex` using it to compile, and report, on its own.
+    """
+    if not items:
+        return
+    jobs = max(1, min(jobs or os.cpu_count(), -(-len(items) // 2)))
+    size = min(chunk_size, -(-len(items) // jobs))
+    chunks = [items[i:i + size] for i in range(0, len(items), size)]
+
+    def run(chunk):
+        try:
+            compile_chunk(chunk, template)
+        except Exception:
+            if errors == "raise":
+                raise
+
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        list(pool.map(run, chunks))
+
+
+def missing_expressions(calls, template) -> list:
+    """The expressions of the calls not yet in manim's SVG cache."""
+    unique = set()
+    for call in calls:
+        unique.update(expressions(call))
+    return [
+        item for item in sorted(unique, key=lambda item: (item[1] or "", item[0]))
+        if item[0].strip() and not svg_path(*item, template).exists()
+    ]
+
+
+def precompile(paths, jobs=None, chunk_size=64) -> dict:
+    """Compile the missing LaTeX of the files, return the statistics."""
+    from manim import config
+
+    template = config["tex_template"]
+    calls, unresolved = collect(paths)
+    unique = set()
+    for call in calls:
+        unique.update(expressions(call))
+    missing = missing_expressions(calls, template)
+    hits = len(unique) - len(missing)
+
+    # Cost of one expression compiled the usual way, to estimate the savings.
+    single_cost = 0.0
+    if missing:
+        start = time.perf_counter()
+        compile_one(*missing.pop(0), template)
+        single_cost = time.perf_counter() - start
+
+    start = time.perf_counter()
+    compile_all(missing, template, jobs, chunk_size)
+    batch_time = time.perf_counter() - start
+
+    compiled = len(unique) - hits
+    return {
+        "calls": len(calls),
+        "unresolved_calls": unresolved,
+        "expressions": len(unique),
+        "hits": hits,
+        "compiled": compiled,
+        "hit_rate": hits / len(unique) if unique else 1.0,
+        "single_compile_time": single_cost,
+        "batch_time": batch_time,
+        # Against compiling the missing expressions on their own, in the
+        # scenes; the hits cost nothing either way.
+        "estimated_time_saved": compiled * single_cost
+        - batch_time - single_cost,
+    }
+
+
+def main(argv=None) -> int:
+    from manim import config, tempconfig
+
+    parser = argparse.ArgumentParser(
+        prog="python -m chillmaths.texcache",
+        description="Compile the LaTeX of the catalogue ahead of the renders.",
+    )
+    parser.add_argument("filters", nargs="*")
+    parser.add_argument("-j", "--jobs", type=int, default=None)
+    parser.add_argument("--media-dir", type=Path, default=ROOT / "media")
+    args = parser.parse_args(argv)
+
+    paths = sorted({
+        entry.path for entry in discover()
+        if not args.filters or any(f in entry.key for f in args.filters)
+    })
+    with tempconfig({"media_dir": str(args.media_dir)}):
+        config.get_dir("tex_dir").mkdir(parents=True, exist_ok=True)
+        stats = precompile(paths, jobs=args.jobs)
+
+    print(
+        f"{stats['expressions']} expressions from {stats['calls']} calls "
+        f"({stats['unresolved_calls']} calls not literal)\n"
+        f"hit rate: {stats['hit_rate']:.0%}, compiled: {stats['compiled']} "
+        f"in {stats['batch_time']:.1f}s\n"
+        f"estimated time saved: {stats['estimated_time_saved']:.1f}s",
+        file=sys.stderr,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,146 @@
+"""
+Solids made of unit cubes, drawn from their exposed faces only.
+
+A `VoxelSolid` takes the integer coordinates of its cubes and keeps the faces
+which do not touch another cube of the solid. The coplanar exposed faces are
+then merged into rectangles; the edges of the cubes inside a rectangle are
+still drawn, by a stroke-only VMobject sorted together with its face by the
+3D camera.
+"""
+import numpy as np
+
+from manim import VGroup, VMobject
+from manim import IN, OUT, LEFT, RIGHT, UP, DOWN
+
+from chillmaths.style import BLACK
+
+# Normals of the faces, in the order of the faces of manim's `Cube`.
+NORMALS = (IN, OUT, LEFT, RIGHT, UP, DOWN)
+
+
+def segments(starts, ends):
+    """Straight cubic curves from `starts` to `ends`, as one points array."""
+    thirds = np.linspace(0, 1, 4)[None, :, None]
+    starts, ends = np.asarray(starts, float), np.asarray(ends, float)
+    return (starts[:, None] + thirds * (ends - starts)[:, None]).reshape(-1, 3)
+
+
+def exposed(coords, normal):
+    """Mask of the cubes whose face of the given normal is exposed."""
+    low = coords.min(axis=0) - 1
+    shape = coords.max(axis=0) - low + 2
+    keys = np.ravel_multi_index((coords - low).T, shape)
+    neighbours = np.ravel_multi_index((coords + normal - low).T, shape)
+    return ~np.isin(neighbours, keys)
+
+
+def rectangles(mask):
+    """Cover the cells of a 2D boolean mask with rectangles, greedily.
+
+    Returns (row, column, height, width) tuples, each rectangle as wide as
+    possible, then as high as possible.
+    """
+    mask = mask.copy()
+    found = []
+    for i, j in zip(*np.nonzero(mask)):
+        if not mask[i, j]:
+            continue
+        w = 1
+        while j + w < mask.shape[1] and mask[i, j + w]:
+            w += 1
+        h = 1
+        while i + h < mask.shape[0] and mask[i + h, j:j + w].all():
+            h += 1
+        mask[i:i + h, j:j + w] = False
+        found.append((i, j, h, w))
+    return found
+
+
+class VoxelSolid(VGroup):
+    """The union of the unit cubes at the given integer coordinates.
+
+    The cube (x, y, z) is centred at `side * (x, y, z)`, like a `Cube` of
+    side `side` moved there.
+
+    Parameters
+    ----------
+    coords
+        Iterable of integer (x, y, z) coordinates.
+    face_colors
+        One colour, or six colours in the order of the faces of `Cube`
+        (IN, OUT, LEFT, RIGHT, UP, DOWN).
+    merge
+        Merge the coplanar exposed faces into rectangles. Otherwise each
+        exposed face of a cube is drawn on its own.
+    """
+    def __init__(
+        self,
+        coords,
+        side=1.0,
+        face_colors=BLACK,
+        fill_opacity=1,
+        stroke_color=BLACK,
+        stroke_width=0.55,
+        merge=True,
+        **kwargs
+    ):
+        super().__init__(**kwargs)
+        coords = np.unique(np.asarray(list(coords), dtype=int).reshape(-1, 3), axis=0)
+        if not isinstance(face_colors, (list, tuple)):
+            face_colors = [face_colors] * 6
+        self.side = side
+        self.face_style = dict(
+            fill_opacity=fill_opacity,
+            stroke_color=stroke_color,
+            stroke_width=stroke_width,
+            shade_in_3d=True,
+        )
+        for normal, color in zip(NORMALS, face_colors):
+            normal = np.array(normal, dtype=int)
+            faces = coords[exposed(coords, normal)]
+            axis = int(np.flatnonzero(normal)[0])
+            # (u, v, normal) is indirect, so the faces are clockwise seen
+            # from outside: as the faces of a Cube, whose unit normal (the
+            # one the 3D camera shades with) points inwards.
+            u, v = (axis + 1) % 3, (axis + 2) % 3
+            if normal[axis] > 0:
+                u, v = v, u
+            for plane in np.unique(faces[:, axis]):
+                cells = faces[faces[:, axis] == plane]
+                low = cells.min(axis=0)
+                mask = np.zeros(cells.max(axis=0) - low + 1, dtype=bool)
+                mask[tuple((cells - low).T)] = True
+                mask = mask.transpose(u, v, axis)[:, :, 0]
+                blocks = rectangles(mask) if merge else [
+                    (i, j, 1, 1) for i, j in zip(*np.nonzero(mask))
+                ]
+                for i, j, h, w in blocks:
+                    origin = low + 0.5 * normal
+                    origin[u] += i - 0.5
+                    origin[v] += j - 0.5
+                    self.add(self._face(origin, u, v, h, w, color))
+
+    def _face(self, origin, u, v, h, w, color):
+        e_u, e_v = np.eye(3)[u], np.eye(3)[v]
+        corners = self.side * (origin + np.array([
+            [0, 0], [h, 0], [h, w], [0, w],
+        ]) @ np.array([e_u, e_v]))
+        face = VMobject(fill_color=color, **self.face_style)
+        face.set_points(segments(corners, np.roll(corners, -1, axis=0)))
+        if h > 1 or w > 1:
+            # Edges of the cubes inside the rectangle.
+            starts = [corners[0] + k / h * (corners[1] - corners[0]) for k in range(1, h)]
+            starts += [corners[0] + k / w * (corners[3] - corners[0]) for k in range(1, w)]
+            ends = [s + corners[3] - corners[0] for s in starts[:h - 1]]
+            ends += [s + corners[1] - corners[0] for s in starts[h - 1:]]
+            edges = VMobject(
+                stroke_color=self.face_style["stroke_color"],
+                stroke_width=self.face_style["stroke_width"],
+                fill_opacity=0,
+                shade_in_3d=True,
+            )
+            edges.set_points(segments(starts, ends))
+            # Drawn right after the face by the 3D camera.
+            edges.z_index_group = face
+            face.add(edges)
+        return face
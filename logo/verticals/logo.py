@@ -8,9 +8,11 @@ from manim import Create
 from manim import Text, FadeIn
 from manim import FunctionGraph
 
-from manim import config, ORIGIN
+from manim import ORIGIN
 from manim import DOWN, LIGHT
 
+from chillmaths.formats import render_profile
+
 # COLORS
 BLUE = "#B0E1FA"
 VIOLET = "#E8C9FA"
@@ -21,17 +23,8 @@ ORANGE = "#F6CCB0"
 BLACK = "#000000"
 WHITE = "#F4EDDE"
 
-# Make it vertical
-SCALE_FACTOR = 1
-# Flip width => height, height => width
-tmp_pixel_height = config.pixel_height
-config.pixel_height = config.pixel_width
-config.pixel_width = tmp_pixel_height
-# Change coord system dimensions
-config.frame_height = config.frame_height / SCALE_FACTOR
-config.frame_width = config.frame_height * 9 / 16
-
 
+@render_profile("vertical")
 class Logo(Scene):
     def construct(self):
         self.camera.background_color = WHITE
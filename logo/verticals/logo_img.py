@@ -8,9 +8,11 @@ from manim import Create
 from manim import Text, FadeIn
 from manim import FunctionGraph
 
-from manim import config, ORIGIN
+from manim import ORIGIN
 from manim import DOWN, LIGHT
 
+from chillmaths.formats import render_profile
+
 # COLORS
 BLUE = "#B0E1FA"
 VIOLET = "#E8C9FA"
@@ -21,15 +23,8 @@ ORANGE = "#F6CCB0"
 BLACK = "#000000"
 WHITE = "#F4EDDE"
 
-# Make it square
-SCALE_FACTOR = 1
-config.pixel_height = 1080
-config.pixel_width = 1080
-# Change coord system dimensions
-config.frame_height = 7
-config.frame_width = 7
-
 
+@render_profile("square")
 class Logo(Scene):
     def construct(self):
         self.camera.background_color = WHITE